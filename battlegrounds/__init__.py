@@ -3,6 +3,13 @@ from .game_state import GameState
 from .minion import BGMinion
 from .player import BGPlayer
 from .combat import CombatSimulator
-from .state_manager import StateManager
+from .economy import TavernEconomy, CardPool
+from .discover import DiscoverService
+from .pairing import Pairing, PairingScheduler
+from .dispatch import CombatDispatcher
+from .ring_buffer import RingBuffer
+from .snapshot import save_state, load_state
+from .actions import apply_action
+from .journal import MatchJournal
 
-__all__ = ['GameState', 'BGMinion', 'BGPlayer', 'CombatSimulator', 'StateManager']
+__all__ = ['GameState', 'BGMinion', 'BGPlayer', 'CombatSimulator', 'TavernEconomy', 'CardPool', 'DiscoverService', 'Pairing', 'PairingScheduler', 'CombatDispatcher', 'RingBuffer', 'save_state', 'load_state', 'apply_action', 'MatchJournal']
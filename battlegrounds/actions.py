@@ -0,0 +1,154 @@
+"""
+Match Actions - Everything that changes a match, as plain action dicts
+{"action": NAME, "player_id": ..., "payload": {...}} in, accepted or not out;
+a rejected action leaves the state untouched, so only accepted ones need logging
+"""
+
+from typing import Any, Callable, Dict
+
+from .combat import MAX_BOARD
+from .dispatch import CombatDispatcher
+from .game_state import GamePhase, GameState
+from .hero_powers import use_hero_power
+from .player import BGPlayer
+
+
+MAX_HAND = 10
+
+Payload = Dict[str, Any]
+
+
+def buy_minion(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    slot = payload.get("shop_slot")
+    shop_minion = next((sm for sm in player.shop if sm and sm.slot == slot), None)
+    if shop_minion is None or len(player.hand) >= MAX_HAND:
+        return False
+    expected = payload.get("expected_card_id")
+    if expected is not None and shop_minion.card_id != expected:
+        return False  # Optimistic locking: the shop changed since the client saw it
+    if player.buy_minion(slot) is None:
+        return False
+    state.economy.discover.fill_pending(player)
+    return True
+
+
+def sell_minion(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    minion = player.get_board_minion_by_id(payload.get("instance_id"))
+    if minion is None or not player.sell_minion(minion.instance_id):
+        return False
+    state.economy.pool.put_back(minion.card_id, 3 if minion.is_golden else 1)
+    return True
+
+
+def play_minion(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    if len(player.board) >= MAX_BOARD:
+        return False
+    minion = player.remove_from_hand(payload.get("instance_id"))
+    if minion is None:
+        return False
+    player.add_to_board(minion, payload.get("slot"))
+    state.economy.discover.fill_pending(player)
+    return True
+
+
+def upgrade_tavern(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    return state.economy.upgrade_tavern(player)
+
+
+def freeze_shop(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    player.shop_frozen = not player.shop_frozen
+    return True
+
+
+def hero_power(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    return use_hero_power(player) is not None
+
+
+def discover_choice(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    if len(player.hand) >= MAX_HAND:
+        return False  # choose() would spend the offer and hand back nothing
+    return state.economy.discover.choose(player, payload.get("request_id"), payload.get("card_id")) is not None
+
+
+def ready(state: GameState, player: BGPlayer, payload: Payload) -> bool:
+    player.ready = True
+    return True
+
+
+def start_match(state: GameState, payload: Payload) -> bool:
+    if state.phase != GamePhase.LOBBY:
+        return False
+    state.start_recruit()
+    return True
+
+
+def expire_discovers(state: GameState, payload: Payload) -> bool:
+    """Time out the offers in payload["request_ids"], as the match loop found them due
+
+    The ids are logged rather than a clock reading, so a replay resolves the
+    same offers: {"request_ids": state.economy.discover.due()}.
+    """
+    if state.economy is None:
+        return False
+    request_ids = [r for r in payload.get("request_ids") or () if r in state.economy.discover.pending]
+    if not request_ids:
+        return False
+    state.economy.discover.expire(state.players, request_ids=request_ids)
+    return True
+
+
+def begin_combat(state: GameState) -> bool:
+    """First half of RESOLVE_COMBAT: enter combat and pair the round"""
+    if state.phase != GamePhase.RECRUIT:
+        return False
+    state.phase = GamePhase.COMBAT
+    state.pair_round()
+    return True
+
+
+def end_combat(state: GameState):
+    """Second half of RESOLVE_COMBAT, once the round's fights have been routed"""
+    state.finish_round()
+
+
+def resolve_combat(state: GameState, payload: Payload) -> bool:
+    """Fight the round in process; each fight is seeded from its pairing, so this
+    gives the same results as the shared pool does (see MatchJournal.resolve_combats)"""
+    if not begin_combat(state):
+        return False
+    CombatDispatcher(workers=1).resolve([state])
+    end_combat(state)
+    return True
+
+
+PLAYER_ACTIONS: Dict[str, Callable[[GameState, BGPlayer, Payload], bool]] = {
+    "BUY_MINION": buy_minion,
+    "SELL_MINION": sell_minion,
+    "PLAY_MINION": play_minion,
+    "UPGRADE_TAVERN": upgrade_tavern,
+    "FREEZE": freeze_shop,
+    "HERO_POWER": hero_power,
+    "DISCOVER_CHOICE": discover_choice,
+    "READY": ready,
+}
+
+# Sent by the match loop rather than a client
+MATCH_ACTIONS: Dict[str, Callable[[GameState, Payload], bool]] = {
+    "START_MATCH": start_match,
+    "EXPIRE_DISCOVERS": expire_discovers,
+    "RESOLVE_COMBAT": resolve_combat,
+}
+
+
+def apply_action(state: GameState, action: Dict[str, Any]) -> bool:
+    """Run one action against the match, returning whether it was accepted"""
+    name = action.get("action")
+    payload = action.get("payload") or {}
+    if name in MATCH_ACTIONS:
+        return MATCH_ACTIONS[name](state, payload)
+
+    handler = PLAYER_ACTIONS.get(name)
+    player = state.players.get(action.get("player_id"))
+    if handler is None or player is None or player.placement is not None or state.phase != GamePhase.RECRUIT:
+        return False
+    return handler(state, player, payload)
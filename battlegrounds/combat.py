@@ -1,8 +1,10 @@
+import hashlib
+import json
 import random
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from .minion import BGMinion
-from .player import BGPlayer
+from .player import BGPlayer, DeathRecord
 
 
 @dataclass
@@ -20,12 +22,26 @@ class CombatEvent:
         }
 
 
+MAX_BOARD = 7
+MAX_ATTACKS = 500  # Safety stop for boards that can't kill each other
+
+# Deathrattles that summon tokens: card_id -> (token card_id, name, attack, health, count)
+# A count of 0 means one token per point of the dying minion's attack (Rat Pack)
+DEATHRATTLE_SUMMONS = {
+    "KAR_005": ("KAR_005t", "Rat", 1, 1, 0),
+    "KAR_004": ("KAR_004a", "Big Bad Wolf", 3, 2, 1),
+    "EX1_556": ("skele21", "Damaged Golem", 2, 1, 1),
+    "BGS_033": ("OG_216a", "Spider", 1, 1, 2),
+    "BOT_312": ("BOT_312t", "Microbot", 1, 1, 3),
+}
+
+
 class CombatSimulator:
     """Simulates Battlegrounds combat between two boards"""
     
     def __init__(self, seed: Optional[int] = None):
         self.seed = seed or random.randint(0, 999999)
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)
         self.events: List[CombatEvent] = []
         self.step = 0
         self.player_board: List[BGMinion] = []
@@ -33,11 +49,18 @@ class CombatSimulator:
         self.attacker_side = "player"
         self.player_attack_index = 0
         self.opponent_attack_index = 0
+        self.deaths: Dict[str, List[DeathRecord]] = {"player": [], "opponent": []}
+        self._start_stats: Dict[str, Tuple[int, int]] = {}
     
-    def setup(self, player_minions: List[BGMinion], opponent_minions: List[BGMinion], first_attacker: str = ""):
-        """Setup combat boards"""
-        self.player_board = [m.copy() for m in player_minions]
-        self.opponent_board = [m.copy() for m in opponent_minions]
+    def setup(self, player_minions: List[BGMinion], opponent_minions: List[BGMinion], first_attacker: str = "",
+              copy_boards: bool = True):
+        """Setup combat boards; copy_boards=False fights with the given minions themselves"""
+        if copy_boards:
+            player_minions = [m.copy() for m in player_minions]
+            opponent_minions = [m.copy() for m in opponent_minions]
+        self.player_board = list(player_minions)
+        self.opponent_board = list(opponent_minions)
+        self._start_stats = {m.instance_id: (m.attack, m.health) for m in self.player_board + self.opponent_board}
         
         # Assign slots
         for i, m in enumerate(self.player_board):
@@ -55,7 +78,7 @@ class CombatSimulator:
         elif len(self.opponent_board) > len(self.player_board):
             self.attacker_side = "opponent"
         else:
-            self.attacker_side = random.choice(["player", "opponent"])
+            self.attacker_side = self.rng.choice(["player", "opponent"])
         
         self._add_event("combat_start", {
             "first_attacker": self.attacker_side,
@@ -97,6 +120,154 @@ class CombatSimulator:
         # Taunt check
         taunts = [m for m in alive if m.has_taunt]
         if taunts:
-            return random.choice(taunts)
+            return self.rng.choice(taunts)
+        
+        return self.rng.choice(alive)
+    
+    def _attack(self, attacker: BGMinion, defender: BGMinion):
+        """One attack: both minions hit each other at once, then deaths resolve"""
+        attacking = self.attacker_side
+        defending = "opponent" if attacking == "player" else "player"
+        self._add_event("set_attacker", {"player": attacking, "slot": attacker.slot})
+        self._add_event("set_target", {"player": defending, "slot": defender.slot})
+        self._add_event("attack_start", {
+            "attacker": {"player": attacking, "slot": attacker.slot, "instance_id": attacker.instance_id},
+            "defender": {"player": defending, "slot": defender.slot, "instance_id": defender.instance_id}
+        })
+        
+        entries = []
+        for target, source, side in ((defender, attacker, defending), (attacker, defender, attacking)):
+            result = target.take_damage(source.attack)
+            if result.get("divine_shield_popped"):
+                self._add_event("divine_shield_pop", {"player": side, "slot": target.slot})
+            elif result.get("amount"):
+                if source.has_poisonous:
+                    target.health = min(target.health, 0)
+                entries.append({"player": side, "slot": target.slot,
+                                "amount": result["amount"], "new_health": target.health})
+        if entries:
+            self._add_event("damage_resolve", {"entries": entries})
+        
+        attacker.attacks_this_combat += 1
+        self._resolve_deaths()
+    
+    def _resolve_deaths(self):
+        """Remove the dead left to right, then fire deathrattles and reborns in their places"""
+        for side, board in (("player", self.player_board), ("opponent", self.opponent_board)):
+            if not any(m.is_dead() for m in board):
+                continue
+            dead = [m for m in board if m.is_dead()]
+            for m in dead:
+                self._add_event("minion_died", {"player": side, "slot": m.slot, "instance_id": m.instance_id})
+                # Tokens summoned mid-fight have no starting stats and were never on the recruit board
+                start = self._start_stats.get(m.instance_id)
+                if start is not None:
+                    self.deaths[side].append(DeathRecord(m.instance_id, m.card_id, start[0], start[1], m.is_golden))
+            
+            survivors = [m for m in board if not m.is_dead()]
+            room = MAX_BOARD - len(survivors)
+            result = []
+            for m in board:
+                if not m.is_dead():
+                    result.append(m)
+                    continue
+                spawned = []
+                if m.has_deathrattle:
+                    summons = DEATHRATTLE_SUMMONS.get(m.card_id)
+                    if summons:
+                        token_id, name, attack, health, count = summons
+                        for k in range((count or max(m.attack, 0)) * (2 if m.is_golden else 1)):
+                            # Ids from the step, not uuid4, so replays of a seed match event for event
+                            spawned.append(BGMinion(card_id=token_id, name=name, attack=attack, health=health,
+                                                    instance_id=f"tok-{self.step:03d}-{k}"))
+                    self._add_event("deathrattle_trigger", {
+                        "player": side, "slot": m.slot, "instance_id": m.instance_id,
+                        "log": f"{m.name} deathrattle" + (f" summons {len(spawned)} {summons[1]}" if spawned else "")
+                    })
+                if m.has_reborn and not m.reborn_used:
+                    reborn = m.copy()
+                    reborn.attack, reborn.health = reborn.base_attack, 1
+                    reborn.has_reborn, reborn.reborn_used = False, True
+                    reborn.keywords = [k for k in reborn.keywords if k.lower() != "reborn"]
+                    reborn.attacks_this_combat = 0
+                    spawned.append(reborn)
+                
+                for new in spawned:
+                    if room <= 0:
+                        self._add_event("log", {"player": side, "message": "BoardFull"})
+                        break
+                    room -= 1
+                    new.slot = len(result)
+                    result.append(new)
+                    if new.reborn_used and new.card_id == m.card_id:
+                        self._add_event("reborn_spawn", {
+                            "player": side, "slot": new.slot, "card_id": new.card_id, "name": new.name,
+                            "attack": new.attack, "health": new.health, "keywords": new.keywords,
+                            "reborn_used": True
+                        })
+                    else:
+                        self._add_event("summon", {
+                            "player": side, "card_id": new.card_id, "name": new.name,
+                            "slot": new.slot, "attack": new.attack, "health": new.health
+                        })
+            
+            for i, m in enumerate(result):
+                m.slot = i
+            board[:] = result
+    
+    def _next_attacker(self) -> Optional[BGMinion]:
+        """Leftmost minion of the attacking side that hasn't attacked this lap, starting a new lap if all have"""
+        attacker = self._get_next_attacker()
+        if attacker is None:
+            board = self._get_attacker_board()
+            if any(m.attack > 0 for m in board):
+                for m in board:
+                    m.attacks_this_combat = 0
+                attacker = self._get_next_attacker()
+        return attacker
+    
+    def simulate(self, player_tavern_tier: int = 1, opponent_tavern_tier: int = 1) -> Dict[str, Any]:
+        """Run the fight set up by setup() to the end
+        
+        Sides alternate; a side with nothing able to attack passes. Returns the
+        winner ("player", "opponent" or None for a draw), the damage to the
+        loser's hero (surviving minion tiers + the winner's tavern tier), the
+        survivors and a sha256 digest of the event log.
+        """
+        for _ in range(MAX_ATTACKS):
+            if not self.player_board or not self.opponent_board:
+                break
+            attacker = self._next_attacker()
+            if attacker is None:
+                self.attacker_side = "opponent" if self.attacker_side == "player" else "player"
+                attacker = self._next_attacker()
+                if attacker is None:
+                    break  # Neither side can attack
+            defender = self._get_defender(attacker)
+            self._attack(attacker, defender)
+            self.attacker_side = "opponent" if self.attacker_side == "player" else "player"
         
-        return random.choice(alive)
+        winner = None
+        damage = 0
+        if self.player_board and not self.opponent_board:
+            winner = "player"
+            damage = sum(m.tier for m in self.player_board) + player_tavern_tier
+        elif self.opponent_board and not self.player_board:
+            winner = "opponent"
+            damage = sum(m.tier for m in self.opponent_board) + opponent_tavern_tier
+        self._add_event("combat_end", {"winner": winner, "damage_to_hero": damage})
+        
+        return {
+            "winner": winner,
+            "damage": damage,
+            "survivors": {
+                "player": [m.to_dict() for m in self.player_board],
+                "opponent": [m.to_dict() for m in self.opponent_board]
+            },
+            "digest": self.digest()
+        }
+    
+    def digest(self) -> str:
+        """Fingerprint of the event log so far, for checking replays against the server"""
+        log = json.dumps([e.to_dict() for e in self.events], sort_keys=True, separators=(",", ":"))
+        return "sha256:" + hashlib.sha256(log.encode("utf-8")).hexdigest()
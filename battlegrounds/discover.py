@@ -0,0 +1,239 @@
+"""
+Discover Offers - Distinct minions from a tier, weighted by the copies left in the pool
+Each tier keeps an alias table that is only rebuilt once copies come back or
+the tier has thinned out, so an offer costs O(k) draws however big the pool is
+"""
+
+import time
+from typing import Callable, Collection, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .economy import MAX_TIER, CardPool, MinionDefinition
+from .minion import BGMinion
+from .player import BGPlayer
+from .seeds import new_id
+
+
+OFFER_SIZE = 3
+OFFER_TIMEOUT_MS = 20000
+
+# A tier's table is rebuilt once fewer than this share of the copies it was built from are left
+REBUILD_BELOW = 0.5
+# Rejected draws per option before falling back to a scan of the tier
+MAX_REJECTIONS = 32
+
+
+class AliasTable:
+    """Vose's alias method: O(n) to build, O(1) per draw"""
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        self.size = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, u: float, v: float) -> int:
+        """Index for two uniform numbers in [0, 1)"""
+        i = int(u * self.size)
+        return i if v < self.prob[i] else self.alias[i]
+
+
+class TierTable(NamedTuple):
+    table: AliasTable
+    members: np.ndarray   # Pool indices, in table order
+    weights: np.ndarray   # Copies of each member when the table was built
+    total: int
+    restocks: int         # pool.restocks[tier] at build time
+
+
+class PendingOffer(NamedTuple):
+    player_id: str
+    request_id: str
+    options: List[MinionDefinition]
+    deadline: float
+
+
+class DiscoverService:
+    """Generates discover offers and holds the offered copies until a choice or timeout
+
+    Copies only ever leave the pool between rebuilds, so a stale table still
+    samples correctly: a draw is accepted with probability copies now / copies
+    at build, which is exact as long as nothing was put back in the meantime.
+    """
+
+    def __init__(self, pool: CardPool, rng: Optional[np.random.Generator] = None,
+                 timeout_ms: int = OFFER_TIMEOUT_MS, clock: Callable[[], float] = time.monotonic):
+        self.pool = pool
+        self.rng = rng or np.random.default_rng()
+        self.timeout = timeout_ms / 1000
+        self.clock = clock
+        self.tables: Dict[int, Optional[TierTable]] = {}
+        self.pending: Dict[str, PendingOffer] = {}
+        self.rebuilds = 0
+
+    def _table(self, tier: int) -> Optional[TierTable]:
+        """The tier's alias table, rebuilt only if copies came back or too few are left"""
+        entry = self.tables.get(tier)
+        left = self.pool.tier_counts[tier]
+        if entry is not None and entry.restocks == self.pool.restocks[tier] and left >= entry.total * REBUILD_BELOW:
+            return entry
+        if left == 0:
+            self.tables[tier] = None
+            return None
+
+        members = self.pool.by_tier[tier]
+        members = members[self.pool.counts[members] > 0]
+        weights = self.pool.counts[members].copy()
+        entry = TierTable(AliasTable(weights.tolist()), members, weights, int(weights.sum()),
+                          self.pool.restocks[tier])
+        self.tables[tier] = entry
+        self.rebuilds += 1
+        return entry
+
+    def _draw(self, tier: int, seen: Collection[str]) -> Optional[MinionDefinition]:
+        """One minion of tier not in seen, weighted by copies left, without taking it"""
+        entry = self._table(tier)
+        if entry is None:
+            return None
+
+        counts = self.pool.counts
+        minions = self.pool.minions
+        for u, v, w in self.rng.random((MAX_REJECTIONS, 3)):
+            j = entry.table.sample(u, v)
+            i = entry.members[j]
+            if minions[i].id not in seen and w * entry.weights[j] < counts[i]:
+                return minions[i]
+
+        # Almost everything left is excluded; scan what isn't
+        candidates = [i for i in entry.members if counts[i] > 0 and minions[i].id not in seen]
+        if not candidates:
+            return None
+        cumulative = np.cumsum(counts[candidates])
+        pick = int(np.searchsorted(cumulative, self.rng.random() * cumulative[-1], side="right"))
+        return minions[candidates[pick]]
+
+    def sample(self, tier: int, count: int = OFFER_SIZE,
+               exclude: Collection[str] = ()) -> List[MinionDefinition]:
+        """Take up to count distinct minions out of the pool, topping up from lower tiers if tier runs dry"""
+        chosen: List[MinionDefinition] = []
+        seen = set(exclude)
+        for t in range(min(tier, MAX_TIER), 0, -1):
+            while len(chosen) < count:
+                minion = self._draw(t, seen)
+                if minion is None:
+                    break
+                chosen.append(minion)
+                seen.add(minion.id)
+            if len(chosen) == count:
+                break
+        for minion in chosen:
+            self.pool.take(minion.id)
+        return chosen
+
+    def _reserve(self, player: BGPlayer, request_id: str, tier: int, exclude_owned: bool) -> List[Dict]:
+        exclude = player.copies.keys() if exclude_owned else ()
+        options = self.sample(tier, OFFER_SIZE, exclude)
+        if options:
+            self.pending[request_id] = PendingOffer(player.player_id, request_id, options,
+                                                    self.clock() + self.timeout)
+        return [{"card_id": m.id, "sim_tier": m.tier} for m in options]
+
+    def offer(self, player: BGPlayer, tier: int, source: str,
+              exclude_owned: bool = False) -> Optional[Dict]:
+        """A discover_offer message for player, or None if the pool has nothing to offer
+
+        exclude_owned leaves out minions the player already holds non-golden copies of.
+        """
+        request_id = new_id("uuid")
+        options = self._reserve(player, request_id, tier, exclude_owned)
+        if not options:
+            return None
+        return {
+            "type": "discover_offer",
+            "request_id": request_id,
+            "player_id": player.player_id,
+            "source": source,
+            "options": options
+        }
+
+    def fill_pending(self, player: BGPlayer) -> List[Dict]:
+        """Draw options for offers queued on the player (triples), returning the ones now ready to send"""
+        ready = []
+        for offer in player.pending_discovers:
+            if not offer["options"] and offer["request_id"] not in self.pending:
+                offer["options"] = self._reserve(player, offer["request_id"], offer["tier"], False)
+            if offer["options"]:
+                ready.append(offer)
+        return ready
+
+    def choose(self, player: BGPlayer, request_id: str, card_id: str) -> Optional[BGMinion]:
+        """Resolve a DISCOVER_CHOICE: the pick goes to hand, the other options back to the pool"""
+        pending = self.pending.get(request_id)
+        if pending is None or pending.player_id != player.player_id:
+            return None
+        picked = next((m for m in pending.options if m.id == card_id), None)
+        if picked is None:
+            return None
+
+        del self.pending[request_id]
+        player.pending_discovers = [o for o in player.pending_discovers if o["request_id"] != request_id]
+        for minion in pending.options:
+            if minion is not picked:
+                self.pool.put_back(minion.id)
+
+        minion = BGMinion(
+            card_id=picked.id,
+            name=picked.name,
+            attack=picked.attack,
+            health=picked.health,
+            tier=picked.tier,
+            keywords=list(picked.keywords)
+        )
+        if not player.add_to_hand(minion):
+            self.pool.put_back(picked.id)
+            return None
+        return minion
+
+    def drop(self, player: BGPlayer):
+        """Withdraw every offer made to player, e.g. once eliminated; the options go back to the pool"""
+        for pending in [p for p in self.pending.values() if p.player_id == player.player_id]:
+            del self.pending[pending.request_id]
+            for minion in pending.options:
+                self.pool.put_back(minion.id)
+        player.pending_discovers = []
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Request ids of the offers past their deadline"""
+        now = self.clock() if now is None else now
+        return [p.request_id for p in self.pending.values() if p.deadline <= now]
+
+    def expire(self, players: Mapping[str, BGPlayer], now: Optional[float] = None,
+               request_ids: Optional[List[str]] = None) -> List[BGMinion]:
+        """Pick the first option for every offer past its deadline, or for exactly the request_ids given"""
+        if request_ids is None:
+            request_ids = self.due(now)
+        picked = []
+        for pending in [self.pending[r] for r in request_ids if r in self.pending]:
+            player = players.get(pending.player_id)
+            if player is None:
+                del self.pending[pending.request_id]
+                for minion in pending.options:
+                    self.pool.put_back(minion.id)
+                continue
+            minion = self.choose(player, pending.request_id, pending.options[0].id)
+            if minion is not None:
+                picked.append(minion)
+        return picked
@@ -0,0 +1,229 @@
+"""
+Combat Dispatch - Every fight due this tick, across all matches, on one process pool
+Boards travel as packed bytes rather than pickled BGMinion objects; outcomes
+come back as combat_result messages on each match's action queue
+"""
+
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .combat import CombatSimulator
+from .game_state import GamePhase, GameState
+from .minion import BGMinion
+from .player import DeathRecord
+
+
+# Keyword names in flag bit order; bits 6 and 7 are golden and reborn_used
+FLAG_KEYWORDS = ("Divine Shield", "Reborn", "Taunt", "Windfury", "Poisonous", "Deathrattle")
+_GOLDEN = 1 << 6
+_REBORN_USED = 1 << 7
+
+_MINION = struct.Struct("<hhhhBB")  # attack, health, base_attack, base_health, tier, flags
+
+
+def _pack_str(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return bytes((len(data),)) + data
+
+
+def pack_board(minions: Iterable[BGMinion]) -> bytes:
+    """Board as bytes: per minion the stats, one flag byte and three short strings"""
+    parts = []
+    for m in minions:
+        keywords = {k.lower() for k in m.keywords}
+        flags = 0
+        for bit, name in enumerate(FLAG_KEYWORDS):
+            if name.lower() in keywords:
+                flags |= 1 << bit
+        if m.is_golden:
+            flags |= _GOLDEN
+        if m.reborn_used:
+            flags |= _REBORN_USED
+        parts.append(_MINION.pack(m.attack, m.health, m.base_attack, m.base_health, m.tier, flags))
+        parts.append(_pack_str(m.instance_id))
+        parts.append(_pack_str(m.card_id))
+        parts.append(_pack_str(m.name))
+    return b"".join(parts)
+
+
+def unpack_board(data: bytes) -> List[BGMinion]:
+    minions = []
+    offset = 0
+    while offset < len(data):
+        attack, health, base_attack, base_health, tier, flags = _MINION.unpack_from(data, offset)
+        offset += _MINION.size
+        strings = []
+        for _ in range(3):
+            length = data[offset]
+            strings.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+            offset += 1 + length
+        instance_id, card_id, name = strings
+        minions.append(BGMinion(
+            card_id=card_id,
+            name=name,
+            attack=attack,
+            health=health,
+            base_attack=base_attack,
+            base_health=base_health,
+            tier=tier,
+            instance_id=instance_id,
+            slot=len(minions),
+            keywords=[k for bit, k in enumerate(FLAG_KEYWORDS) if flags & (1 << bit)],
+            is_golden=bool(flags & _GOLDEN),
+            reborn_used=bool(flags & _REBORN_USED)
+        ))
+    return minions
+
+
+def combat_seed(match_id: str, turn: int, player_id: str, opponent_id: str) -> int:
+    """Deterministic per-fight seed, so the server can replay any fight from its pairing"""
+    return zlib.crc32(f"{match_id}:{turn}:{player_id}:{opponent_id}".encode("utf-8")) or 1
+
+
+class CombatJob(NamedTuple):
+    match_id: str
+    turn: int
+    pairing: Tuple[str, str]
+    seed: int
+    boards: Tuple[bytes, bytes]
+    tavern_tiers: Tuple[int, int]
+    ghost: bool = False
+
+
+class CombatOutcome(NamedTuple):
+    match_id: str
+    turn: int
+    pairing: Tuple[str, str]
+    seed: int
+    winner: Optional[str]      # player id, None for a draw
+    damage: int                # To the loser's hero
+    survivors: Tuple[bytes, bytes]
+    digest: str
+    ghost: bool
+    deaths: Tuple[Tuple[DeathRecord, ...], Tuple[DeathRecord, ...]] = ((), ())
+
+
+def run_job(job: CombatJob) -> CombatOutcome:
+    sim = CombatSimulator(job.seed)
+    sim.setup(unpack_board(job.boards[0]), unpack_board(job.boards[1]), copy_boards=False)
+    result = sim.simulate(*job.tavern_tiers)
+    winner = {"player": job.pairing[0], "opponent": job.pairing[1]}.get(result["winner"])
+    return CombatOutcome(job.match_id, job.turn, job.pairing, job.seed, winner, result["damage"],
+                         (pack_board(sim.player_board), pack_board(sim.opponent_board)),
+                         result["digest"], job.ghost,
+                         (tuple(sim.deaths["player"]), tuple(sim.deaths["opponent"])))
+
+
+def _run_chunk(jobs: List[CombatJob]) -> List[CombatOutcome]:
+    """Worker entry point: a batch of fights per task keeps IPC overhead per fight small"""
+    return [run_job(job) for job in jobs]
+
+
+def combat_result(outcome: CombatOutcome) -> Dict:
+    """The combat_result message for an outcome, as in data/combat_result.json"""
+    damage = {}
+    if outcome.winner is not None:
+        loser = outcome.pairing[1] if outcome.winner == outcome.pairing[0] else outcome.pairing[0]
+        damage[loser] = outcome.damage
+    return {
+        "type": "combat_result",
+        "match_id": outcome.match_id,
+        "turn": outcome.turn,
+        "pairing": list(outcome.pairing),
+        "combat_seed": outcome.seed,
+        "ghost": outcome.ghost,
+        "damage": damage,
+        "survivors": {
+            player_id: [{"instance_id": m.instance_id, "card_id": m.card_id, "attack": m.attack, "health": m.health}
+                        for m in unpack_board(board)]
+            for player_id, board in zip(outcome.pairing, outcome.survivors)
+        },
+        "digest": outcome.digest
+    }
+
+
+class CombatDispatcher:
+    """Collects the round's fights from many matches, runs them on a shared pool and routes the results
+
+    A tick is collect() -> run() -> route(), or resolve() for all three. The
+    pool is created on first use and kept across ticks.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 32):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def collect(matches: Iterable[GameState]) -> List[CombatJob]:
+        """A job per pairing of every match in the combat phase; byes have no fight"""
+        jobs = []
+        for state in matches:
+            if state.phase != GamePhase.COMBAT:
+                continue
+            for pairing in state.pairings:
+                if pairing.opponent_id is None:
+                    continue
+                player = state.players[pairing.player_id]
+                opponent = state.players[pairing.opponent_id]
+                jobs.append(CombatJob(
+                    state.match_id, state.turn, (pairing.player_id, pairing.opponent_id),
+                    combat_seed(state.match_id, state.turn, pairing.player_id, pairing.opponent_id),
+                    (pack_board(player.board), pack_board(opponent.board)),
+                    (player.tavern_tier, opponent.tavern_tier),
+                    pairing.ghost
+                ))
+        return jobs
+
+    def run(self, jobs: List[CombatJob]) -> List[CombatOutcome]:
+        """Simulate every job, in job order"""
+        chunks = [jobs[i:i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)]
+        if self.workers == 1:
+            return [outcome for chunk in chunks for outcome in _run_chunk(chunk)]
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers)
+        return [outcome for result in self.executor.map(_run_chunk, chunks) for outcome in result]
+
+    @staticmethod
+    def route(outcomes: Iterable[CombatOutcome], matches: Mapping[str, GameState]):
+        """Append each combat_result to its match's action queue and record who died on each side
+
+        A player with a bye records an empty round, so last_combat_deaths()
+        never reaches back to an older fight.
+        """
+        for outcome in outcomes:
+            state = matches.get(outcome.match_id)
+            if state is None:
+                continue
+            result = combat_result(outcome)
+            state.action_queue.append(result)
+            state.combat_log.append(result)
+            state.round_results.append(result)
+            sides = zip(outcome.pairing, outcome.deaths)
+            if outcome.ghost:
+                sides = [(outcome.pairing[0], outcome.deaths[0])]
+            for player_id, deaths in sides:
+                player = state.players.get(player_id)
+                if player is not None:
+                    player.record_deaths(outcome.turn, list(deaths))
+        for state in matches.values():
+            if state.phase != GamePhase.COMBAT:
+                continue
+            for pairing in state.pairings:
+                if pairing.opponent_id is None:
+                    state.players[pairing.player_id].record_deaths(state.turn, [])
+
+    def resolve(self, matches: Iterable[GameState]) -> int:
+        """Run this tick's fights for every match given, returning how many were fought"""
+        matches = {state.match_id: state for state in matches}
+        jobs = self.collect(matches.values())
+        self.route(self.run(jobs), matches)
+        return len(jobs)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
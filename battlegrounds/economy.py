@@ -0,0 +1,224 @@
+"""
+Tavern Economy - Gold, upgrade discounts, shop sizes and tier odds from one table
+Turn start is applied to every player of a match in a single batch: the
+arithmetic runs on numpy arrays and every shop draw comes from one random block
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .minion import BGMinion
+from .player import BGPlayer, ShopMinion
+
+
+MINION_DATA_PATH = os.path.join(os.path.dirname(__file__), "minions.json")
+
+STARTING_GOLD = 3
+MAX_GOLD = 10
+MINION_COST = 3
+SELL_VALUE = 1
+REFRESH_COST = 1
+
+# Copies of each minion in a match's shared pool, by minion tier
+COPIES_PER_TIER = {1: 16, 2: 15, 3: 13, 4: 11, 5: 9}
+
+
+class TierRules(NamedTuple):
+    """One row of the tavern table in docs/GameClient.md"""
+    upgrade_cost: Optional[int]       # Base cost of going up from this tier, None at the top
+    min_upgrade_cost: Optional[int]   # Floor the per-turn discount stops at
+    shop_slots: int
+    odds: Tuple[float, float, float]  # Chance of a tier 1, tier 2 and tier 3-or-higher minion
+
+
+# The spec's table stops at tier 4; tier 5 keeps tier 4's shop and odds,
+# its own minions joining the tier 3+ bucket
+TAVERN_TABLE: Dict[int, TierRules] = {
+    1: TierRules(5, 2, 3, (1.00, 0.00, 0.00)),
+    2: TierRules(7, 4, 4, (0.70, 0.30, 0.00)),
+    3: TierRules(8, 5, 4, (0.55, 0.33, 0.12)),
+    4: TierRules(9, 6, 5, (0.45, 0.35, 0.20)),
+    5: TierRules(None, None, 5, (0.45, 0.35, 0.20)),
+}
+MAX_TIER = max(TAVERN_TABLE)
+
+# The table as arrays indexed by tier, for the batched turn start
+_MIN_UPGRADE = np.array([0] + [rules.min_upgrade_cost or 0 for rules in TAVERN_TABLE.values()])
+_SHOP_SLOTS = np.array([0] + [rules.shop_slots for rules in TAVERN_TABLE.values()])
+_ODDS_CUMULATIVE = np.cumsum([(1.0, 0.0, 0.0)] + [rules.odds for rules in TAVERN_TABLE.values()], axis=1)
+
+
+class MinionDefinition(NamedTuple):
+    """One entry of minions.json"""
+    id: str
+    name: str
+    tier: int
+    attack: int
+    health: int
+    keywords: Tuple[str, ...] = ()
+
+
+def load_minions(path: str = MINION_DATA_PATH) -> List[MinionDefinition]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return [MinionDefinition(**dict(entry, keywords=tuple(entry.get("keywords", ()))))
+            for entry in data["minions"]]
+
+
+class CardPool:
+    """The minions left to draw in one match; shops take copies out, unbought ones go back"""
+
+    def __init__(self, minions: Optional[List[MinionDefinition]] = None):
+        self.minions = minions if minions is not None else load_minions()
+        self.index = {m.id: i for i, m in enumerate(self.minions)}
+        self.tiers = np.array([m.tier for m in self.minions])
+        self.counts = np.array([COPIES_PER_TIER[m.tier] for m in self.minions])
+        self.by_tier = {tier: np.flatnonzero(self.tiers == tier) for tier in TAVERN_TABLE}
+        self.tier_counts = {tier: int(self.counts[members].sum()) for tier, members in self.by_tier.items()}
+        # Bumped whenever copies of a tier come back, so samplers know their weights went stale
+        self.restocks = {tier: 0 for tier in TAVERN_TABLE}
+
+    def __len__(self) -> int:
+        return int(self.counts.sum())
+
+    def remaining(self, card_id: str) -> int:
+        i = self.index.get(card_id)
+        return 0 if i is None else int(self.counts[i])
+
+    def put_back(self, card_id: str, copies: int = 1):
+        """Return copies of a minion, e.g. from the shop or a sale (a golden is three)"""
+        i = self.index.get(card_id)
+        if i is not None:
+            tier = int(self.tiers[i])
+            self.counts[i] += copies
+            self.tier_counts[tier] += copies
+            self.restocks[tier] += 1
+    
+    def take(self, card_id: str) -> bool:
+        """Take one copy of a specific minion out of the pool"""
+        i = self.index.get(card_id)
+        if i is None or self.counts[i] <= 0:
+            return False
+        self.counts[i] -= 1
+        self.tier_counts[int(self.tiers[i])] -= 1
+        return True
+
+    def draw(self, low: int, high: int, roll: float) -> Optional[MinionDefinition]:
+        """Take one copy with tier in [low, high], chosen by roll in [0, 1) weighted by copies left"""
+        weights = np.where((self.tiers >= low) & (self.tiers <= high), self.counts, 0)
+        cumulative = np.cumsum(weights)
+        if cumulative[-1] == 0:
+            return None
+        i = int(np.searchsorted(cumulative, roll * cumulative[-1], side="right"))
+        self.counts[i] -= 1
+        self.tier_counts[int(self.tiers[i])] -= 1
+        return self.minions[i]
+
+
+class TavernEconomy:
+    """Owns a match's card pool and applies the tavern table to its players"""
+
+    def __init__(self, pool: Optional[CardPool] = None, seed: Optional[int] = None):
+        from .discover import DiscoverService
+        self.pool = pool if pool is not None else CardPool()
+        self.rng = np.random.default_rng(seed)
+        self.discover = DiscoverService(self.pool, self.rng)
+
+    def start_turn(self, players: Iterable[BGPlayer], turn: int):
+        """Turn-start updates for every player at once: gold, discount, refresh cost, unfreeze, shop refill"""
+        players = list(players)
+        if not players:
+            return
+
+        tiers = np.array([p.tavern_tier for p in players])
+        max_gold = np.full(len(players), min(STARTING_GOLD + turn - 1, MAX_GOLD))
+        upgrade = np.array([p.upgrade_cost for p in players])
+        if turn > 1:
+            upgrade = np.maximum(upgrade - 1, _MIN_UPGRADE[tiers])
+
+        # Frozen cards stay (and thaw), everything else goes back to the pool
+        kept: List[List[ShopMinion]] = []
+        for p in players:
+            frozen = []
+            for sm in p.shop:
+                if sm is None:
+                    continue
+                if sm.frozen or p.shop_frozen:
+                    sm.frozen = False
+                    frozen.append(sm)
+                else:
+                    self.pool.put_back(sm.card_id)
+            kept.append(frozen)
+
+        # One block of randoms for the whole match: a tier bucket and a pick per empty slot
+        missing = np.maximum(_SHOP_SLOTS[tiers] - np.array([len(k) for k in kept]), 0)
+        owners = np.repeat(np.arange(len(players)), missing)
+        rolls = self.rng.random((len(owners), 2))
+        buckets = (rolls[:, :1] >= _ODDS_CUMULATIVE[tiers[owners]][:, :2]).sum(axis=1)
+
+        fills: List[List[MinionDefinition]] = [[] for _ in players]
+        for owner, bucket, roll in zip(owners, buckets, rolls[:, 1]):
+            low = int(bucket) + 1
+            high = low if bucket < 2 else int(tiers[owner])
+            minion = self.pool.draw(low, high, roll) or self.pool.draw(1, int(tiers[owner]), roll)
+            if minion is not None:
+                fills[owner].append(minion)
+
+        for i, p in enumerate(players):
+            p.max_gold = p.gold = int(max_gold[i])
+            p.upgrade_cost = int(upgrade[i])
+            p.refresh_cost = REFRESH_COST
+            p.shop_frozen = False
+            p.hero.hero_power_used = False
+            shop = kept[i] + [self._shop_minion(m) for m in fills[i]]
+            for slot, sm in enumerate(shop):
+                sm.slot = slot
+            p.shop = shop
+
+    def retire(self, player: BGPlayer):
+        """An eliminated player's shop, hand and offers go back to the pool; the board stays for its ghost"""
+        for sm in player.shop:
+            if sm is not None:
+                self.pool.put_back(sm.card_id)
+        player.shop = []
+        self.discover.drop(player)
+        self._put_back_minions(player.hand)
+        player.hand = []
+        player.reindex()
+
+    def release_board(self, player: BGPlayer):
+        """Return an eliminated player's board once it can no longer be drawn as a ghost"""
+        self._put_back_minions(player.board)
+        player.board = []
+        player.reindex()
+
+    def _put_back_minions(self, minions: List[BGMinion]):
+        for m in minions:
+            self.pool.put_back(m.card_id, 3 if m.is_golden else 1)
+
+    def upgrade_tavern(self, player: BGPlayer) -> bool:
+        """Pay for the next tier; the upgrade cost restarts from that tier's base"""
+        rules = TAVERN_TABLE[player.tavern_tier]
+        if rules.upgrade_cost is None or player.gold < player.upgrade_cost:
+            return False
+        player.gold -= player.upgrade_cost
+        player.tavern_tier += 1
+        player.upgrade_cost = TAVERN_TABLE[player.tavern_tier].upgrade_cost or 0
+        return True
+
+    @staticmethod
+    def _shop_minion(minion: MinionDefinition) -> ShopMinion:
+        return ShopMinion(
+            slot=0,
+            card_id=minion.id,
+            name=minion.name,
+            attack=minion.attack,
+            health=minion.health,
+            tier=minion.tier,
+            sim_tier=minion.tier,
+            cost=MINION_COST,
+            keywords=list(minion.keywords)
+        )
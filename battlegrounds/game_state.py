@@ -1,8 +1,21 @@
-from typing import Dict, List, Optional, Any
+import os
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from .player import BGPlayer
 from .minion import BGMinion
+from .economy import TavernEconomy
+from .pairing import Pairing, PairingScheduler
+from .ring_buffer import RingBuffer
+from .seeds import new_seed
+
+
+# Per-match spill files for combat history that no longer fits in memory
+MATCH_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "matches")
+
+EVENT_LOG_SIZE = 100
+COMBAT_LOG_SIZE = 64
 
 
 class GamePhase(Enum):
@@ -21,18 +34,105 @@ class GameState:
     turn: int = 1
     players: Dict[str, BGPlayer] = field(default_factory=dict)
     current_player_id: str = "p1"
-    combat_log: List[Dict[str, Any]] = field(default_factory=list)
-    event_log: List[str] = field(default_factory=list)
-    combat_events: List[Dict[str, Any]] = field(default_factory=list)
+    # Per-run part of the spill file names, so a reused match_id never appends to an
+    # earlier match's file; from the OS, not seeds, so a restarted server can't mint it again
+    log_id: str = field(default_factory=lambda: os.urandom(4).hex())
+    combat_log: Optional[RingBuffer] = None  # combat_result messages, spilled to <match_id>.<log_id>.combat_log.jsonl
+    event_log: RingBuffer = field(default_factory=lambda: RingBuffer(EVENT_LOG_SIZE))
     combat_index: int = 0
     pairing: List[str] = field(default_factory=list)
     first_attacker: str = ""
     winner: Optional[str] = None
+    economy: Optional[TavernEconomy] = field(default=None, repr=False, compare=False)
+    pairings: List[Pairing] = field(default_factory=list)
+    scheduler: Optional[PairingScheduler] = field(default=None, repr=False, compare=False)
+    action_queue: Deque[Dict[str, Any]] = field(default_factory=deque, repr=False, compare=False)
+    round_results: List[Dict[str, Any]] = field(default_factory=list, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.combat_log is None:
+            self.combat_log = RingBuffer(COMBAT_LOG_SIZE, self.log_path("combat_log"))
+    
+    def log_path(self, name: str) -> str:
+        return os.path.join(MATCH_LOG_DIR, f"{self.match_id}.{self.log_id}.{name}.jsonl")
+    
+    def close_logs(self):
+        """Close the spill files, e.g. once the match is over"""
+        self.combat_log.close()
+    
+    def start_recruit(self):
+        """Enter the recruit phase of the current turn, running turn start for every player still in, in one batch"""
+        if self.economy is None:
+            self.economy = TavernEconomy(seed=new_seed())
+        self.phase = GamePhase.RECRUIT
+        self.economy.start_turn([p for p in self.players.values() if p.placement is None], self.turn)
+    
+    def finish_round(self) -> Dict[str, int]:
+        """Close the combat round from its combat_results: hero damage, eliminations, placements, next phase
+        
+        Damage was already worked out from each fight's final boards, so this
+        is one pass over the results and one over the players. Players who die
+        in the same round place by health left (lowest places last), then by
+        player id. Returns the health each player lost.
+        """
+        damage: Dict[str, int] = {}
+        opponents: Dict[str, str] = {}
+        for result in self.round_results:
+            player_id, opponent_id = result["pairing"]
+            opponents[player_id] = opponent_id
+            if not result.get("ghost"):
+                opponents[opponent_id] = player_id
+            for pid, amount in result["damage"].items():
+                if result.get("ghost") and pid == opponent_id:
+                    continue  # The ghost is already out
+                damage[pid] = damage.get(pid, 0) + amount
+        self.round_results = []
+        
+        lost: Dict[str, int] = {}
+        eliminated: List[BGPlayer] = []
+        for pid, amount in damage.items():
+            player = self.players.get(pid)
+            if player is None or player.placement is not None:
+                continue
+            lost[pid] = player.take_damage(amount)
+            if player.is_dead():
+                eliminated.append(player)
+        
+        remaining = sum(1 for p in self.players.values() if p.placement is None) - len(eliminated)
+        eliminated.sort(key=lambda p: (p.health, p.player_id))
+        for i, player in enumerate(eliminated):
+            player.placement = remaining + len(eliminated) - i
+            if self.economy is not None:
+                self.economy.retire(player)
+            self.add_log(f"{player.player_id} is eliminated in place {player.placement}")
+        
+        self.action_queue.append({
+            "type": "leaderboard_update",
+            "turn": self.turn,
+            "players": [{
+                "player_id": pid,
+                "opponent_id": opponents.get(pid),
+                "delta_health": -lost.get(pid, 0),
+                "is_dead": p.placement is not None,
+                "tavern_level": p.tavern_tier,
+                "placement": p.placement
+            } for pid, p in self.players.items()]
+        })
+        
+        alive = [p for p in self.players.values() if p.placement is None]
+        if len(alive) <= 1:
+            if alive:
+                alive[0].placement = 1
+            self.winner = min(self.players.values(), key=lambda p: p.placement or 0).player_id
+            self.phase = GamePhase.GAME_OVER
+            self.add_log(f"{self.winner} wins the match")
+        else:
+            self.turn += 1
+            self.start_recruit()
+        return lost
     
     def add_log(self, message: str):
         self.event_log.append(message)
-        if len(self.event_log) > 100:
-            self.event_log.pop(0)
     
     def get_player(self, player_id: str) -> Optional[BGPlayer]:
         return self.players.get(player_id)
@@ -40,7 +140,26 @@ class GameState:
     def get_current_player(self) -> Optional[BGPlayer]:
         return self.players.get(self.current_player_id)
     
+    def pair_round(self) -> List[Pairing]:
+        """Pick every fight of the coming combat round; dead players become ghosts"""
+        if self.scheduler is None:
+            self.scheduler = PairingScheduler(list(self.players), seed=new_seed())
+        for pid, player in self.players.items():
+            if player.is_dead():
+                self.scheduler.eliminate(pid)
+        # Only the latest elimination can still be drawn as a ghost; older boards go back to the pool
+        for pid in self.scheduler.eliminated[:-1]:
+            if self.economy is not None and self.players[pid].board:
+                self.economy.release_board(self.players[pid])
+        self.pairings = self.scheduler.next_round()
+        return self.pairings
+    
     def get_opponent(self, player_id: str) -> Optional[BGPlayer]:
+        for pairing in self.pairings:
+            if player_id == pairing.player_id:
+                return self.players.get(pairing.opponent_id)
+            if player_id == pairing.opponent_id and not pairing.ghost:
+                return self.players.get(pairing.player_id)
         for pid in self.players:
             if pid != player_id:
                 return self.players[pid]
@@ -53,7 +172,7 @@ class GameState:
             "turn": self.turn,
             "players": [p.to_dict() for p in self.players.values()],
             "current_player_id": self.current_player_id,
-            "event_log": self.event_log[-20:],
+            "event_log": self.event_log.tail(20),
             "pairing": self.pairing,
             "first_attacker": self.first_attacker
         }
@@ -70,7 +189,9 @@ class GameState:
             player = BGPlayer.from_dict(p_data)
             state.players[player.player_id] = player
         
-        if state.players:
+        if data.get("current_player_id") in state.players:
+            state.current_player_id = data["current_player_id"]
+        elif state.players:
             state.current_player_id = list(state.players.keys())[0]
         
         return state
@@ -100,6 +221,7 @@ class GameState:
             for m_data in minions:
                 minion = BGMinion.from_dict(m_data)
                 player.board.append(minion)
+            player.reindex()
             state.players[player_id] = player
         
         if state.pairing:
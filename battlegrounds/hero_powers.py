@@ -0,0 +1,47 @@
+"""
+Hero Powers - Server-side resolution of the lobby heroes' powers
+Anything a power needs to know about past combats comes from the player's own
+records, never from the client
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from .minion import BGMinion
+from .player import BGPlayer
+
+
+SYLVANAS = "BG23_HERO_306"
+
+
+def reclaimed_souls(player: BGPlayer) -> List[BGMinion]:
+    """Sylvanas: give +2/+1 to your minions that died last combat"""
+    died = player.last_combat_deaths()
+    buffed = [m for m in player.board if m.instance_id in died]
+    for m in buffed:
+        m.buff(2, 1)
+    return buffed
+
+
+class HeroPower(NamedTuple):
+    cost: int  # Gold
+    resolve: Callable[[BGPlayer], List[BGMinion]]
+
+
+HERO_POWERS: Dict[str, HeroPower] = {
+    SYLVANAS: HeroPower(1, reclaimed_souls),
+}
+
+
+def use_hero_power(player: BGPlayer) -> Optional[List[BGMinion]]:
+    """Pay for and resolve the player's hero power, returning the minions it affected
+
+    None if the hero has no active power here, it was already used this
+    turn, or the player can't afford it.
+    """
+    hero = player.hero
+    power = HERO_POWERS.get(hero.card_id)
+    if power is None or hero.hero_power_used or player.gold < power.cost:
+        return None
+    player.gold -= power.cost
+    hero.hero_power_used = True
+    return power.resolve(player)
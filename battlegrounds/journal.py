@@ -0,0 +1,280 @@
+"""
+Match Journal - Crash-safe write-ahead log for every match in the process
+Each accepted action is logged with the seed it ran under; commit() makes a
+whole batch durable across all matches, and every compact_every actions a
+match is folded into a snapshot and its log starts over
+"""
+
+import json
+import os
+import random
+import struct
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .actions import apply_action, begin_combat, end_combat
+from .dispatch import CombatDispatcher
+from .game_state import GameState
+from .seeds import getstate, reseed, setstate
+from .snapshot import load_state, save_state
+
+
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "journal")
+COMPACT_EVERY = 256  # Actions per match between snapshots
+
+# Record: body length and crc32, then the body: seq, seed and the action as JSON
+_RECORD = struct.Struct("<II")
+_RECORD_HEAD = struct.Struct("<QQ")
+# Snapshot file: magic and the seq of the last action folded in, then save_state() bytes
+_SNAPSHOT = struct.Struct("<4sQ")
+SNAPSHOT_MAGIC = b"BGJS"
+
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+class JournalError(Exception):
+    """Recovery found a log that doesn't replay onto its snapshot"""
+
+
+def encode_record(seq: int, seed: int, action: Dict[str, Any]) -> bytes:
+    body = _RECORD_HEAD.pack(seq, seed) + json.dumps(action, separators=(",", ":")).encode("utf-8")
+    return _RECORD.pack(len(body), zlib.crc32(body)) + body
+
+
+def read_records(data: bytes) -> Iterator[Tuple[int, int, int, Dict[str, Any]]]:
+    """(end offset, seq, seed, action) per intact record, stopping at the first torn or corrupt one"""
+    offset = 0
+    while offset + _RECORD.size <= len(data):
+        length, crc = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        body = data[start:start + length]
+        if len(body) < length or length < _RECORD_HEAD.size or zlib.crc32(body) != crc:
+            return
+        seq, seed = _RECORD_HEAD.unpack_from(body)
+        offset = start + length
+        yield offset, seq, seed, json.loads(body[_RECORD_HEAD.size:])
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _sync_dir(path: str):
+    """Make a rename in path durable; directories can't be opened for this on Windows"""
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class MatchJournal:
+    """Per-match logs of accepted actions, made durable a batch at a time
+
+    A tick is any number of apply() calls across matches, then one commit()
+    that writes every match's new records and syncs each file once. Nothing
+    an action changed should reach clients before the commit that covers it:
+    after a crash, recover() rebuilds each match from its snapshot plus the
+    committed tail, replaying every action under its logged seed.
+    """
+
+    def __init__(self, directory: str = JOURNAL_DIR, compact_every: int = COMPACT_EVERY,
+                 rng: Optional[random.Random] = None):
+        self.directory = directory
+        self.compact_every = compact_every
+        self.rng = rng or random.SystemRandom()  # Per-action seeds; pass a seeded Random for repeatable runs
+        self.matches: Dict[str, GameState] = {}
+        self.seq: Dict[str, int] = {}          # Last action applied, per match
+        self.buffers: Dict[str, bytearray] = {}  # Records applied but not yet written
+        self.pending: Dict[str, int] = {}        # How many records each buffer holds
+        self.since_snapshot: Dict[str, int] = {}
+        self.fds: Dict[str, int] = {}
+        self.commits = 0
+        self.committed = 0  # Records made durable
+        self.failed: Dict[str, str] = {}  # Matches recover() couldn't rebuild, and why
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, match_id: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{match_id}.{kind}")
+
+    def open(self, state: GameState):
+        """Start journaling a new match from its current state, which becomes its first snapshot"""
+        self._write_snapshot(state, 0)
+        self._track(state, 0, os.O_TRUNC)
+
+    def _track(self, state: GameState, seq: int, flags: int = 0):
+        match_id = state.match_id
+        self.matches[match_id] = state
+        self.seq[match_id] = seq
+        self.buffers[match_id] = bytearray()
+        self.pending[match_id] = 0
+        self.since_snapshot[match_id] = 0
+        self.fds[match_id] = os.open(self.path(match_id, "wal"),
+                                     os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0) | flags,
+                                     0o644)
+
+    def apply(self, match_id: str, action: Dict[str, Any]) -> bool:
+        """Run an action on the match under a fresh seed, logging it if it was accepted"""
+        seed = self.rng.getrandbits(63)
+        reseed(seed)
+        if not apply_action(self.matches[match_id], action):
+            return False
+        self.append(match_id, seed, action)
+        return True
+
+    def resolve_combats(self, match_ids: Iterable[str], dispatcher: CombatDispatcher) -> List[str]:
+        """RESOLVE_COMBAT for many matches at once, their fights run together on a shared dispatcher
+
+        Each match is paired under its own seed, every fight goes to the
+        dispatcher in one batch, then each round is closed where its seed's
+        stream left off. That is what apply() with RESOLVE_COMBAT does one
+        match at a time, so the records logged here replay in process.
+        Returns the matches resolved.
+        """
+        started = []
+        for match_id in match_ids:
+            seed = self.rng.getrandbits(63)
+            reseed(seed)
+            if begin_combat(self.matches[match_id]):
+                started.append((match_id, seed, getstate()))
+        dispatcher.resolve([self.matches[match_id] for match_id, _, _ in started])
+        for match_id, seed, stream in started:
+            setstate(stream)
+            end_combat(self.matches[match_id])
+            self.append(match_id, seed, {"action": "RESOLVE_COMBAT"})
+        return [match_id for match_id, _, _ in started]
+
+    def append(self, match_id: str, seed: int, action: Dict[str, Any]):
+        """Log an action already applied under seed; it is durable after the next commit()"""
+        self.seq[match_id] += 1
+        self.buffers[match_id] += encode_record(self.seq[match_id], seed, {
+            "action": action.get("action"),
+            "player_id": action.get("player_id"),
+            "payload": action.get("payload") or {}
+        })
+        self.pending[match_id] += 1
+        self.since_snapshot[match_id] += 1
+
+    def commit(self) -> int:
+        """Write every match's pending records, then sync each file: one batch for the whole process"""
+        dirty = [match_id for match_id, buffer in self.buffers.items() if buffer]
+        for match_id in dirty:
+            _write_all(self.fds[match_id], self.buffers[match_id])
+        for match_id in dirty:
+            _sync(self.fds[match_id])
+
+        count = sum(self.pending[match_id] for match_id in dirty)
+        for match_id in dirty:
+            self.buffers[match_id] = bytearray()
+            self.pending[match_id] = 0
+            if self.since_snapshot[match_id] >= self.compact_every:
+                self.compact(match_id)
+        self.commits += 1
+        self.committed += count
+        return count
+
+    def compact(self, match_id: str):
+        """Fold the match into a fresh snapshot, then start its log over
+
+        The snapshot covers records still in the buffer too, so they are
+        dropped rather than written.
+        """
+        state = self.matches[match_id]
+        self._write_snapshot(state, self.seq[match_id])
+        self.buffers[match_id] = bytearray()
+        self.pending[match_id] = 0
+        self.since_snapshot[match_id] = 0
+        fd = self.fds[match_id]
+        os.ftruncate(fd, 0)
+        _sync(fd)
+
+    def _write_snapshot(self, state: GameState, seq: int):
+        path = self.path(state.match_id, "snap")
+        state.combat_log.flush()  # Every line the snapshot counts as spilled is in the file
+        with open(path + ".tmp", "wb") as f:
+            f.write(_SNAPSHOT.pack(SNAPSHOT_MAGIC, seq))
+            f.write(save_state(state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        _sync_dir(self.directory)
+
+    def close(self, match_id: str, remove: bool = False):
+        """Stop journaling a match, e.g. once it is over; remove deletes its files"""
+        if self.buffers.get(match_id):
+            self.commit()
+        os.close(self.fds.pop(match_id))
+        for table in (self.matches, self.seq, self.buffers, self.pending, self.since_snapshot):
+            table.pop(match_id, None)
+        if remove:
+            for kind in ("wal", "snap"):
+                if os.path.exists(self.path(match_id, kind)):
+                    os.remove(self.path(match_id, kind))
+
+    def shutdown(self):
+        self.commit()
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds.clear()
+
+    @classmethod
+    def recover(cls, directory: str = JOURNAL_DIR, **kwargs) -> 'MatchJournal':
+        """Rebuild every journaled match: its snapshot, then its log up to the first torn record
+
+        The torn tail is cut off so new records follow the last good one. The
+        returned journal carries on where the committed history ends. A match
+        that can't be rebuilt is left out, files untouched, and listed in
+        failed; the others recover regardless.
+        """
+        journal = cls(directory, **kwargs)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".snap.tmp"):
+                os.remove(os.path.join(directory, name))  # A compaction that never finished
+                continue
+            if not name.endswith(".snap"):
+                continue
+            try:
+                journal._recover_match(name)
+            except Exception as e:
+                journal.failed[name[:-len(".snap")]] = f"{type(e).__name__}: {e}"
+        return journal
+
+    def _recover_match(self, name: str):
+        with open(os.path.join(self.directory, name), "rb") as f:
+            data = f.read()
+        if len(data) < _SNAPSHOT.size:
+            raise JournalError(f"{name} is too short for a journal snapshot")
+        magic, seq = _SNAPSHOT.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise JournalError(f"{name} is not a journal snapshot")
+        state = load_state(data[_SNAPSHOT.size:])
+        state.combat_log.truncate_spill()  # Replay spills those results again
+        replayed, good = self._replay(state, seq)
+        self._track(state, replayed)
+        self.since_snapshot[state.match_id] = replayed - seq
+        os.ftruncate(self.fds[state.match_id], good)
+
+    def _replay(self, state: GameState, seq: int) -> Tuple[int, int]:
+        """Apply the logged actions after seq, returning the last seq applied and where the good log ends"""
+        path = self.path(state.match_id, "wal")
+        data = b""
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+        good = 0
+        for end, record_seq, seed, action in read_records(data):
+            if record_seq <= seq:
+                good = end  # Already in the snapshot: compaction stopped before truncating the log
+                continue
+            if record_seq != seq + 1:
+                break
+            reseed(seed)
+            if not apply_action(state, action):
+                raise JournalError(f"{state.match_id}: action {record_seq} ({action['action']}) "
+                                   f"was rejected on replay")
+            seq, good = record_seq, end
+        return seq, good
@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
-import uuid
+from .seeds import new_id
 
 
 @dataclass
@@ -13,7 +13,7 @@ class BGMinion:
     base_attack: int = 0
     base_health: int = 0
     tier: int = 1
-    instance_id: str = field(default_factory=lambda: f"inst-{uuid.uuid4().hex[:8]}")
+    instance_id: str = field(default_factory=lambda: new_id("inst"))
     slot: Optional[int] = None
     keywords: List[str] = field(default_factory=list)
     is_golden: bool = False
@@ -94,7 +94,7 @@ class BGMinion:
             base_attack=data.get("base_attack", data.get("attack", 1)),
             base_health=data.get("base_health", data.get("health", 1)),
             tier=data.get("tier", 1),
-            instance_id=data.get("instance_id", f"inst-{uuid.uuid4().hex[:8]}"),
+            instance_id=data.get("instance_id") or new_id("inst"),
             slot=data.get("slot"),
             keywords=data.get("keywords", []),
             is_golden=data.get("is_golden", False),
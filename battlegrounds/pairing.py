@@ -0,0 +1,94 @@
+"""
+Pairing Scheduler - Every fight of a combat round, picked at once
+Scores all the ways to pair the players still alive and keeps the one that
+repeats recent opponents least; an odd player out meets the latest ghost
+"""
+
+import random
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+# More than the pairs in a round, so all of them rematching from k + 1 rounds ago
+# still costs less than one rematch from k rounds ago
+REMATCH_BASE = MAX_PLAYERS // 2 + 1
+
+
+class Pairing(NamedTuple):
+    player_id: str
+    opponent_id: Optional[str]  # None for a bye
+    ghost: bool = False         # opponent_id was eliminated; its last board fights instead
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id == self.player_id or player_id == self.opponent_id
+
+
+def _matchings(ids: Sequence[str]) -> Iterator[List[Tuple[str, str]]]:
+    """Every way to split ids (even length) into pairs: 3 for 4 players, 105 for 8"""
+    if not ids:
+        yield []
+        return
+    first, rest = ids[0], ids[1:]
+    for i, other in enumerate(rest):
+        for tail in _matchings(rest[:i] + rest[i + 1:]):
+            yield [(first, other)] + tail
+
+
+class PairingScheduler:
+    """Round-by-round opponents for one lobby
+
+    A pair that met k rounds ago costs REMATCH_BASE ** -k, so one rematch from last round
+    outweighs any number of older ones; the cheapest full set of pairs wins
+    and ties are broken by the seeded rng. Eliminated players stay available
+    as ghosts (their board as it was when they died) for odd player counts.
+    """
+
+    def __init__(self, player_ids: Sequence[str], seed: Optional[int] = None):
+        if not MIN_PLAYERS <= len(player_ids) <= MAX_PLAYERS:
+            raise ValueError(f"Lobbies hold {MIN_PLAYERS} to {MAX_PLAYERS} players, got {len(player_ids)}")
+        self.player_ids = list(player_ids)
+        self.rng = random.Random(seed)
+        self.round = 0
+        self.eliminated: List[str] = []  # In elimination order, latest last
+        self.last_met: Dict[FrozenSet[str], int] = {}
+        self.history: List[List[Pairing]] = []
+
+    def eliminate(self, player_id: str):
+        if player_id not in self.eliminated:
+            self.eliminated.append(player_id)
+
+    def alive(self) -> List[str]:
+        return [pid for pid in self.player_ids if pid not in self.eliminated]
+
+    def _cost(self, a: str, b: str) -> float:
+        met = self.last_met.get(frozenset((a, b)))
+        return 0.0 if met is None else float(REMATCH_BASE) ** -(self.round - met)
+
+    def next_round(self) -> List[Pairing]:
+        """All pairings for the next combat round"""
+        self.round += 1
+        ids = self.alive()
+        self.rng.shuffle(ids)
+
+        ghost = None
+        if len(ids) % 2:
+            # Odd one out fights the most recently eliminated board, or sits the round out
+            ghost = self.eliminated[-1] if self.eliminated else None
+            ids.append(ghost)
+
+        best, best_cost = [], None
+        for matching in _matchings(ids):
+            cost = sum(self._cost(a, b) for a, b in matching if a is not None and b is not None)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = matching, cost
+
+        pairings = []
+        for a, b in best:
+            if a == ghost:
+                a, b = b, a
+            pairings.append(Pairing(a, b, ghost=b is not None and b == ghost))
+            if a is not None and b is not None:
+                self.last_met[frozenset((a, b))] = self.round
+        self.history.append(pairings)
+        return pairings
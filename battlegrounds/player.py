@@ -1,6 +1,20 @@
-from typing import List, Optional, Dict, Any
+from collections import deque
+from typing import List, Optional, Dict, Any, Deque, Mapping, NamedTuple, Tuple
 from dataclasses import dataclass, field
 from .minion import BGMinion
+from .seeds import new_id
+
+# Rounds of combat deaths each player remembers
+DEATH_HISTORY = 3
+
+
+class DeathRecord(NamedTuple):
+    """A minion that died in combat, as it stood when the fight began"""
+    instance_id: str
+    card_id: str
+    attack: int
+    health: int
+    golden: bool
 
 
 @dataclass
@@ -102,12 +116,86 @@ class BGPlayer:
     shop: List[Optional[ShopMinion]] = field(default_factory=list)
     shop_frozen: bool = False
     ready: bool = False
+    placement: Optional[int] = None  # Final standing, set when eliminated or when the match ends
+    pending_discovers: List[Dict[str, Any]] = field(default_factory=list)
+    # card_id -> {instance_id: minion} for every non-golden copy on board or in hand
+    copies: Dict[str, Dict[str, BGMinion]] = field(default_factory=dict, repr=False, compare=False)
+    # (turn, {instance_id: record}) per combat, newest last; kept server-side only
+    death_history: Deque[Tuple[int, Dict[str, DeathRecord]]] = field(
+        default_factory=lambda: deque(maxlen=DEATH_HISTORY), repr=False, compare=False)
     
     def __post_init__(self):
         if isinstance(self.hero, dict):
             self.hero = Hero.from_dict(self.hero)
         elif isinstance(self.hero, str):
             self.hero = Hero(card_id="default", name=self.hero)
+        self.reindex()
+    
+    def scan_copies(self) -> Dict[str, Dict[str, BGMinion]]:
+        """Build the copies index from scratch by walking board and hand"""
+        copies: Dict[str, Dict[str, BGMinion]] = {}
+        for m in self.board + self.hand:
+            if not m.is_golden:
+                copies.setdefault(m.card_id, {})[m.instance_id] = m
+        return copies
+    
+    def reindex(self):
+        """Rebuild the copies index after board or hand were changed directly"""
+        self.copies = self.scan_copies()
+    
+    def _track(self, minion: BGMinion) -> Optional[BGMinion]:
+        """Index a copy; returns the golden if it completed a triple"""
+        if minion.is_golden:
+            return None
+        same = self.copies.setdefault(minion.card_id, {})
+        same[minion.instance_id] = minion
+        if len(same) >= 3:
+            return self._merge_triple(minion.card_id)
+        return None
+    
+    def _untrack(self, minion: BGMinion):
+        same = self.copies.get(minion.card_id)
+        if same is None:
+            return
+        same.pop(minion.instance_id, None)
+        if not same:
+            del self.copies[minion.card_id]
+    
+    def _merge_triple(self, card_id: str) -> BGMinion:
+        """Merge three copies of card_id into a golden and queue a discover from the next tier"""
+        same = self.copies[card_id]
+        merged = [same[instance_id] for instance_id in list(same)[:3]]
+        slot = None
+        for m in merged:
+            if self.remove_from_board(m.instance_id) is not None:
+                slot = m.slot if slot is None else slot
+            else:
+                self.remove_from_hand(m.instance_id)
+        
+        # Double the base card, keeping whatever buffs the copies picked up
+        base = merged[0]
+        golden = BGMinion(
+            card_id=card_id,
+            name=base.name,
+            attack=sum(m.attack for m in merged) - min(m.attack for m in merged),
+            health=sum(m.health for m in merged) - min(m.health for m in merged),
+            tier=base.tier,
+            keywords=list(base.keywords),
+            is_golden=True
+        )
+        if not self.add_to_board(golden, slot):
+            self.add_to_hand(golden)
+        
+        self.pending_discovers.append({
+            "type": "discover_offer",
+            "request_id": new_id("uuid"),
+            "player_id": self.player_id,
+            "source": card_id,
+            "golden_instance_id": golden.instance_id,
+            "tier": min(self.tavern_tier + 1, 6),
+            "options": []
+        })
+        return golden
     
     def get_board_minion(self, slot: int) -> Optional[BGMinion]:
         for m in self.board:
@@ -135,11 +223,13 @@ class BGPlayer:
         minion.slot = slot
         self.board.append(minion)
         self.board.sort(key=lambda m: m.slot or 0)
+        self._track(minion)
         return True
     
     def remove_from_board(self, instance_id: str) -> Optional[BGMinion]:
         for i, m in enumerate(self.board):
             if m.instance_id == instance_id:
+                self._untrack(m)
                 return self.board.pop(i)
         return None
     
@@ -147,9 +237,23 @@ class BGPlayer:
         if len(self.hand) >= 10:
             return False
         self.hand.append(minion)
+        self._track(minion)
         return True
     
+    def remove_from_hand(self, instance_id: str) -> Optional[BGMinion]:
+        for i, m in enumerate(self.hand):
+            if m.instance_id == instance_id:
+                self._untrack(m)
+                return self.hand.pop(i)
+        return None
+    
     def buy_minion(self, shop_slot: int) -> Optional[BGMinion]:
+        """Buy into hand, returning the minion bought
+        
+        A third copy merges at once: the golden it made is returned instead
+        (on board, or in hand if the board is full) and an offer is left in
+        pending_discovers.
+        """
         if self.gold < 3:
             return None
         
@@ -175,10 +279,10 @@ class BGPlayer:
             is_golden=shop_minion.is_golden
         )
         
-        if not self.add_to_hand(minion):
+        if len(self.hand) >= 10:
             return None
-        
-        return minion
+        self.hand.append(minion)
+        return self._track(minion) or minion
     
     def sell_minion(self, instance_id: str) -> bool:
         minion = self.remove_from_board(instance_id)
@@ -187,6 +291,13 @@ class BGPlayer:
             return True
         return False
     
+    def record_deaths(self, turn: int, records: List[DeathRecord]):
+        self.death_history.append((turn, {r.instance_id: r for r in records}))
+    
+    def last_combat_deaths(self) -> Mapping[str, DeathRecord]:
+        """Minions of this player that died in its latest combat, by instance id"""
+        return self.death_history[-1][1] if self.death_history else {}
+    
     def take_damage(self, amount: int) -> int:
         if self.armor > 0:
             absorbed = min(self.armor, amount)
@@ -214,7 +325,8 @@ class BGPlayer:
             "board": [m.to_dict() for m in self.board],
             "hand": [m.to_dict() for m in self.hand],
             "shop": [s.to_dict() if s else None for s in self.shop],
-            "flags": {"shop_frozen": self.shop_frozen, "ready": self.ready}
+            "flags": {"shop_frozen": self.shop_frozen, "ready": self.ready},
+            "placement": self.placement
         }
     
     @classmethod
@@ -236,7 +348,8 @@ class BGPlayer:
             refresh_cost=data.get("refresh_cost", 1),
             timer_ms=data.get("timer_ms", 30000),
             shop_frozen=flags.get("shop_frozen", False),
-            ready=flags.get("ready", False)
+            ready=flags.get("ready", False),
+            placement=data.get("placement")
         )
         
         # Parse board
@@ -254,4 +367,5 @@ class BGPlayer:
             shop_minion = ShopMinion.from_dict(s_data)
             player.shop.append(shop_minion)
         
+        player.reindex()
         return player
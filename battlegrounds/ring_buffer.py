@@ -0,0 +1,132 @@
+"""
+Ring Buffer - Fixed-capacity logs with O(1) append and cheap "last N" reads
+Entries pushed out of a full buffer can spill, one JSON line each, to an
+append-only file, so a match keeps its whole history without growing in memory
+"""
+
+import json
+import os
+from typing import Any, Iterator, List, Optional
+
+
+class RingBuffer:
+    """The newest capacity entries in a preallocated list
+
+    With a spill_path, every entry that falls out is appended to that file;
+    the file is opened on the first spill, so short matches never touch disk.
+    replay() walks the spilled entries and then the ones still in memory.
+    Entries are treated as immutable once appended: lines() encodes each one
+    to JSON at most once and _spill reuses that line.
+    """
+
+    def __init__(self, capacity: int, spill_path: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError(f"RingBuffer capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.items: List[Any] = [None] * capacity
+        self.encoded: List[Optional[str]] = [None] * capacity  # JSON line per slot, filled by lines()
+        self.start = 0
+        self.size = 0
+        self.total = 0     # Entries ever appended
+        self.spilled = 0   # Entries written to the spill file
+        self._file = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tail(self.size))
+
+    def append(self, item: Any):
+        if self.size < self.capacity:
+            slot = (self.start + self.size) % self.capacity
+            self.items[slot] = item
+            self.encoded[slot] = None
+            self.size += 1
+        else:
+            old, line = self.items[self.start], self.encoded[self.start]
+            self.items[self.start] = item
+            self.encoded[self.start] = None
+            self.start = (self.start + 1) % self.capacity
+            self._spill(old, line)
+        self.total += 1
+
+    def tail(self, count: int) -> List[Any]:
+        """The last count entries, oldest first: at most two slices of the backing list"""
+        count = max(0, min(count, self.size))
+        first = (self.start + self.size - count) % self.capacity
+        if first + count <= self.capacity:
+            return self.items[first:first + count]
+        return self.items[first:] + self.items[:first + count - self.capacity]
+
+    def lines(self) -> List[str]:
+        """Every entry in memory as a JSON line, oldest first; each entry is only ever encoded once"""
+        out = []
+        for k in range(self.size):
+            slot = (self.start + k) % self.capacity
+            line = self.encoded[slot]
+            if line is None:
+                line = self.encoded[slot] = json.dumps(self.items[slot], separators=(",", ":"))
+            out.append(line)
+        return out
+
+    def clear(self):
+        """Forget what is in memory; already spilled entries stay in the file"""
+        self.items = [None] * self.capacity
+        self.encoded = [None] * self.capacity
+        self.start = 0
+        self.size = 0
+
+    def _spill(self, item: Any, line: Optional[str] = None):
+        if self.spill_path is None:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+            self._file = open(self.spill_path, "a", encoding="utf-8")
+        if line is None:
+            line = json.dumps(item, separators=(",", ":"))
+        self._file.write(line + "\n")
+        self.spilled += 1
+
+    def replay(self) -> Iterator[Any]:
+        """Every entry still on record: the spill file, then memory"""
+        if self._file is not None:
+            self._file.flush()
+        if self.spill_path and os.path.exists(self.spill_path):
+            with open(self.spill_path, encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+        yield from self.tail(self.size)
+
+    def truncate_spill(self):
+        """Cut the spill file back to the spilled count, dropping lines written after it was taken
+
+        For a buffer restored from a snapshot: whatever spilled after the
+        snapshot will spill again as the match is replayed onto it.
+        """
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        self.close()
+        with open(self.spill_path, "r+b") as f:
+            offset = 0
+            for _ in range(self.spilled):
+                line = f.readline()
+                if not line:
+                    break
+                offset += len(line)
+            f.truncate(offset)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None  # Reopened for append on the next spill
+        return state
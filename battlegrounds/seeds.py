@@ -0,0 +1,32 @@
+"""
+Seeds - One source for minted ids and the seeds of rngs created mid-match
+Seeded from the OS by default; the match journal reseeds it before each
+action, so replaying the journal mints the same ids and rngs again
+"""
+
+import random
+
+
+_source = random.Random()
+
+
+def reseed(seed: int):
+    _source.seed(seed)
+
+
+def getstate():
+    return _source.getstate()
+
+
+def setstate(state):
+    """Pick up a stream where getstate() left it, e.g. after other matches drew from it"""
+    _source.setstate(state)
+
+
+def new_id(prefix: str) -> str:
+    """prefix-xxxxxxxx: 32 random bits, the same shape as the first 8 hex digits of a uuid4"""
+    return f"{prefix}-{_source.getrandbits(32):08x}"
+
+
+def new_seed() -> int:
+    return _source.getrandbits(63)
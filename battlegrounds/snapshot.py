@@ -0,0 +1,414 @@
+"""
+Match Snapshots - Versioned binary checkpoints of a whole GameState
+Fixed struct layouts for heroes, minions, shop slots and players, a header
+with magic, schema version and crc32, and nothing left out that a resumed
+match would need: shops, pool, rng states, pairings and pending messages
+"""
+
+import json
+import struct
+import zlib
+from array import array
+from collections import deque
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from .discover import AliasTable, PendingOffer, TierTable
+from .economy import CardPool, TavernEconomy, load_minions
+from .game_state import GamePhase, GameState
+from .minion import BGMinion
+from .pairing import Pairing, PairingScheduler
+from .player import DEATH_HISTORY, BGPlayer, DeathRecord, Hero, ShopMinion
+from .ring_buffer import RingBuffer
+
+
+MAGIC = b"BGSS"
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<4sHII")            # magic, version, body length, crc32 of body
+_STATE = struct.Struct("<BiiB")              # phase, turn, combat_index, has winner
+_HERO = struct.Struct("<hhh?")               # health, armor, hero_power_cost, hero_power_used
+_PLAYER = struct.Struct("<hhhhBhhi??b")      # health, armor, gold, max_gold, tier, upgrade, refresh, timer, frozen, ready, placement
+# Fixed fields then the byte lengths of the strings that follow them (keywords joined by KEYWORD_SEP)
+_MINION = struct.Struct("<hhhhBbBBHHHH")     # attack, health, base_attack, base_health, tier, slot, flags, attacks
+_SHOP = struct.Struct("<BhhBBh??HHH")        # slot, attack, health, tier, sim_tier, cost, frozen, golden
+_DEATH = struct.Struct("<hh?HH")             # attack, health, golden, then instance_id and card_id
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+_F64 = struct.Struct("<d")
+
+KEYWORD_SEP = "|"
+_PHASES = list(GamePhase)
+
+
+class SnapshotError(ValueError):
+    """Raised for data that isn't a snapshot this version can read"""
+
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray()
+
+    def pack(self, fmt: struct.Struct, *values):
+        self.buf += fmt.pack(*values)
+
+    def str(self, text: str):
+        data = text.encode("utf-8")
+        self.buf += _U16.pack(len(data))
+        self.buf += data
+
+    def opt_str(self, text: Optional[str]):
+        self.buf += _U8.pack(text is not None)
+        if text is not None:
+            self.str(text)
+
+    def blob(self, data: bytes):
+        self.buf += _I32.pack(len(data))
+        self.buf += data
+
+    def json(self, value: Any):
+        self.blob(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def strs(self, items: List[str]):
+        self.buf += _U16.pack(len(items))
+        for item in items:
+            self.str(item)
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int = 0):
+        self.data = memoryview(data)
+        self.offset = offset
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def str(self) -> str:
+        (length,) = _U16.unpack_from(self.data, self.offset)
+        start = self.offset + 2
+        self.offset = start + length
+        return bytes(self.data[start:self.offset]).decode("utf-8")
+
+    def texts(self, lengths) -> List[str]:
+        """Strings stored back to back, their byte lengths already read"""
+        out = []
+        for length in lengths:
+            start = self.offset
+            self.offset += length
+            out.append(str(self.data[start:self.offset], "utf-8"))
+        return out
+
+    def opt_str(self) -> Optional[str]:
+        (present,) = self.unpack(_U8)
+        return self.str() if present else None
+
+    def blob(self) -> bytes:
+        (length,) = self.unpack(_I32)
+        start = self.offset
+        self.offset += length
+        return bytes(self.data[start:self.offset])
+
+    def json(self) -> Any:
+        return json.loads(self.blob())
+
+    def strs(self) -> List[str]:
+        (count,) = self.unpack(_U16)
+        return [self.str() for _ in range(count)]
+
+
+def _write_minion(w: _Writer, m: BGMinion):
+    card_id, name, instance_id = m.card_id.encode("utf-8"), m.name.encode("utf-8"), m.instance_id.encode("utf-8")
+    keywords = KEYWORD_SEP.join(m.keywords).encode("utf-8")
+    flags = (m.is_golden | m.has_divine_shield << 1 | m.has_reborn << 2 | m.reborn_used << 3
+             | m.has_taunt << 4 | m.has_windfury << 5 | m.has_poisonous << 6 | m.has_deathrattle << 7)
+    w.buf += _MINION.pack(m.attack, m.health, m.base_attack, m.base_health, m.tier,
+                          -1 if m.slot is None else m.slot, flags, m.attacks_this_combat,
+                          len(card_id), len(name), len(instance_id), len(keywords))
+    w.buf += card_id + name + instance_id + keywords
+
+
+def _read_minion(r: _Reader) -> BGMinion:
+    (attack, health, base_attack, base_health, tier, slot, flags, attacks,
+     *lengths) = r.unpack(_MINION)
+    card_id, name, instance_id, keywords = r.texts(lengths)
+    minion = BGMinion(card_id=card_id, name=name, attack=attack, health=health,
+                      base_attack=base_attack, base_health=base_health, tier=tier,
+                      instance_id=instance_id, slot=None if slot < 0 else slot,
+                      keywords=keywords.split(KEYWORD_SEP) if keywords else [])
+    # Flags as saved, not as __post_init__ derives them from keywords (a popped shield stays popped)
+    minion.is_golden = bool(flags & 1)
+    minion.has_divine_shield = bool(flags & 2)
+    minion.has_reborn = bool(flags & 4)
+    minion.reborn_used = bool(flags & 8)
+    minion.has_taunt = bool(flags & 16)
+    minion.has_windfury = bool(flags & 32)
+    minion.has_poisonous = bool(flags & 64)
+    minion.has_deathrattle = bool(flags & 128)
+    minion.base_attack, minion.base_health = base_attack, base_health
+    minion.attacks_this_combat = attacks
+    return minion
+
+
+def _write_shop(w: _Writer, sm: ShopMinion):
+    card_id, name = sm.card_id.encode("utf-8"), sm.name.encode("utf-8")
+    keywords = KEYWORD_SEP.join(sm.keywords).encode("utf-8")
+    w.buf += _SHOP.pack(sm.slot, sm.attack, sm.health, sm.tier, sm.sim_tier, sm.cost, sm.frozen, sm.is_golden,
+                        len(card_id), len(name), len(keywords))
+    w.buf += card_id + name + keywords
+
+
+def _read_shop(r: _Reader) -> ShopMinion:
+    slot, attack, health, tier, sim_tier, cost, frozen, golden, *lengths = r.unpack(_SHOP)
+    card_id, name, keywords = r.texts(lengths)
+    return ShopMinion(slot=slot, card_id=card_id, name=name, attack=attack, health=health, tier=tier,
+                      sim_tier=sim_tier, cost=cost, frozen=frozen, is_golden=golden,
+                      keywords=keywords.split(KEYWORD_SEP) if keywords else [])
+
+
+def _write_list(w: _Writer, items: list, write_item: Callable):
+    w.pack(_U8, len(items))
+    for item in items:
+        write_item(w, item)
+
+
+def _read_list(r: _Reader, read_item: Callable) -> list:
+    (count,) = r.unpack(_U8)
+    return [read_item(r) for _ in range(count)]
+
+
+def _write_player(w: _Writer, p: BGPlayer):
+    w.str(p.player_id)
+    w.str(p.hero.card_id)
+    w.str(p.hero.name)
+    w.pack(_HERO, p.hero.health, p.hero.armor, p.hero.hero_power_cost, p.hero.hero_power_used)
+    w.pack(_PLAYER, p.health, p.armor, p.gold, p.max_gold, p.tavern_tier, p.upgrade_cost, p.refresh_cost,
+           p.timer_ms, p.shop_frozen, p.ready, -1 if p.placement is None else p.placement)
+    _write_list(w, p.board, _write_minion)
+    _write_list(w, p.hand, _write_minion)
+    w.pack(_U8, len(p.shop))
+    for sm in p.shop:
+        w.pack(_U8, sm is not None)
+        if sm is not None:
+            _write_shop(w, sm)
+    w.json(p.pending_discovers)
+    # Copies in the order they were tracked: it picks where the next triple's golden lands
+    w.pack(_U8, len(p.copies))
+    for same in p.copies.values():
+        w.strs(list(same))
+    w.pack(_U8, len(p.death_history))
+    for turn, records in p.death_history:
+        w.pack(_I32, turn)
+        w.pack(_U8, len(records))
+        for record in records.values():
+            instance_id, card_id = record.instance_id.encode("utf-8"), record.card_id.encode("utf-8")
+            w.buf += _DEATH.pack(record.attack, record.health, record.golden, len(instance_id), len(card_id))
+            w.buf += instance_id + card_id
+
+
+def _read_player(r: _Reader) -> BGPlayer:
+    player_id, hero_card_id, hero_name = r.str(), r.str(), r.str()
+    hero_health, hero_armor, hero_power_cost, hero_power_used = r.unpack(_HERO)
+    hero = Hero(card_id=hero_card_id, name=hero_name, health=hero_health, armor=hero_armor,
+                hero_power_cost=hero_power_cost, hero_power_used=hero_power_used)
+    (health, armor, gold, max_gold, tier, upgrade_cost, refresh_cost, timer_ms,
+     shop_frozen, ready, placement) = r.unpack(_PLAYER)
+    player = BGPlayer(player_id=player_id, hero=hero, health=health, armor=armor, gold=gold,
+                      max_gold=max_gold, tavern_tier=tier, upgrade_cost=upgrade_cost,
+                      refresh_cost=refresh_cost, timer_ms=timer_ms, shop_frozen=shop_frozen,
+                      ready=ready, placement=None if placement < 0 else placement)
+    player.board = _read_list(r, _read_minion)
+    player.hand = _read_list(r, _read_minion)
+    (shop_count,) = r.unpack(_U8)
+    for _ in range(shop_count):
+        (present,) = r.unpack(_U8)
+        player.shop.append(_read_shop(r) if present else None)
+    player.pending_discovers = r.json()
+    owned = {m.instance_id: m for m in player.board + player.hand}
+    (tracked,) = r.unpack(_U8)
+    for _ in range(tracked):
+        same = {instance_id: owned[instance_id] for instance_id in r.strs()}
+        if same:
+            player.copies[next(iter(same.values())).card_id] = same
+    (rounds,) = r.unpack(_U8)
+    history = deque(maxlen=DEATH_HISTORY)
+    for _ in range(rounds):
+        (turn,) = r.unpack(_I32)
+        (count,) = r.unpack(_U8)
+        records = {}
+        for _ in range(count):
+            attack, health, golden, *lengths = r.unpack(_DEATH)
+            instance_id, card_id = r.texts(lengths)
+            records[instance_id] = DeathRecord(instance_id, card_id, attack, health, golden)
+        history.append((turn, records))
+    player.death_history = history
+    return player
+
+
+def _write_ring(w: _Writer, ring: RingBuffer):
+    w.pack(_I32, ring.capacity)
+    w.pack(_I32, ring.total)
+    w.pack(_I32, ring.spilled)
+    w.blob("\n".join(ring.lines()).encode("utf-8"))
+
+
+def _read_ring(r: _Reader, spill_path: Optional[str]) -> RingBuffer:
+    (capacity,), (total,), (spilled,) = r.unpack(_I32), r.unpack(_I32), r.unpack(_I32)
+    ring = RingBuffer(capacity, spill_path)
+    lines = r.blob().decode("utf-8")
+    for line in lines.split("\n") if lines else ():
+        ring.append(json.loads(line))
+    ring.total, ring.spilled = total, spilled
+    return ring
+
+
+def _write_economy(w: _Writer, economy: TavernEconomy):
+    pool = economy.pool
+    w.strs([m.id for m in pool.minions])
+    w.blob(pool.counts.astype("<i4").tobytes())
+    w.json(pool.restocks)
+    w.json(economy.rng.bit_generator.state)
+    # Cached alias tables decide which minion a given rng draw lands on, so they are kept as built
+    tables = economy.discover.tables
+    w.pack(_U8, len(tables))
+    for tier, entry in tables.items():
+        w.pack(_U8, tier)
+        w.pack(_U8, entry is not None)
+        if entry is not None:
+            w.blob(entry.members.astype("<i4").tobytes())
+            w.blob(entry.weights.astype("<i4").tobytes())
+            w.pack(_I32, entry.restocks)
+    now = economy.discover.clock()
+    w.pack(_U16, len(economy.discover.pending))
+    for offer in economy.discover.pending.values():
+        w.str(offer.player_id)
+        w.str(offer.request_id)
+        w.strs([m.id for m in offer.options])
+        w.pack(_F64, offer.deadline - now)  # Deadlines are monotonic-clock times: store what is left
+
+
+def _read_economy(r: _Reader) -> TavernEconomy:
+    ids = r.strs()
+    counts = np.frombuffer(r.blob(), dtype="<i4")
+    minions = {m.id: m for m in load_minions()}
+    missing = [card_id for card_id in ids if card_id not in minions]
+    if missing:
+        raise SnapshotError(f"Snapshot pool has minions minions.json doesn't: {missing}")
+    pool = CardPool([minions[card_id] for card_id in ids])
+    pool.counts = counts.astype(pool.counts.dtype)
+    pool.tier_counts = {tier: int(pool.counts[members].sum()) for tier, members in pool.by_tier.items()}
+    pool.restocks = {int(tier): restocks for tier, restocks in r.json().items()}
+
+    economy = TavernEconomy(pool)
+    economy.rng.bit_generator.state = r.json()
+    discover = economy.discover
+    (tables,) = r.unpack(_U8)
+    for _ in range(tables):
+        (tier,), (present,) = r.unpack(_U8), r.unpack(_U8)
+        if not present:
+            discover.tables[tier] = None
+            continue
+        members = np.frombuffer(r.blob(), dtype="<i4").astype(pool.by_tier[tier].dtype)
+        weights = np.frombuffer(r.blob(), dtype="<i4").astype(pool.counts.dtype)
+        (restocks,) = r.unpack(_I32)
+        discover.tables[tier] = TierTable(AliasTable(weights.tolist()), members, weights,
+                                          int(weights.sum()), restocks)
+    now = discover.clock()
+    (pending,) = r.unpack(_U16)
+    for _ in range(pending):
+        player_id, request_id = r.str(), r.str()
+        options = [pool.minions[pool.index[card_id]] for card_id in r.strs()]
+        (left,) = r.unpack(_F64)
+        discover.pending[request_id] = PendingOffer(player_id, request_id, options, now + left)
+    return economy
+
+
+def _write_scheduler(w: _Writer, scheduler: PairingScheduler):
+    w.strs(scheduler.player_ids)
+    w.strs(scheduler.eliminated)
+    w.pack(_I32, scheduler.round)
+    w.json([[sorted(pair), met] for pair, met in scheduler.last_met.items()])
+    w.json([[list(p) for p in pairings] for pairings in scheduler.history])
+    version, internal, gauss = scheduler.rng.getstate()
+    w.pack(_U8, version)
+    w.blob(array("I", internal).tobytes())
+    w.json(gauss)
+
+
+def _read_scheduler(r: _Reader) -> PairingScheduler:
+    scheduler = PairingScheduler(r.strs())
+    scheduler.eliminated = r.strs()
+    (scheduler.round,) = r.unpack(_I32)
+    scheduler.last_met = {frozenset(pair): met for pair, met in r.json()}
+    scheduler.history = [[Pairing(*p) for p in pairings] for pairings in r.json()]
+    (version,) = r.unpack(_U8)
+    internal = tuple(array("I", r.blob()))
+    scheduler.rng.setstate((version, internal, r.json()))
+    return scheduler
+
+
+def save_state(state: GameState) -> bytes:
+    """Serialize a whole match: header (magic, version, length, crc32) then the body"""
+    w = _Writer()
+    w.pack(_STATE, _PHASES.index(state.phase), state.turn, state.combat_index, state.winner is not None)
+    w.str(state.match_id)
+    w.str(state.log_id)
+    w.str(state.current_player_id)
+    w.str(state.first_attacker)
+    if state.winner is not None:
+        w.str(state.winner)
+    w.strs(state.pairing)
+    w.json([list(p) for p in state.pairings])
+    _write_list(w, list(state.players.values()), _write_player)
+    _write_ring(w, state.event_log)
+    _write_ring(w, state.combat_log)
+    w.json(list(state.action_queue))
+    w.json(state.round_results)
+
+    w.pack(_U8, (state.economy is not None) | (state.scheduler is not None) << 1)
+    if state.economy is not None:
+        _write_economy(w, state.economy)
+    if state.scheduler is not None:
+        _write_scheduler(w, state.scheduler)
+
+    body = bytes(w.buf)
+    return _HEADER.pack(MAGIC, SNAPSHOT_VERSION, len(body), zlib.crc32(body)) + body
+
+
+def load_state(data: bytes) -> GameState:
+    """Rebuild a match from save_state() output, refusing unknown versions and damaged data"""
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Snapshot is shorter than its header")
+    magic, version, length, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError(f"Not a match snapshot (magic {magic!r})")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Snapshot version {version} is not supported (expected {SNAPSHOT_VERSION})")
+    body = bytes(data[_HEADER.size:_HEADER.size + length])
+    if len(body) != length or zlib.crc32(body) != crc:
+        raise SnapshotError("Snapshot body is truncated or corrupt")
+
+    r = _Reader(body)
+    phase, turn, combat_index, has_winner = r.unpack(_STATE)
+    match_id, log_id = r.str(), r.str()
+    state = GameState(match_id=match_id, log_id=log_id, phase=_PHASES[phase], turn=turn,
+                      combat_index=combat_index, current_player_id=r.str(), first_attacker=r.str())
+    state.winner = r.str() if has_winner else None
+    state.pairing = r.strs()
+    state.pairings = [Pairing(*p) for p in r.json()]
+    for player in _read_list(r, _read_player):
+        state.players[player.player_id] = player
+    state.event_log = _read_ring(r, None)
+    state.combat_log = _read_ring(r, state.log_path("combat_log"))
+    state.action_queue.extend(r.json())
+    state.round_results = r.json()
+
+    (parts,) = r.unpack(_U8)
+    if parts & 1:
+        state.economy = _read_economy(r)
+    if parts & 2:
+        state.scheduler = _read_scheduler(r)
+    return state
@@ -0,0 +1,72 @@
+"""
+Benchmark for sound effect playback under combat bursts
+
+Fires a burst of attack sounds followed by a victory fanfare, first the old
+way (Sound.play() on whatever channel is free) and then through the audio
+service's per-category priority allocator, and reports play() latency and
+how many sounds were dropped.
+
+Usage:
+    python benchmark_audio.py [buffer_size]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from hearthstone.gui.audio_service import configure_audio, get_audio_service
+from hearthstone.gui.sound_manager import get_sound_manager
+
+BURST = 40
+
+
+def legacy_burst(sounds):
+    """Every effect on the default pool of 8 shared channels"""
+    pygame.mixer.set_reserved(0)
+    pygame.mixer.set_num_channels(8)
+    dropped = 0
+    latencies = []
+    for _ in range(BURST):
+        start = time.perf_counter()
+        if sounds['attack'].play() is None:
+            dropped += 1
+        latencies.append(time.perf_counter() - start)
+    victory_played = sounds['victory'].play() is not None
+    pygame.mixer.stop()
+    return dropped, victory_played, latencies
+
+
+def main():
+    if len(sys.argv) > 1:
+        configure_audio(buffer=int(sys.argv[1]))
+    audio = get_audio_service()
+    sound_manager = get_sound_manager()
+    print(f"Mixer {pygame.mixer.get_init()}, buffer {audio.buffer} frames "
+          f"({audio.buffer_latency * 1000:.1f} ms)")
+
+    # Old behavior: Sound.play() picks any free channel, nothing reserved
+    dropped, victory_played, latencies = legacy_burst(sound_manager.sounds)
+    print(f"\nSound.play():     {BURST} attacks, {dropped} dropped, "
+          f"victory {'played' if victory_played else 'DROPPED'}, "
+          f"mean {sum(latencies) / len(latencies) * 1000:.3f} ms")
+
+    # Audio service: restore its channel layout and go through the allocator
+    pygame.mixer.set_num_channels(audio.allocator.total)
+    pygame.mixer.set_reserved(audio.allocator.total)
+    for _ in range(BURST):
+        sound_manager.play('attack')
+    victory = audio.play(sound_manager.sounds['victory'], 'game', 3)
+    report = audio.latency_report()
+    print(f"AudioService:     {BURST} attacks, {report['dropped']} dropped, "
+          f"victory {'played' if victory else 'DROPPED'}, "
+          f"mean {report['dispatch_mean_ms']:.3f} ms")
+    print(f"  dispatch p95 {report['dispatch_p95_ms']:.3f} ms, max {report['dispatch_max_ms']:.3f} ms, "
+          f"heard after ~{report['total_p95_ms']:.1f} ms (p95 + device buffer)")
+    pygame.mixer.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark for card art white-border cropping
+
+Times the old row/column loop scan against CardArtManager's NumPy crop box
+search over a directory of card images, and checks both find the same box.
+
+Usage:
+    python benchmark_card_art.py [image_dir]
+
+With no directory (or an empty one) a set of synthetic bordered cards is
+generated in a temporary folder so the benchmark always has input.
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import threading
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from hearthstone.gui.card_art_manager import CardArtManager
+
+
+def legacy_crop_box(surface):
+    """The original per-row/per-column scan, kept here for comparison"""
+    width, height = surface.get_size()
+    pixels = pygame.surfarray.array3d(surface)
+    WHITE_THRESHOLD = 240
+
+    top = 0
+    for y in range(height):
+        if not (pixels[:, y, :] >= WHITE_THRESHOLD).all():
+            top = y
+            break
+    bottom = height - 1
+    for y in range(height - 1, -1, -1):
+        if not (pixels[:, y, :] >= WHITE_THRESHOLD).all():
+            bottom = y
+            break
+    left = 0
+    for x in range(width):
+        if not (pixels[x, :, :] >= WHITE_THRESHOLD).all():
+            left = x
+            break
+    right = width - 1
+    for x in range(width - 1, -1, -1):
+        if not (pixels[x, :, :] >= WHITE_THRESHOLD).all():
+            right = x
+            break
+
+    # An all-white image "crops" to itself; report that as no crop like the new code does
+    if right > left and bottom > top and (right - left + 1, bottom - top + 1) != (width, height):
+        return (left, top, right - left + 1, bottom - top + 1)
+    return None
+
+
+def make_samples(directory, count=60):
+    """Write synthetic 512x700 cards with random white margins"""
+    for i in range(count):
+        surface = pygame.Surface((512, 700))
+        surface.fill((255, 255, 255))
+        margin_x = random.randint(10, 80)
+        margin_y = random.randint(10, 80)
+        art = pygame.Rect(margin_x, margin_y, 512 - 2 * margin_x, 700 - 2 * margin_y)
+        surface.fill((random.randint(0, 200), random.randint(0, 200), random.randint(0, 200)), art)
+        pygame.image.save(surface, os.path.join(directory, f"sample_{i:03d}.png"))
+
+
+def main():
+    pygame.init()
+    image_dir = sys.argv[1] if len(sys.argv) > 1 else "Cards"
+    files = []
+    if os.path.isdir(image_dir):
+        files = [os.path.join(image_dir, f) for f in sorted(os.listdir(image_dir)) if f.endswith('.png')]
+
+    temp_dir = None
+    if not files:
+        temp_dir = tempfile.TemporaryDirectory()
+        print(f"No PNGs in '{image_dir}', generating synthetic samples...")
+        make_samples(temp_dir.name)
+        files = [os.path.join(temp_dir.name, f) for f in sorted(os.listdir(temp_dir.name))]
+
+    surfaces = [pygame.image.load(f) for f in files]
+    print(f"Benchmarking {len(surfaces)} images")
+
+    # Build a manager without running the folder scans
+    manager = CardArtManager.__new__(CardArtManager)
+    manager.cache_directory = tempfile.mkdtemp()
+    manager.crop_cache_file = os.path.join(manager.cache_directory, "crop_boxes.json")
+    manager.crop_boxes = {}
+    manager._crop_boxes_dirty = False
+    manager._crop_lock = threading.Lock()
+
+    start = time.perf_counter()
+    legacy = [legacy_crop_box(s) for s in surfaces]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = [manager._find_crop_box(s) for s in surfaces]
+    vectorized_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for path, surface in zip(files, surfaces):
+        manager._crop_white_borders(surface, path)
+    first_pass = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for path, surface in zip(files, surfaces):
+        manager._crop_white_borders(surface, path)
+    cached_pass = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, vectorized) if a != b)
+
+    print(f"  legacy loop scan:     {legacy_time * 1000:8.1f} ms")
+    print(f"  vectorized scan:      {vectorized_time * 1000:8.1f} ms  ({legacy_time / max(vectorized_time, 1e-9):.1f}x)")
+    print(f"  crop (box computed):  {first_pass * 1000:8.1f} ms")
+    print(f"  crop (box cached):    {cached_pass * 1000:8.1f} ms")
+    print(f"  mismatched boxes:     {mismatches}")
+
+    if temp_dir:
+        temp_dir.cleanup()
+    pygame.quit()
+    return mismatches == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
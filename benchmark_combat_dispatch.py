@@ -0,0 +1,88 @@
+"""
+Benchmark for resolving a combat round across many lobbies at once
+
+Builds 8-player lobbies with random boards from the minion pool, pairs a
+round in each, then resolves every fight with CombatDispatcher: first in
+this process, then on a process pool. Both runs must produce the same
+digests. Also compares the size of a packed board with a pickled one.
+
+Usage:
+    python benchmark_combat_dispatch.py [lobbies] [workers]
+"""
+
+import os
+import pickle
+import random
+import sys
+import time
+
+from battlegrounds.dispatch import CombatDispatcher, pack_board
+from battlegrounds.economy import load_minions
+from battlegrounds.game_state import GamePhase, GameState
+from battlegrounds.minion import BGMinion
+from battlegrounds.player import BGPlayer
+
+PLAYERS = 8
+
+
+def build_lobbies(count):
+    """Mid-game lobbies: tavern tier 2-5, three to seven minions each with some buffs"""
+    rng = random.Random(0)
+    minions = load_minions()
+    lobbies = []
+    for lobby in range(count):
+        state = GameState(match_id=f"match-{lobby:05d}", phase=GamePhase.COMBAT, turn=rng.randint(4, 12))
+        for seat in range(PLAYERS):
+            tier = rng.randint(2, 5)
+            player = BGPlayer(player_id=f"p{seat + 1}", hero="Hero", tavern_tier=tier)
+            for _ in range(rng.randint(3, 7)):
+                m = rng.choice([m for m in minions if m.tier <= tier])
+                minion = BGMinion(card_id=m.id, name=m.name, attack=m.attack, health=m.health,
+                                  tier=m.tier, keywords=list(m.keywords), is_golden=rng.random() < 0.1)
+                minion.buff(rng.randint(0, 6), rng.randint(0, 6))
+                player.add_to_board(minion)
+            state.players[player.player_id] = player
+        state.pair_round()
+        lobbies.append(state)
+    return lobbies
+
+
+def timed_round(dispatcher, lobbies):
+    for state in lobbies:
+        state.action_queue.clear()
+    start = time.perf_counter()
+    fights = dispatcher.resolve(lobbies)
+    elapsed = time.perf_counter() - start
+    digests = [result["digest"] for state in lobbies for result in state.action_queue]
+    return fights, elapsed, digests
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    lobbies = build_lobbies(count)
+
+    board = lobbies[0].players["p1"].board
+    packed, pickled = len(pack_board(board)), len(pickle.dumps(board))
+    print(f"{count} lobbies of {PLAYERS}, {len(board)}-minion board: "
+          f"{packed} bytes packed vs {pickled} pickled ({pickled / packed:.1f}x)")
+
+    serial = CombatDispatcher(workers=1)
+    fights, serial_time, expected = timed_round(serial, lobbies)
+    print(f"{'in process':>16}: {fights} fights in {serial_time * 1000:7.0f} ms  ({fights / serial_time:8.0f} fights/s)")
+
+    pool = CombatDispatcher(workers=workers)
+    timed_round(pool, lobbies[:1])  # Start the workers outside the timing
+    fights, pool_time, digests = timed_round(pool, lobbies)
+    pool.shutdown()
+    assert digests == expected, "pool results differ from in-process results"
+    print(f"{f'{workers} workers':>16}: {fights} fights in {pool_time * 1000:7.0f} ms  ({fights / pool_time:8.0f} fights/s)")
+    print("✅ Every digest matches the in-process run")
+
+    # The queue holds each lobby's combat_result messages, ready for the match loop
+    sample = lobbies[0].action_queue[0]
+    print(f"Sample: {sample['pairing']} -> damage {sample['damage']}, {sample['digest'][:23]}...")
+
+
+if __name__ == "__main__":
+    main()
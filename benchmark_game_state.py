@@ -0,0 +1,130 @@
+"""
+Benchmark for trying moves during search: snapshot/restore vs copy.deepcopy
+
+Builds mid-game positions with the simulation bot, then tries every move in
+each position, first by cloning the game with copy.deepcopy and playing the
+move on the clone, then by playing it on the game itself and rolling it back
+with Game.restore(). Every restore is checked against the original position.
+
+Usage:
+    python benchmark_game_state.py [positions]
+"""
+
+import copy
+import random
+import sys
+import time
+
+from hearthstone.card import MinionCard
+from hearthstone.game import Game
+from hearthstone.player import Player
+from hearthstone.spell import SpellCard
+from hearthstone.simulation import DECKS, choose_attack_target, choose_spell_target, take_turn
+
+ROUNDS = 5
+
+
+def build_positions(count):
+    """Headless aggro vs control games stopped somewhere between turn 4 and 14"""
+    positions = []
+    for seed in range(count):
+        random.seed(seed)
+        game = Game(Player("aggro", DECKS['aggro']()), Player("control", DECKS['control']()), headless=True)
+        game.start_game()
+        game.play_turn()
+        stop = random.randint(4, 14)
+        while not game.game_over and game.turn_count < stop:
+            take_turn(game)
+            if not game.game_over:
+                game.end_turn()
+                game.play_turn()
+        if not game.game_over:
+            positions.append(game)
+    return positions
+
+
+def moves_for(game):
+    """Every card that can be paid for, every minion attack and ending the turn"""
+    player = game.current_player
+    moves = [('play', i) for i, card in enumerate(player.hand) if card.can_play(player)]
+    moves += [('attack', i) for i, minion in enumerate(player.board) if minion.can_attack_now()]
+    moves.append(('end', 0))
+    return moves
+
+
+def apply_move(game, move):
+    kind, index = move
+    if kind == 'play':
+        card = game.current_player.hand[index]
+        if isinstance(card, SpellCard):
+            target = choose_spell_target(game, card)
+        elif isinstance(card, MinionCard):
+            target = game.get_opponent(game.current_player)
+        else:
+            target = None
+        game.play_card(index, target)
+    elif kind == 'attack':
+        game.attack_with_minion(index, choose_attack_target(game))
+    else:
+        game.end_turn()
+        if not game.game_over:
+            game.play_turn()
+
+
+def fingerprint(game):
+    """Everything a move can change, by value and by object identity"""
+    def player_state(player):
+        return (player.health, player.armor, player.mana, player.max_mana, player.fatigue_damage,
+                player.hero_power_used, player.hero_attacks_this_turn,
+                id(player.weapon), player.weapon.durability if player.weapon else None,
+                [id(card) for card in player.deck], [id(card) for card in player.hand],
+                [(id(minion), sorted(vars(minion).items())) for minion in player.board])
+    return (id(game.current_player), game.turn_count, game.game_over, id(game.winner),
+            player_state(game.player1), player_state(game.player2))
+
+
+def run_deepcopy(positions, moves):
+    for game, game_moves in zip(positions, moves):
+        for move in game_moves:
+            apply_move(copy.deepcopy(game), move)
+
+
+def run_snapshot(positions, moves):
+    for game, game_moves in zip(positions, moves):
+        snapshot = game.snapshot()
+        for move in game_moves:
+            apply_move(game, move)
+            game.restore(snapshot)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    positions = build_positions(count)
+    moves = [moves_for(game) for game in positions]
+    total = sum(len(game_moves) for game_moves in moves) * ROUNDS
+    print(f"{len(positions)} positions, {total // ROUNDS} moves each round, {ROUNDS} rounds")
+
+    # Restores must land exactly on the original position
+    expected = [fingerprint(game) for game in positions]
+    for game, game_moves, before in zip(positions, moves, expected):
+        snapshot = game.snapshot()
+        for move in game_moves:
+            apply_move(game, move)
+            game.restore(snapshot)
+            assert fingerprint(game) == before, f"restore after {move} differs"
+    print("✅ Every restore matches its original position")
+
+    results = {}
+    for label, runner in (("deepcopy + move", run_deepcopy), ("make + unmake", run_snapshot)):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            runner(positions, moves)
+        elapsed = time.perf_counter() - start
+        results[label] = total / elapsed
+        print(f"{label:>16}: {total / elapsed:10.0f} moves/s  ({elapsed * 1e6 / total:6.1f} us per move)")
+
+    print(f"Speedup: {results['make + unmake'] / results['deepcopy + move']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
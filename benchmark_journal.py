@@ -0,0 +1,109 @@
+"""
+Benchmark for the match journal's write-ahead log
+
+Bots play many 8-player matches through a MatchJournal, committing once per
+turn across all matches. Reports journal throughput in actions per second:
+the time spent logging (encoding, writing, syncing, compacting), apart from
+the game logic itself. Then replays part of the same log with a commit after
+every action to show what batching the fsyncs buys, and times a full
+recovery of every match.
+
+Usage:
+    python benchmark_journal.py [matches] [turns]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from battlegrounds.journal import MatchJournal
+from test_journal import cleanup, new_match, play_turn
+
+SINGLE_COMMIT_ACTIONS = 2000
+
+
+class TimedJournal(MatchJournal):
+    """Keeps the time spent in logging, and every record appended, for the replay below"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log_time = 0.0
+        self.records = []
+
+    def append(self, match_id, seed, action):
+        start = time.perf_counter()
+        super().append(match_id, seed, action)
+        self.log_time += time.perf_counter() - start
+        self.records.append((match_id, seed, action))
+
+    def commit(self):
+        start = time.perf_counter()
+        count = super().commit()
+        self.log_time += time.perf_counter() - start
+        return count
+
+
+def replay_stream(directory, records, states, batch):
+    """Append a recorded stream to a fresh journal, committing every batch records"""
+    journal = MatchJournal(directory)
+    for state in states:
+        journal.open(state)
+    start = time.perf_counter()
+    for i, (match_id, seed, action) in enumerate(records, 1):
+        journal.append(match_id, seed, action)
+        if i % batch == 0:
+            journal.commit()
+    journal.commit()
+    elapsed = time.perf_counter() - start
+    journal.shutdown()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    directory = tempfile.mkdtemp(prefix="journal-bench-")
+    prefix = f"bench-{os.getpid()}"
+    try:
+        journal = TimedJournal(os.path.join(directory, "live"), rng=random.Random(0))
+        for i in range(count):
+            journal.open(new_match(f"{prefix}-{i}"))
+        rng = random.Random(1)
+        start = time.perf_counter()
+        for _ in range(turns):
+            play_turn(journal, rng)
+            journal.commit()
+        total = time.perf_counter() - start
+        journal.shutdown()
+
+        actions = journal.committed
+        size = sum(os.path.getsize(os.path.join(journal.directory, name)) for name in os.listdir(journal.directory))
+        print(f"{count} matches, {turns} turns: {actions} actions in {journal.commits} commits, "
+              f"{size / 1024:.0f} KB on disk")
+        print(f"{'journal':>16}: {journal.log_time * 1000:7.0f} ms  ({actions / journal.log_time:8.0f} actions/s)")
+        print(f"{'with game logic':>16}: {total * 1000:7.0f} ms  ({actions / total:8.0f} actions/s)")
+
+        # The same opening records, synced one at a time and in one batch per turn's worth
+        records = journal.records[:SINGLE_COMMIT_ACTIONS]
+        states = [new_match(f"{prefix}-{i}") for i in range(count)]
+        single = replay_stream(os.path.join(directory, "single"), records, states, 1)
+        batched = replay_stream(os.path.join(directory, "batched"), records, states, max(1, actions // journal.commits))
+        print(f"{'fsync per action':>16}: {len(records) / single:8.0f} actions/s")
+        print(f"{'fsync per batch':>16}: {len(records) / batched:8.0f} actions/s  ({single / batched:.1f}x)")
+
+        start = time.perf_counter()
+        recovered = MatchJournal.recover(journal.directory)
+        elapsed = time.perf_counter() - start
+        assert recovered.seq == journal.seq, "recovery came back at different seqs"
+        recovered.shutdown()
+        print(f"{'recovery':>16}: {elapsed * 1000:7.0f} ms for {count} matches ({elapsed / count * 1000:.1f} ms each)")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        cleanup(prefix)
+
+
+if __name__ == "__main__":
+    main()
@@ -47,7 +47,7 @@ class MinionCard(Card):
     def play(self, owner: 'Player', game: 'Game', target=None) -> bool:
         from .minion import Minion
         if len(owner.board) >= 7:
-            game.add_log(f"Board is full!")
+            game.add_log("Board is full!")
             return False
         
         minion = Minion(
@@ -59,7 +59,7 @@ class MinionCard(Card):
         owner.board.append(minion)
         owner.mana -= self.mana_cost
         
-        game.add_log(f"{owner.name} plays {self.name}")
+        game.add_log("{} plays {}", owner.name, self.name)
         
         if self.battlecry:
             self.battlecry(owner, game, target)
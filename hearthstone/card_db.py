@@ -0,0 +1,129 @@
+"""
+Card Database - Every card defined once in cards.json, loaded into a registry
+Definitions are immutable and keyed by id; effect opcodes are resolved to
+their functions when the file is loaded, so playing a card is a direct call
+"""
+
+import json
+import os
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .card import Card, MinionCard
+from .spell import SpellCard, WeaponCard
+
+
+CARD_DATA_PATH = os.path.join(os.path.dirname(__file__), "cards.json")
+
+# Keyword flags a minion definition can list
+KEYWORDS = ('taunt', 'charge', 'divine_shield', 'windfury', 'stealth', 'poisonous', 'lifesteal')
+
+
+class CardDefinition(NamedTuple):
+    """One entry of cards.json"""
+    id: str
+    set: str                          # basic, special, legendary, spell or weapon
+    type: str                         # minion, spell or weapon
+    name: str
+    cost: int
+    attack: int = 0
+    health: int = 0
+    durability: int = 0
+    keywords: Tuple[str, ...] = ()
+    text: str = ""
+    rarity: str = "Common"
+    effect: Optional[str] = None      # Spell opcode
+    battlecry: Optional[str] = None   # Opcodes for minions and weapons
+    deathrattle: Optional[str] = None
+    requires_target: bool = False
+    target_type: str = "any"
+
+
+class CardDatabase:
+    """Card definitions and one shared Card object per id
+
+    The Card objects are built once, here, and handed out as-is: nothing in
+    the engine modifies a card after it is created (minions and weapons in
+    play are separate objects), so a deck is just a list of references.
+    """
+
+    def __init__(self, path: str, opcodes: Mapping[str, Callable]):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        definitions = {}
+        sets = {}
+        for entry in data["cards"]:
+            if 'keywords' in entry:
+                entry = dict(entry, keywords=tuple(entry['keywords']))
+            definition = CardDefinition(**entry)
+            if definition.id in definitions:
+                raise ValueError(f"Duplicate card id in {path}: {definition.id}")
+            definitions[definition.id] = definition
+            sets.setdefault(definition.set, []).append(definition.id)
+
+        self.definitions: Mapping[str, CardDefinition] = MappingProxyType(definitions)
+        self.sets: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {name: tuple(ids) for name, ids in sets.items()})
+        self.cards: Mapping[str, Card] = MappingProxyType(
+            {card_id: self._build(definition, opcodes) for card_id, definition in definitions.items()})
+
+    @staticmethod
+    def _build(definition: CardDefinition, opcodes: Mapping[str, Callable]) -> Card:
+        """Create the Card for a definition, resolving its opcodes"""
+        def resolve(opcode: Optional[str]) -> Optional[Callable]:
+            if opcode is None:
+                return None
+            if opcode not in opcodes:
+                raise ValueError(f"Card {definition.id} uses unknown opcode: {opcode}")
+            return opcodes[opcode]
+
+        if definition.type == 'minion':
+            unknown = set(definition.keywords) - set(KEYWORDS)
+            if unknown:
+                raise ValueError(f"Card {definition.id} has unknown keywords: {sorted(unknown)}")
+            return MinionCard(definition.name, definition.cost, definition.attack, definition.health,
+                              definition.text, definition.rarity,
+                              battlecry=resolve(definition.battlecry),
+                              deathrattle=resolve(definition.deathrattle),
+                              **{keyword: True for keyword in definition.keywords})
+        if definition.type == 'spell':
+            return SpellCard(definition.name, definition.cost, resolve(definition.effect),
+                             definition.text, definition.rarity,
+                             definition.requires_target, definition.target_type)
+        if definition.type == 'weapon':
+            return WeaponCard(definition.name, definition.cost, definition.attack, definition.durability,
+                              definition.text, definition.rarity,
+                              resolve(definition.battlecry), resolve(definition.deathrattle))
+        raise ValueError(f"Card {definition.id} has unknown type: {definition.type}")
+
+    def __contains__(self, card_id: str) -> bool:
+        return card_id in self.cards
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def card(self, card_id: str) -> Card:
+        return self.cards[card_id]
+
+    def ids(self, *sets: str) -> List[str]:
+        """Ids of every card in the given sets, in file order"""
+        return [card_id for name in sets for card_id in self.sets.get(name, ())]
+
+    def deck(self, card_ids: Iterable[str]) -> List[Card]:
+        """Cards for a list of ids, ready to hand to Player"""
+        cards = self.cards
+        return [cards[card_id] for card_id in card_ids]
+
+
+# Global card database instance
+_card_db: Optional[CardDatabase] = None
+
+
+def get_card_db() -> CardDatabase:
+    """Get the global card database, loading cards.json on first use"""
+    global _card_db
+    if _card_db is None:
+        from .cards_collection import OPCODES
+        _card_db = CardDatabase(CARD_DATA_PATH, OPCODES)
+    return _card_db
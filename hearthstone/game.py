@@ -1,28 +1,84 @@
-from typing import Optional, List, Callable
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import Optional, List, Callable, Deque, Tuple, Iterator, NamedTuple
 from .player import Player
 from .minion import Minion
+from .card import MinionCard
+from .spell import SpellCard
+from .cards_collection import TARGETED_HERO_POWERS
+from .card_db import get_card_db
+
+
+class Action(NamedTuple):
+    """One move for the current player, as produced by Game.legal_actions()
+
+    kind is 'play' (index into the hand), 'attack' (index into the board),
+    'hero_attack', 'hero_power' or 'end_turn'; target is a Player, a Minion
+    or None.
+    """
+    kind: str
+    index: Optional[int] = None
+    target: object = None
 
 
 class Game:
-    def __init__(self, player1: Player, player2: Player):
+    def __init__(self, player1: Player, player2: Player, headless: bool = False,
+                 max_log_entries: int = 100):
         self.player1 = player1
         self.player2 = player2
         self.current_player = player1
         self.turn_count = 0
         self.game_over = False
         self.winner = None
-        self.game_log: List[str] = []
-        self.max_log_entries = 100
+        # Entries are (template, args) and only formatted when read; a
+        # headless game (simulations, AI search) doesn't log at all
+        self.headless = headless
+        self.max_log_entries = max_log_entries
+        self.game_log: Deque[Tuple[str, tuple]] = deque(maxlen=max_log_entries)
 
-    def add_log(self, message: str):
-        """Add a message to the game log"""
-        self.game_log.append(message)
-        if len(self.game_log) > self.max_log_entries:
-            self.game_log.pop(0)
+    def add_log(self, message: str, *args):
+        """Add a message to the game log, message.format(*args) is done lazily"""
+        if not self.headless:
+            self.game_log.append((message, args))
 
     def get_recent_log(self, count: int = 10) -> List[str]:
         """Get the most recent log entries"""
-        return self.game_log[-count:]
+        recent = list(islice(reversed(self.game_log), count))
+        return [message.format(*args) if args else message
+                for message, args in reversed(recent)]
+
+    def snapshot(self) -> tuple:
+        """Capture the game so a move can be tried and rolled back with restore()
+
+        Far cheaper than copy.deepcopy: only attribute dicts, the card lists and
+        the minions in play are copied. Objects keep their identity across a
+        restore. The random module's state is not part of the snapshot.
+        """
+        minions = [(minion, minion.snapshot()) for minion in self.player1.board + self.player2.board]
+        log = None if self.headless else list(self.game_log)
+        return self.__dict__.copy(), self.player1.snapshot(), self.player2.snapshot(), minions, log
+
+    def restore(self, snapshot: tuple):
+        """Put the game back the way it was when snapshot() was taken (it can be reused)"""
+        attributes, player1, player2, minions, log = snapshot
+        self.__dict__.update(attributes)
+        self.player1.restore(player1)
+        self.player2.restore(player2)
+        for minion, state in minions:
+            minion.restore(state)
+        if log is not None:
+            self.game_log.clear()
+            self.game_log.extend(log)
+
+    @contextmanager
+    def trial(self):
+        """Undo everything done inside the block: `with game.trial(): game.play_card(0)`"""
+        snapshot = self.snapshot()
+        try:
+            yield self
+        finally:
+            self.restore(snapshot)
 
     def get_opponent(self, player: Player) -> Player:
         return self.player2 if player == self.player1 else self.player1
@@ -41,15 +97,12 @@ class Game:
                 card = self.player2.deck.pop()
                 self.player2.hand.append(card)
         
-        self.add_log(f"{self.player1.name} draws 3 cards")
-        self.add_log(f"{self.player2.name} draws 4 cards")
+        self.add_log("{} draws 3 cards", self.player1.name)
+        self.add_log("{} draws 4 cards", self.player2.name)
         
         # Give coin to second player
-        from .spell import SpellCard
-        from .cards_collection import coin_effect
-        coin = SpellCard("The Coin", 0, coin_effect, "Gain 1 mana crystal this turn")
-        self.player2.hand.append(coin)
-        self.add_log(f"{self.player2.name} receives The Coin!")
+        self.player2.hand.append(get_card_db().card('the_coin'))
+        self.add_log("{} receives The Coin!", self.player2.name)
 
     def play_turn(self):
         self.current_player.start_turn(self)
@@ -66,7 +119,7 @@ class Game:
             # Switch players
             self.current_player = self.get_opponent(self.current_player)
             self.turn_count += 1
-            self.add_log(f"Turn {self.turn_count + 1}")
+            self.add_log("Turn {}", self.turn_count + 1)
 
     def check_game_over(self):
         if self.player1.is_dead() and self.player2.is_dead():
@@ -76,11 +129,11 @@ class Game:
         elif self.player1.is_dead():
             self.game_over = True
             self.winner = self.player2
-            self.add_log(f"=== {self.player2.name} WINS! ===")
+            self.add_log("=== {} WINS! ===", self.player2.name)
         elif self.player2.is_dead():
             self.game_over = True
             self.winner = self.player1
-            self.add_log(f"=== {self.player1.name} WINS! ===")
+            self.add_log("=== {} WINS! ===", self.player1.name)
 
     def play_card(self, card_index: int, target=None) -> bool:
         if card_index < 0 or card_index >= len(self.current_player.hand):
@@ -90,7 +143,7 @@ class Game:
         card = self.current_player.hand[card_index]
         
         if not card.can_play(self.current_player):
-            self.add_log(f"Not enough mana! Need {card.mana_cost}, have {self.current_player.mana}")
+            self.add_log("Not enough mana! Need {}, have {}", card.mana_cost, self.current_player.mana)
             return False
         
         if card.play(self.current_player, self, target):
@@ -158,24 +211,109 @@ class Game:
         return result
 
     def use_hero_power(self, target=None) -> bool:
-        return self.current_player.use_hero_power(self, target)
+        result = self.current_player.use_hero_power(self, target)
+        
+        self.player1.remove_dead_minions(self)
+        self.player2.remove_dead_minions(self)
+        self.check_game_over()
+        
+        return result
 
     def get_valid_targets(self, for_spell=False, target_type: str = "any") -> list:
         """Get all valid targets for spells or battlecries"""
-        targets = []
         opponent = self.get_opponent(self.current_player)
-        
-        if target_type in ["any", "hero", "enemy"]:
+        visible = [m for m in opponent.board if not m.stealth]
+        return self._targets(target_type, self.current_player, opponent, visible)
+
+    @staticmethod
+    def _targets(target_type: str, player: Player, opponent: Player, visible: List[Minion]) -> list:
+        """Targets of a given type, from the opponent's minions that aren't in stealth"""
+        targets = []
+        if target_type in ("any", "hero", "enemy"):
             targets.append(opponent)
-        if target_type in ["any", "hero", "friendly"]:
-            targets.append(self.current_player)
-        
-        if target_type in ["any", "minion", "enemy", "enemy_minion"]:
-            for m in opponent.board:
-                if not m.stealth or target_type == "friendly":
-                    targets.append(m)
-        
-        if target_type in ["any", "minion", "friendly", "friendly_minion"]:
-            targets.extend(self.current_player.board)
-        
+        if target_type in ("any", "hero", "friendly"):
+            targets.append(player)
+        if target_type in ("any", "minion", "enemy", "enemy_minion"):
+            targets.extend(visible)
+        if target_type in ("any", "minion", "friendly", "friendly_minion"):
+            targets.extend(player.board)
         return targets
+
+    def legal_actions(self) -> Iterator[Action]:
+        """Every move the current player can make: cards with their targets, attacks,
+        hero power, and end turn (always last)
+
+        Both boards are scanned once for stealth and taunt, and the target
+        lists built from that are shared by every card and attacker. Apply at
+        most one of the actions before asking again; the rest go stale.
+        """
+        if self.game_over:
+            return
+        player = self.current_player
+        opponent = self.get_opponent(player)
+
+        visible = [m for m in opponent.board if not m.stealth]
+        taunts = [m for m in visible if m.taunt]
+        attack_targets = taunts or [opponent] + visible
+        targets_by_type = {}
+
+        def targets(target_type: str) -> list:
+            if target_type not in targets_by_type:
+                targets_by_type[target_type] = self._targets(target_type, player, opponent, visible)
+            return targets_by_type[target_type]
+
+        board_full = len(player.board) >= 7
+        for index, card in enumerate(player.hand):
+            if card.mana_cost > player.mana:
+                continue
+            if isinstance(card, SpellCard):
+                if card.requires_target:
+                    for target in targets(card.target_type):
+                        yield Action('play', index, target)
+                else:
+                    yield Action('play', index)
+            elif isinstance(card, MinionCard):
+                if board_full:
+                    continue
+                yield Action('play', index)
+                if card.battlecry:
+                    for target in targets("any"):
+                        yield Action('play', index, target)
+            else:
+                yield Action('play', index)
+
+        for index, minion in enumerate(player.board):
+            if minion.can_attack_now():
+                for target in attack_targets:
+                    yield Action('attack', index, target)
+
+        if player.can_hero_attack():
+            for target in attack_targets:
+                yield Action('hero_attack', None, target)
+
+        if player.hero_power and not player.hero_power_used and player.mana >= 2:
+            if player.hero_power in TARGETED_HERO_POWERS:
+                for target in targets("any"):
+                    yield Action('hero_power', None, target)
+            else:
+                yield Action('hero_power')
+
+        yield Action('end_turn')
+
+    def apply_action(self, action: Action) -> bool:
+        """Carry out an action from legal_actions(), returns False if it failed"""
+        kind, index, target = action
+        if kind == 'play':
+            return self.play_card(index, target)
+        if kind == 'attack':
+            return self.attack_with_minion(index, target)
+        if kind == 'hero_attack':
+            return self.hero_attack(target)
+        if kind == 'hero_power':
+            return self.use_hero_power(target)
+        if kind == 'end_turn':
+            self.end_turn()
+            if not self.game_over:
+                self.play_turn()
+            return True
+        raise ValueError(f"Unknown action: {kind}")
@@ -1,5 +1,15 @@
 # Hearthstone GUI
-from .game_gui import GameGUI
-from .menu import MainMenu
+# GameGUI pulls in the card renderer and art manager, so both names are
+# imported on first use to keep the menu quick to open
 
 __all__ = ['GameGUI', 'MainMenu']
+
+
+def __getattr__(name):
+    if name == 'GameGUI':
+        from .game_gui import GameGUI
+        return GameGUI
+    if name == 'MainMenu':
+        from .menu import MainMenu
+        return MainMenu
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
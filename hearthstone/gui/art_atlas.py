@@ -0,0 +1,82 @@
+"""
+Art Atlas - Packs card and hero art into a few large surfaces
+Renderers blit sub-rectangles of the atlas pages instead of holding
+one scaled surface per card per size
+"""
+
+import pygame
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class ArtAtlas:
+    """Shelf-packed atlas pages plus a rect table (key -> page, rect)"""
+
+    def __init__(self, page_size: Tuple[int, int] = (2048, 2048)):
+        self.page_size = page_size
+        self.pages: List[pygame.Surface] = []
+        self.rects: Dict[Hashable, Tuple[int, pygame.Rect]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.rects
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def pack(self, items: List[Tuple[Hashable, pygame.Surface]]):
+        """Pack (key, surface) pairs, tallest first, into rows across as few pages as fit"""
+        page_width, page_height = self.page_size
+        placements = []  # (key, surface, page index, x, y)
+        page_sizes = []
+        page = -1
+        x = y = shelf_height = 0
+
+        for key, surface in sorted(items, key=lambda item: item[1].get_height(), reverse=True):
+            width, height = surface.get_size()
+            if width > page_width or height > page_height:
+                # Too big for a shared page: give it one of its own
+                page_sizes.append((width, height))
+                placements.append((key, surface, len(page_sizes) - 1, 0, 0))
+                continue
+            if page >= 0 and x + width > page_width:
+                # Start a new shelf below the current one
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            if page < 0 or y + height > page_height:
+                page_sizes.append((page_width, page_height))
+                page = len(page_sizes) - 1
+                x = y = shelf_height = 0
+            placements.append((key, surface, page, x, y))
+            x += width
+            shelf_height = max(shelf_height, height)
+
+        # Trim the last shared page to what it uses so small sets don't allocate a full page
+        if page >= 0:
+            last_page = [(s, px, py) for _, s, p, px, py in placements if p == page]
+            page_sizes[page] = (max(px + s.get_width() for s, px, _ in last_page),
+                                max(py + s.get_height() for s, _, py in last_page))
+
+        self.pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+        self.rects = {}
+        for key, surface, index, x, y in placements:
+            # Both copy exactly onto the cleared page: opaque art has nothing to blend,
+            # and MAX against zero keeps per-pixel alpha as is (and takes SDL's fast path)
+            flags = pygame.BLEND_RGBA_MAX if surface.get_flags() & pygame.SRCALPHA else 0
+            self.pages[index].blit(surface, (x, y), special_flags=flags)
+            self.rects[key] = (index, pygame.Rect((x, y), surface.get_size()))
+
+    def blit(self, dest: pygame.Surface, key: Hashable, position) -> bool:
+        """Blit the art for key onto dest, returning False if it isn't in the atlas"""
+        entry = self.rects.get(key)
+        if entry is None:
+            return False
+        page, rect = entry
+        dest.blit(self.pages[page], position, rect)
+        return True
+
+    def subsurface(self, key: Hashable) -> Optional[pygame.Surface]:
+        """A view of the art for key that shares pixels with its page, or None"""
+        entry = self.rects.get(key)
+        if entry is None:
+            return None
+        page, rect = entry
+        return self.pages[page].subsurface(rect)
@@ -0,0 +1,101 @@
+"""
+Art Disk Cache - Stores preprocessed card art as raw pixel buffers
+Cropped and scaled art is written once, then memory-mapped on later launches
+so no PNG/webp decoding or scaling happens at startup
+"""
+
+import pygame
+import os
+import mmap
+import struct
+import hashlib
+import threading
+from typing import Optional, Tuple
+
+
+class ArtDiskCache:
+    """On-disk cache of ready-to-blit art surfaces
+
+    Each entry is a 16 byte header (magic, width, height) followed by BGRA pixels,
+    which is the layout convert_alpha() produces on common displays. Entries are
+    keyed by the source file's path, mtime and size plus the target size, so
+    editing or replacing an image simply misses the cache.
+    """
+
+    MAGIC = b'ART1'
+    HEADER = struct.Struct('<4sHH8x')
+
+    def __init__(self, directory: str = "assets/.cache/art"):
+        self.directory = directory
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # Asset pipeline workers load entries concurrently
+
+    def _entry_path(self, source_path: str, target_size: Optional[Tuple[int, int]]) -> Optional[str]:
+        """Build the cache filename for a source image, or None if it can't be stat'ed"""
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        size_tag = f"{target_size[0]}x{target_size[1]}" if target_size else "native"
+        key = f"{os.path.abspath(source_path)}|{stat.st_mtime_ns}|{stat.st_size}|{size_tag}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.directory, f"{digest}_{size_tag}.bgra")
+
+    def load(self, source_path: str, target_size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        """Memory-map a cached surface for this source image, or return None on a miss"""
+        if not self.enabled:
+            return None
+        entry_path = self._entry_path(source_path, target_size)
+        if entry_path is None or not os.path.exists(entry_path):
+            self._count(hit=False)
+            return None
+
+        try:
+            with open(entry_path, 'rb') as f:
+                # Copy-on-write map: pages are read lazily and the file is never modified
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, width, height = self.HEADER.unpack_from(mapped, 0)
+            if magic != self.MAGIC or len(mapped) != self.HEADER.size + width * height * 4:
+                raise ValueError("corrupt art cache entry")
+            # The surface keeps a reference to the mapped buffer for its whole lifetime
+            surface = pygame.image.frombuffer(memoryview(mapped)[self.HEADER.size:], (width, height), 'BGRA')
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Discarding art cache entry {os.path.basename(entry_path)}: {e}")
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return surface
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def store(self, source_path: str, surface: pygame.Surface, target_size: Optional[Tuple[int, int]] = None):
+        """Write a preprocessed surface to the cache"""
+        if not self.enabled:
+            return
+        entry_path = self._entry_path(source_path, target_size)
+        if entry_path is None:
+            return
+
+        width, height = surface.get_size()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a half-written entry
+            temp_path = entry_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, width, height))
+                f.write(pygame.image.tobytes(surface, 'BGRA'))
+            os.replace(temp_path, entry_path)
+        except (OSError, pygame.error) as e:
+            print(f"Failed to write art cache entry for {source_path}: {e}")
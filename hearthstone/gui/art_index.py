@@ -0,0 +1,134 @@
+"""
+Art Name Index - Fast card name -> art lookup
+Indexes art names by exact name, no-space variant, word tokens and trigrams
+so fuzzy lookups never scan every loaded image
+"""
+
+import re
+from typing import Dict, List, Optional, Set
+
+
+class ArtNameIndex:
+    """Name index over loaded card art
+
+    find() resolves a card name the same way the old linear scan did: exact
+    name, then the name without spaces, then the earliest-added art whose name
+    contains the card name or is contained in it. Names that still don't match
+    fall back to art sharing all of the card name's words. Every result,
+    including "no match", is memoized until new art is added.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._order: Dict[str, int] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._prefixes: Set[str] = set()  # First trigram of every name
+        self._short_names: List[str] = []  # Names under 3 characters have no trigrams
+        self._lengths: List[int] = []  # Distinct name lengths, sorted
+        self._tokens: Dict[str, Set[str]] = {}
+        self._memo: Dict[str, Optional[str]] = {}
+
+    @staticmethod
+    def _trigrams_of(text: str) -> Set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def _tokens_of(text: str) -> List[str]:
+        return re.findall(r"[a-z0-9]+", text.lower())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._order
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str):
+        """Index an art name (already lower-cased)"""
+        if name in self._order:
+            return
+        self._order[name] = len(self.names)
+        self.names.append(name)
+
+        if len(name) < 3:
+            self._short_names.append(name)
+        else:
+            self._prefixes.add(name[:3])
+        if len(name) not in self._lengths:
+            self._lengths.append(len(name))
+            self._lengths.sort()
+        for gram in self._trigrams_of(name):
+            self._trigrams.setdefault(gram, set()).add(name)
+        for token in set(self._tokens_of(name)):
+            self._tokens.setdefault(token, set()).add(name)
+
+        # New art can change any earlier answer, including misses
+        self._memo.clear()
+
+    def find(self, card_name: str) -> Optional[str]:
+        """Return the indexed art name best matching card_name, or None"""
+        query = card_name.lower()
+        if query in self._memo:
+            return self._memo[query]
+
+        result = self._lookup(query)
+        self._memo[query] = result
+        return result
+
+    def _lookup(self, query: str) -> Optional[str]:
+        if query in self._order:
+            return query
+        no_space = query.replace(" ", "")
+        if no_space in self._order:
+            return no_space
+
+        candidates = self._names_containing(query) | self._names_within(query)
+        if candidates:
+            return min(candidates, key=self._order.__getitem__)
+
+        return self._match_tokens(query)
+
+    def _names_containing(self, query: str) -> Set[str]:
+        """Names that contain query as a substring"""
+        grams = self._trigrams_of(query)
+        if not grams:
+            # Too short for trigrams; rare, so check directly
+            return {name for name in self.names if query in name}
+
+        postings = []
+        for gram in grams:
+            posting = self._trigrams.get(gram)
+            if not posting:
+                return set()  # Some trigram of the query appears in no name
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return {name for name in candidates if query in name}
+
+    def _names_within(self, query: str) -> Set[str]:
+        """Names that are a substring of query"""
+        # Probe the query's own substrings instead of touching the names, only
+        # starting where some name starts and only at lengths some name has
+        found = {name for name in self._short_names if name in query}
+        length = len(query)
+        for start in range(length - 2):
+            if query[start:start + 3] not in self._prefixes:
+                continue
+            for size in self._lengths:
+                if start + size > length:
+                    break
+                if query[start:start + size] in self._order:
+                    found.add(query[start:start + size])
+        return found
+
+    def _match_tokens(self, query: str) -> Optional[str]:
+        """Earliest name containing every word of query, in any order"""
+        tokens = set(self._tokens_of(query))
+        if not tokens:
+            return None
+        postings = sorted((self._tokens.get(token, set()) for token in tokens), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+        if not candidates:
+            return None
+        return min(candidates, key=self._order.__getitem__)
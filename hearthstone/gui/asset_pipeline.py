@@ -0,0 +1,79 @@
+"""
+Asset Pipeline - Decodes and preprocesses art on a thread pool
+Jobs (decode, crop, scale) run in worker threads while progress is posted to
+a queue, so a loading screen can keep drawing and handling events meanwhile
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+
+class AssetPipeline:
+    """A thread pool for asset jobs plus a progress queue
+
+    Workers only prepare surfaces; whoever submitted the jobs collects the
+    results (in submission order) and registers them, so the art caches and
+    name index are only touched from that thread. The bookkeeping jobs do
+    themselves (crop boxes, disk cache hit counts) is guarded by its owner's
+    lock. pygame's image loading and scaling release the GIL, which is what
+    lets the jobs overlap.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(8, os.cpu_count() or 2)
+        self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="assets")
+        self.progress: queue.Queue = queue.Queue()  # (label, error or None) per finished job
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.last_label = ""
+        self._lock = threading.Lock()
+
+    def submit(self, label: str, job: Callable, *args) -> Future:
+        """Queue job(*args); label is what the loading screen shows when it finishes"""
+        with self._lock:
+            self.submitted += 1
+        future = self.executor.submit(job, *args)
+        future.add_done_callback(lambda done: self.progress.put((label, done.exception())))
+        return future
+
+    def poll(self) -> Tuple[float, str]:
+        """Drain the progress queue, returning (fraction done, label of the latest job)"""
+        while True:
+            try:
+                label, error = self.progress.get_nowait()
+            except queue.Empty:
+                break
+            self.completed += 1
+            self.last_label = label
+            if error is not None:
+                self.failed += 1
+        if not self.submitted:
+            return 0.0, self.last_label
+        return self.completed / self.submitted, self.last_label
+
+    @property
+    def idle(self) -> bool:
+        """True when every submitted job has been reported through poll()"""
+        return self.completed >= self.submitted
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+# Global pipeline instance
+_asset_pipeline: Optional[AssetPipeline] = None
+_asset_pipeline_lock = threading.Lock()
+
+
+def get_asset_pipeline() -> AssetPipeline:
+    """Get the global asset pipeline instance"""
+    global _asset_pipeline
+    if _asset_pipeline is None:
+        with _asset_pipeline_lock:
+            if _asset_pipeline is None:
+                _asset_pipeline = AssetPipeline()
+    return _asset_pipeline
@@ -0,0 +1,156 @@
+"""
+Audio Disk Cache - Stores generated sound effects and music as raw PCM
+Each procedural sound is synthesized once, then memory-mapped on later
+launches instead of being rebuilt with NumPy
+"""
+
+import os
+import mmap
+import struct
+import hashlib
+import numpy as np
+from typing import Callable, Optional, Sequence
+
+
+class AudioDiskCache:
+    """On-disk cache of rendered int16 stereo sample arrays
+
+    Each entry is a 16 byte header (magic, sample rate, channels, frame count)
+    followed by interleaved int16 samples. Entries are keyed by the generator's
+    name, its parameters, the sample rate and a hash of the generator's code,
+    so tweaking a generator simply misses the cache.
+    """
+
+    MAGIC = b'PCM1'
+    HEADER = struct.Struct('<4sIHxxI')
+
+    def __init__(self, directory: str = "assets/.cache/audio", sample_rate: int = 22050):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _code_tag(functions: Sequence[Callable]) -> str:
+        """Hash the bytecode and constants of the functions that produce a sound"""
+        digest = hashlib.sha1()
+        for function in functions:
+            code = getattr(function, '__func__', function).__code__
+            digest.update(code.co_code)
+            digest.update(repr(code.co_consts).encode('utf-8'))
+        return digest.hexdigest()[:12]
+
+    def entry_path(self, name: str, params: tuple, functions: Sequence[Callable]) -> str:
+        """Build the cache filename for one generator call"""
+        key = f"{name}|{params!r}|{self.sample_rate}|{self._code_tag(functions)}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.directory, f"{name}_{digest}.pcm")
+
+    def load(self, entry_path: str) -> Optional[np.ndarray]:
+        """Memory-map a cached sample array, or return None on a miss"""
+        if not self.enabled or not os.path.exists(entry_path):
+            self.misses += 1
+            return None
+
+        try:
+            with open(entry_path, 'rb') as f:
+                # Copy-on-write map: pages are read lazily and the file is never modified
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, sample_rate, channels, frames = self.HEADER.unpack_from(mapped, 0)
+            if (magic != self.MAGIC or sample_rate != self.sample_rate
+                    or len(mapped) != self.HEADER.size + frames * channels * 2):
+                raise ValueError("corrupt audio cache entry")
+            samples = np.frombuffer(mapped, dtype=np.int16, offset=self.HEADER.size)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Discarding audio cache entry {os.path.basename(entry_path)}: {e}")
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return samples.reshape(frames, channels)
+
+    def store(self, entry_path: str, samples: np.ndarray):
+        """Write a rendered sample array to the cache"""
+        if not self.enabled:
+            return
+
+        samples = np.ascontiguousarray(samples, dtype=np.int16)
+        frames, channels = samples.shape
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a half-written entry
+            temp_path = entry_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, self.sample_rate, channels, frames))
+                f.write(samples.tobytes())
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            print(f"Failed to write audio cache entry {os.path.basename(entry_path)}: {e}")
+
+    def open_writer(self, entry_path: str) -> Optional['AudioCacheWriter']:
+        """Start writing an entry piece by piece, for sounds rendered in chunks"""
+        if not self.enabled:
+            return None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            return AudioCacheWriter(self, entry_path)
+        except OSError as e:
+            print(f"Failed to write audio cache entry {os.path.basename(entry_path)}: {e}")
+            return None
+
+    def render(self, synthesize: Callable[..., np.ndarray], *params, depends: Sequence[Callable] = ()) -> np.ndarray:
+        """Return synthesize(*params) from the cache, synthesizing and storing it on a miss
+
+        depends lists helpers the generator calls, so editing them also invalidates it.
+        """
+        name = getattr(synthesize, '__name__', 'sound').lstrip('_')
+        entry_path = self.entry_path(name, params, (synthesize, *depends))
+        samples = self.load(entry_path)
+        if samples is None:
+            samples = synthesize(*params)
+            self.store(entry_path, samples)
+        return samples
+
+
+class AudioCacheWriter:
+    """Appends chunks to a temp file and publishes it as a cache entry on commit()"""
+
+    def __init__(self, cache: AudioDiskCache, entry_path: str):
+        self.cache = cache
+        self.entry_path = entry_path
+        self.temp_path = entry_path + ".tmp"
+        self.frames = 0
+        self.channels = 2
+        self.file = open(self.temp_path, 'wb')
+        # Frame count is patched in on commit
+        self.file.write(cache.HEADER.pack(cache.MAGIC, cache.sample_rate, self.channels, 0))
+
+    def write(self, samples: np.ndarray):
+        """Append a block of int16 stereo samples"""
+        self.file.write(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+        self.frames += len(samples)
+
+    def commit(self):
+        """Finish the entry and make it visible to load()"""
+        try:
+            self.file.seek(0)
+            self.file.write(self.cache.HEADER.pack(self.cache.MAGIC, self.cache.sample_rate,
+                                                   self.channels, self.frames))
+            self.file.close()
+            os.replace(self.temp_path, self.entry_path)
+        except OSError as e:
+            print(f"Failed to write audio cache entry {os.path.basename(self.entry_path)}: {e}")
+            self.discard()
+
+    def discard(self):
+        """Drop a partially written entry"""
+        self.file.close()
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
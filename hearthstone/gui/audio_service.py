@@ -0,0 +1,171 @@
+"""
+Audio Service - Owns the mixer for the whole game
+Initializes pygame.mixer once, splits its channels between sound categories
+and hands them out by priority so a burst of effects never blocks the rest
+"""
+
+import time
+import pygame
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+# Channels reserved for each category of sound
+CHANNEL_CATEGORIES: Dict[str, int] = {
+    'music': 2,   # Procedural music stream (and a spare for crossfades)
+    'ui': 2,      # Buttons and menus
+    'cards': 3,   # Card play/draw
+    'combat': 6,  # Attacks land in bursts during combat
+    'game': 2,    # Turn changes, victory/defeat
+}
+
+
+class ChannelAllocator:
+    """Hands out channels within a category, preempting lower priority sounds
+
+    An idle channel is used if there is one. Otherwise the busy channel with
+    the lowest priority is taken, oldest first, as long as its priority is not
+    higher than the new sound's; if every channel holds something more
+    important the new sound is dropped.
+    """
+
+    def __init__(self, categories: Dict[str, int]):
+        self.categories: Dict[str, List[pygame.mixer.Channel]] = {}
+        self.playing: Dict[pygame.mixer.Channel, Tuple[int, float]] = {}  # -> (priority, start time)
+        next_id = 0
+        for category, count in categories.items():
+            self.categories[category] = [pygame.mixer.Channel(i) for i in range(next_id, next_id + count)]
+            next_id += count
+        self.total = next_id
+        self.dropped = 0
+
+    def acquire(self, category: str, priority: int = 0) -> Optional[pygame.mixer.Channel]:
+        """Pick a channel for a new sound in category, or None if it should be dropped"""
+        victim = None
+        victim_rank = None
+        for channel in self.categories[category]:
+            if not channel.get_busy():
+                victim = channel
+                break
+            rank = self.playing.get(channel, (0, 0.0))
+            if rank[0] <= priority and (victim_rank is None or rank < victim_rank):
+                victim, victim_rank = channel, rank
+
+        if victim is None:
+            self.dropped += 1
+            return None
+        self.playing[victim] = (priority, time.perf_counter())
+        return victim
+
+
+class AudioService:
+    """The game's one mixer: format, channel layout and latency stats"""
+
+    def __init__(self, frequency: int = 22050, size: int = -16, channels: int = 2, buffer: int = 512):
+        self.frequency = frequency
+        self.size = size
+        self.channels = channels
+        self.buffer = buffer
+        self.allocator: Optional[ChannelAllocator] = None
+        self.unavailable = False  # The mixer failed to start; not retried
+        # Seconds from play() being called to the sound starting on its channel
+        self.latencies = deque(maxlen=256)
+
+        # Later pygame.init() calls (e.g. after returning to the menu) use our format too
+        pygame.mixer.pre_init(frequency, size, channels, buffer, allowedchanges=0)
+        self.start()
+
+    def start(self) -> bool:
+        """Initialize the mixer if it isn't already running in our format, returns True if it is"""
+        if self.unavailable:
+            return False
+        if pygame.mixer.get_init() == (self.frequency, self.size, self.channels):
+            if self.allocator and pygame.mixer.get_num_channels() == self.allocator.total:
+                return True
+        try:
+            if pygame.mixer.get_init() and pygame.mixer.get_init() != (self.frequency, self.size, self.channels):
+                # Started by pygame.init() with default settings: restart in ours
+                pygame.mixer.quit()
+            pygame.mixer.init(frequency=self.frequency, size=self.size, channels=self.channels,
+                              buffer=self.buffer, allowedchanges=0)
+        except pygame.error as e:
+            print(f"⚠️ Audio unavailable: {e}")
+            self.allocator = None
+            self.unavailable = True
+            return False
+
+        total = sum(CHANNEL_CATEGORIES.values())
+        pygame.mixer.set_num_channels(total)
+        # Keep find_channel() and Sound.play() off the categorized channels
+        pygame.mixer.set_reserved(total)
+        self.allocator = ChannelAllocator(CHANNEL_CATEGORIES)
+        return True
+
+    @property
+    def buffer_latency(self) -> float:
+        """Seconds of audio the device buffer holds, the floor on output latency"""
+        return self.buffer / self.frequency
+
+    def play(self, sound: pygame.mixer.Sound, category: str, priority: int = 0,
+             loops: int = 0) -> Optional[pygame.mixer.Channel]:
+        """Play a sound on a channel from its category, returns the channel or None if dropped"""
+        requested = time.perf_counter()
+        if not self.start():
+            return None
+        channel = self.allocator.acquire(category, priority)
+        if channel is None:
+            return None
+        channel.play(sound, loops=loops)
+        self.latencies.append(time.perf_counter() - requested)
+        return channel
+
+    def channel(self, category: str) -> Optional[pygame.mixer.Channel]:
+        """Claim a channel for long-running playback such as a music stream"""
+        if not self.start():
+            return None
+        return self.allocator.acquire(category, priority=1)
+
+    def latency_report(self) -> Dict[str, float]:
+        """Summary of recent play() latencies in milliseconds
+
+        dispatch is the time spent in play() until the channel accepted the
+        sound; total adds the device buffer, which is when it can be heard.
+        """
+        if not self.latencies:
+            return {'count': 0, 'buffer_ms': self.buffer_latency * 1000}
+        ordered = sorted(self.latencies)
+        mean = sum(ordered) / len(ordered)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            'count': len(ordered),
+            'dispatch_mean_ms': mean * 1000,
+            'dispatch_p95_ms': p95 * 1000,
+            'dispatch_max_ms': ordered[-1] * 1000,
+            'buffer_ms': self.buffer_latency * 1000,
+            'total_p95_ms': (p95 + self.buffer_latency) * 1000,
+            'dropped': self.allocator.dropped if self.allocator else 0,
+        }
+
+
+# Global audio service instance
+_audio_service: Optional[AudioService] = None
+_audio_settings: Dict[str, int] = {}
+
+
+def configure_audio(**settings):
+    """Set mixer options (frequency, size, channels, buffer) before the service starts
+
+    A smaller buffer lowers latency at the risk of crackling on slow machines.
+    """
+    if _audio_service is not None:
+        print("⚠️ Audio service already started, settings ignored")
+        return
+    _audio_settings.update(settings)
+
+
+def get_audio_service() -> AudioService:
+    """Get the global audio service instance"""
+    global _audio_service
+    if _audio_service is None:
+        _audio_service = AudioService(**_audio_settings)
+    return _audio_service
@@ -4,21 +4,51 @@ Supports both image files and procedurally generated art
 """
 
 import pygame
+import numpy as np
 import os
 import re
-from typing import Dict, Optional
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from .colors import *
+from .art_cache import ArtDiskCache
+from .art_index import ArtNameIndex
+from .art_atlas import ArtAtlas
+from .asset_pipeline import get_asset_pipeline
+
+
+# Size card art is drawn at in hand and on board (CardRenderer.CARD_WIDTH x CARD_HEIGHT)
+CARD_ART_SIZE = (247, 261)
 
 
 class CardArtManager:
     """Manages card artwork - loads images or generates procedural art"""
     
     def __init__(self, progress_callback=None):
-        self.art_cache: Dict[str, pygame.Surface] = {}
+        self.art_cache: Dict[str, pygame.Surface] = {}  # Original art by lower-cased name
+        self.name_index = ArtNameIndex()  # Fast fuzzy lookup over art_cache names
         self.art_directory = "Cards"  # Main Cards folder with 300+ PNGs
         self.heroes_directory = "Heroes"  # Hero cards folder at Game/Heroes
         self.fallback_directory = "assets/card_art"  # Custom art folder
         self.progress_callback = progress_callback  # Callback for loading progress
+        self.cache_directory = "assets/.cache"  # Preprocessed art data (safe to delete)
+        self.crop_cache_file = os.path.join(self.cache_directory, "crop_boxes.json")
+        self.card_size = CARD_ART_SIZE  # Card art is preprocessed to this size
+        
+        # Cropped/scaled art kept as raw pixel buffers so later launches skip decoding
+        self.disk_cache = ArtDiskCache(os.path.join(self.cache_directory, "art"))
+        
+        # Art scaled for drawing, keyed by (name, width, height), least recently used first
+        self.scaled_art: OrderedDict = OrderedDict()
+        self.scaled_art_limit = 256
+        
+        # All art packed at the active card/hero sizes (see build_atlas)
+        self.atlas: Optional[ArtAtlas] = None
+        self.atlas_sizes = None
+        
+        # Card/hero name -> original image it is drawn with (None = procedural)
+        self.resolved_art: Dict[Tuple[str, bool], Optional[pygame.Surface]] = {}
         
         # Create directories if they don't exist
         os.makedirs(self.fallback_directory, exist_ok=True)
@@ -38,6 +68,11 @@ class CardArtManager:
         # Track used hero indices to ensure heroes are NEVER the same
         self.used_hero_indices: set = set()
         
+        # White-border crop boxes per card file, persisted between launches
+        self.crop_boxes: Dict[str, dict] = self._load_crop_boxes()
+        self._crop_boxes_dirty = False
+        self._crop_lock = threading.Lock()  # Crops run on the asset pipeline's threads
+        
         # Load hero cards from Heroes folder FIRST
         self._load_hero_cards()
         
@@ -68,10 +103,15 @@ class CardArtManager:
         
         print(f"Loading {len(files)} hero cards from {self.heroes_directory} folder...")
         
-        for filename in files:
-            filepath = os.path.join(self.heroes_directory, filename)
+        # Decode on the asset pipeline's threads, keep them in file order here
+        pipeline = get_asset_pipeline()
+        jobs = [(filename, pipeline.submit(f"Hero {filename}", self._load_raw_art,
+                                           os.path.join(self.heroes_directory, filename)))
+                for filename in files]
+        
+        for filename, job in jobs:
             try:
-                image = pygame.image.load(filepath)
+                image = job.result()
                 self.hero_images.append(image)
                 print(f"✓ Loaded hero card: {filename} ({image.get_width()}x{image.get_height()})")
             except Exception as e:
@@ -79,53 +119,107 @@ class CardArtManager:
         
         print(f"Successfully loaded {len(self.hero_images)} hero cards total")
     
-    def _crop_white_borders(self, surface: pygame.Surface) -> pygame.Surface:
-        """Crop white/light borders from card PNG to get just the card art"""
+    def _load_crop_boxes(self) -> Dict[str, dict]:
+        """Load the persisted crop boxes (filename -> mtime/size/box) from disk"""
+        try:
+            with open(self.crop_cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_crop_boxes(self):
+        """Write crop boxes back to disk if any were computed this launch"""
+        with self._crop_lock:
+            if not self._crop_boxes_dirty:
+                return
+            boxes = dict(self.crop_boxes)
+            self._crop_boxes_dirty = False
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            with open(self.crop_cache_file, 'w') as f:
+                json.dump(boxes, f)
+        except OSError as e:
+            print(f"Failed to save crop cache: {e}")
+            self._crop_boxes_dirty = True
+    
+    @staticmethod
+    def _scan_for_content(has_content, length: int, from_end: bool, block: int = 16) -> Optional[int]:
+        """Find the first (or last) line with content, testing whole blocks of lines at once
+        
+        has_content(lo, hi) returns a boolean array marking which lines in [lo, hi)
+        contain non-white pixels. Borders are thin, so scanning inwards from the edge
+        in blocks touches only a small fraction of the image.
+        """
+        starts = range(length, 0, -block) if from_end else range(0, length, block)
+        for start in starts:
+            lo, hi = (max(0, start - block), start) if from_end else (start, min(length, start + block))
+            hits = np.flatnonzero(has_content(lo, hi))
+            if hits.size:
+                return lo + int(hits[-1] if from_end else hits[0])
+        return None
+    
+    def _find_crop_box(self, surface: pygame.Surface) -> Optional[Tuple[int, int, int, int]]:
+        """Find the bounding box of non-white content, or None if nothing to crop"""
         width, height = surface.get_size()
         
-        # Convert to pixel array for analysis
-        pixels = pygame.surfarray.array3d(surface)
+        # Reference the pixels directly when possible (no copy), palette images need array3d
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except ValueError:
+            pixels = pygame.surfarray.array3d(surface)
         
-        # Find bounds of non-white content (threshold for "white" is 240+ on all channels)
+        # A pixel is "white" if it is 240+ on all channels
         WHITE_THRESHOLD = 240
         
-        # Find top boundary
-        top = 0
-        for y in range(height):
-            row = pixels[:, y, :]
-            if not (row >= WHITE_THRESHOLD).all():
-                top = y
-                break
-        
-        # Find bottom boundary
-        bottom = height - 1
-        for y in range(height - 1, -1, -1):
-            row = pixels[:, y, :]
-            if not (row >= WHITE_THRESHOLD).all():
-                bottom = y
-                break
-        
-        # Find left boundary
-        left = 0
-        for x in range(width):
-            col = pixels[x, :, :]
-            if not (col >= WHITE_THRESHOLD).all():
-                left = x
-                break
-        
-        # Find right boundary
-        right = width - 1
-        for x in range(width - 1, -1, -1):
-            col = pixels[x, :, :]
-            if not (col >= WHITE_THRESHOLD).all():
-                right = x
-                break
+        def rows_with_content(lo, hi):
+            return (pixels[:, lo:hi, :] < WHITE_THRESHOLD).any(axis=(0, 2))
+        
+        top = self._scan_for_content(rows_with_content, height, from_end=False)
+        if top is None:
+            del pixels
+            return None
+        bottom = self._scan_for_content(rows_with_content, height, from_end=True)
+        
+        # Columns only need checking between the content rows
+        def columns_with_content(lo, hi):
+            return (pixels[lo:hi, top:bottom + 1, :] < WHITE_THRESHOLD).any(axis=(1, 2))
+        
+        left = self._scan_for_content(columns_with_content, width, from_end=False)
+        right = self._scan_for_content(columns_with_content, width, from_end=True)
+        del pixels  # Release the surface lock before subsurface()
+        
+        box = (left, top, right - left + 1, bottom - top + 1)
+        if right > left and bottom > top and box != (0, 0, width, height):
+            return box
+        return None
+    
+    def _crop_white_borders(self, surface: pygame.Surface, filepath: Optional[str] = None) -> pygame.Surface:
+        """Crop white/light borders from card PNG to get just the card art
+        
+        When filepath is given the crop box is cached per file (keyed by mtime and
+        size), so later launches skip the pixel scan entirely.
+        """
+        stat = None
+        if filepath:
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                stat = None
+        
+        with self._crop_lock:
+            entry = self.crop_boxes.get(filepath) if stat else None
+        if entry and entry.get("mtime") == stat.st_mtime and entry.get("size") == stat.st_size:
+            box = entry["box"]
+        else:
+            box = self._find_crop_box(surface)
+            if stat:
+                with self._crop_lock:
+                    self.crop_boxes[filepath] = {"mtime": stat.st_mtime, "size": stat.st_size, "box": box}
+                    self._crop_boxes_dirty = True
         
         # Crop the surface
-        if right > left and bottom > top:
-            crop_rect = pygame.Rect(left, top, right - left + 1, bottom - top + 1)
-            cropped = surface.subsurface(crop_rect).copy()
-            return cropped
+        if box and surface.get_rect().contains(pygame.Rect(box)):
+            return surface.subsurface(pygame.Rect(box)).copy()
         
         # If no cropping needed, return original
         return surface
@@ -138,40 +232,82 @@ class CardArtManager:
         files = [f for f in os.listdir(self.art_directory) if f.endswith('.png')]
         total_files = len(files)
         
-        for i, filename in enumerate(files):
-            # Report progress
-            if self.progress_callback:
-                progress = (i + 1) / total_files
-                self.progress_callback(progress, f"Loading card art... ({i+1}/{total_files})")
-            
+        # Decode/crop/scale every card on the asset pipeline's threads first
+        pipeline = get_asset_pipeline()
+        jobs = []
+        for filename in files:
             # EXCLUDE hero portrait cards (they have arch/frame style)
             # These typically have "HERO" or specific hero names in filename
             filename_lower = filename.lower()
             if any(keyword in filename_lower for keyword in ['hero', 'portrait', 'rexxar', 'jaina', 'uther', 
                                                               'garrosh', 'malfurion', 'anduin', 'valeera', 
                                                               'thrall', 'guldан', 'medivh']):
+                jobs.append((filename, None, None))
                 continue  # Skip hero portrait cards
             
             # Extract readable card name from filename
             card_name = self._extract_card_name_from_filename(filename)
-            
+            job = None
             if card_name:
                 filepath = os.path.join(self.art_directory, filename)
+                job = pipeline.submit(card_name, self._load_preprocessed_card, filepath)
+            jobs.append((filename, card_name, job))
+        
+        # Then register the results in file order on this thread
+        for i, (filename, card_name, job) in enumerate(jobs):
+            # Report progress
+            if self.progress_callback:
+                progress = (i + 1) / total_files
+                self.progress_callback(progress, f"Loading card art... ({i+1}/{total_files})")
+            
+            if job is not None:
                 try:
-                    image = pygame.image.load(filepath)
-                    # CROP WHITE BORDERS to get just the card art
-                    cropped_image = self._crop_white_borders(image)
+                    cropped_image = job.result()
                     
                     # Store with both the extracted name and variations
-                    self.art_cache[card_name.lower()] = cropped_image
+                    self._add_art(card_name.lower(), cropped_image)
                     self.name_mapping[card_name.lower()] = filename
                     
                     # Also store without spaces for easier matching
                     no_space_name = card_name.replace(" ", "").lower()
-                    self.art_cache[no_space_name] = cropped_image
+                    self._add_art(no_space_name, cropped_image)
                     self.name_mapping[no_space_name] = filename
                 except Exception as e:
                     print(f"Failed to load {filename}: {e}")
+        
+        self._save_crop_boxes()
+    
+    def _load_preprocessed_card(self, filepath: str) -> pygame.Surface:
+        """Load card art cropped and scaled to card size, from the disk cache when possible"""
+        image = self.disk_cache.load(filepath, self.card_size)
+        if image is not None:
+            return image
+        
+        image = pygame.image.load(filepath)
+        # CROP WHITE BORDERS to get just the card art
+        cropped_image = self._crop_white_borders(image, filepath)
+        scaled_image = pygame.transform.smoothscale(cropped_image, self.card_size)
+        self.disk_cache.store(filepath, scaled_image, self.card_size)
+        return scaled_image
+    
+    def _load_raw_art(self, filepath: str) -> pygame.Surface:
+        """Load an image as is, from the disk cache when possible"""
+        image = self.disk_cache.load(filepath)
+        if image is None:
+            image = pygame.image.load(filepath)
+            self.disk_cache.store(filepath, image)
+        return image
+    
+    def _add_art(self, name: str, image: pygame.Surface):
+        """Store original art under a lower-cased name and index the name for lookup"""
+        self.art_cache[name] = image
+        self.name_index.add(name)
+    
+    def _scale(self, image: pygame.Surface, width: int, height: int) -> pygame.Surface:
+        """Scale to EXACT dimensions, skipping the scale when art is already that size"""
+        if image.get_size() == (width, height):
+            return image
+        return pygame.transform.smoothscale(image, (width, height))
     
     def _extract_card_name_from_filename(self, filename: str) -> Optional[str]:
         """Extract readable card name from PNG filename"""
@@ -203,74 +339,131 @@ class CardArtManager:
         if not os.path.exists(self.fallback_directory):
             return
         
+        pipeline = get_asset_pipeline()
+        jobs = []
         for filename in os.listdir(self.fallback_directory):
             if filename.endswith(('.png', '.jpg', '.jpeg')):
                 card_name = os.path.splitext(filename)[0]
-                filepath = os.path.join(self.fallback_directory, filename)
-                try:
-                    image = pygame.image.load(filepath)
-                    # Only add if not already loaded from Cards folder
-                    if card_name.lower() not in self.art_cache:
-                        self.art_cache[card_name.lower()] = image
-                except:
-                    pass
+                # Only add if not already loaded from Cards folder
+                if card_name.lower() not in self.art_cache:
+                    filepath = os.path.join(self.fallback_directory, filename)
+                    jobs.append((card_name, pipeline.submit(card_name, self._load_raw_art, filepath)))
+        
+        for card_name, job in jobs:
+            try:
+                if card_name.lower() not in self.art_cache:
+                    self._add_art(card_name.lower(), job.result())
+            except:
+                pass
     
     def _build_available_images_list(self):
         """Build a list of all available card images for random assignment"""
-        self.available_images = []
-        for key, image in self.art_cache.items():
-            # Skip cached scaled versions (they have dimensions in the key)
-            if isinstance(key, str) and '_' not in key:
-                self.available_images.append(image)
+        self.available_images = list(self.art_cache.values())
         
         print(f"CardArtManager: Loaded {len(self.available_images)} unique card images")
     
+    def build_atlas(self, card_size: Tuple[int, int], hero_size: Tuple[int, int]) -> ArtAtlas:
+        """Pack all card art at card_size and hero art at hero_size into an atlas
+        
+        Call again with new sizes when the resolution changes; it's a single
+        rebuild rather than a scale per card as each one is drawn.
+        """
+        if self.atlas is not None and self.atlas_sizes == (card_size, hero_size):
+            return self.atlas
+        
+        items = []
+        packed = set()
+        for image in self.art_cache.values():
+            # Names and no-space names share one image, pack it once
+            if id(image) not in packed:
+                packed.add(id(image))
+                items.append(((id(image), *card_size), self._scale(image, *card_size)))
+        for image in self.hero_images:
+            items.append(((id(image), *hero_size), self._scale(image, *hero_size)))
+        
+        atlas = ArtAtlas()
+        atlas.pack(items)
+        self.atlas = atlas
+        self.atlas_sizes = (card_size, hero_size)
+        
+        # Scaled copies are now views into the atlas
+        self.scaled_art.clear()
+        
+        print(f"CardArtManager: Packed {len(atlas)} images into {len(atlas.pages)} atlas page(s)")
+        return atlas
+    
+    def blit_card_art(self, dest: pygame.Surface, card_name: str, rect: pygame.Rect, is_spell: bool = False, is_hero: bool = False):
+        """Draw card art into rect on dest, straight from the atlas when it holds that size"""
+        original = self._resolve_art(card_name, is_hero)
+        if original is not None and self.atlas is not None:
+            if self.atlas.blit(dest, (id(original), rect.width, rect.height), rect.topleft):
+                return
+        dest.blit(self.get_card_art(card_name, rect.width, rect.height, is_spell, is_hero), rect.topleft)
+    
     def get_card_art(self, card_name: str, width: int, height: int, is_spell: bool = False, is_hero: bool = False) -> pygame.Surface:
         """Get card art - loads from file or assigns from available images"""
-        cache_key = f"{card_name.lower()}_{width}_{height}"
+        cache_key = (card_name.lower(), width, height)
         
         # Check cache first
-        if cache_key in self.art_cache:
-            return self.art_cache[cache_key]
-        
-        # For heroes, use hero images from Heroes folder
-        if is_hero and self.hero_images:
-            art_surface = self._assign_hero_image(card_name, width, height)
-            self.art_cache[cache_key] = art_surface
-            return art_surface
-        
-        # Try to load from file (exact match)
-        art_surface = self._load_art_from_file(card_name, width, height)
-        
-        # If no exact match, assign a card image from available images
-        if art_surface is None:
-            art_surface = self._assign_card_image(card_name, width, height, is_spell)
+        cached = self.scaled_art.get(cache_key)
+        if cached is not None:
+            self.scaled_art.move_to_end(cache_key)
+            return cached
+        
+        original = self._resolve_art(card_name, is_hero)
+        if original is None and is_hero:
+            # ONLY use images from Heroes folder - no fallback
+            print("WARNING: No hero images loaded from Heroes folder!")
+            art_surface = self._generate_hero_placeholder(width, height)
+        elif original is None:
+            # No images available at all
+            art_surface = self._generate_procedural_art(card_name, width, height, is_spell)
+        else:
+            # Copied out of the atlas when packed at this size (a bare view would share
+            # pixels with its neighbours), otherwise scale to EXACT dimensions
+            art_surface = None
+            if self.atlas is not None:
+                art_surface = self.atlas.subsurface((id(original), width, height))
+            if art_surface is not None:
+                art_surface = art_surface.copy()
+            else:
+                art_surface = self._scale(original, width, height)
         
         # Cache and return
-        self.art_cache[cache_key] = art_surface
+        self._remember_scaled(cache_key, art_surface)
         return art_surface
     
-    def _assign_hero_image(self, card_name: str, width: int, height: int) -> pygame.Surface:
-        """Assign a RANDOM hero image from Heroes folder - scale to fit slot perfectly"""
-        # ONLY use images from Heroes folder - no fallback
-        if not self.hero_images:
-            print("WARNING: No hero images loaded from Heroes folder!")
-            # Create a placeholder with text
-            surface = pygame.Surface((width, height))
-            surface.fill((100, 100, 150))  # Purple placeholder
-            font = pygame.font.Font(None, 24)
-            text = font.render("NO HERO", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(width//2, height//2))
-            surface.blit(text, text_rect)
-            return surface
+    def _remember_scaled(self, cache_key: Tuple[str, int, int], art_surface: pygame.Surface):
+        """Cache scaled art, dropping the least recently used entries past the limit"""
+        self.scaled_art[cache_key] = art_surface
+        while len(self.scaled_art) > self.scaled_art_limit:
+            self.scaled_art.popitem(last=False)
+    
+    def _resolve_art(self, card_name: str, is_hero: bool) -> Optional[pygame.Surface]:
+        """Find the original (unscaled) image for a card or hero, None for procedural art"""
+        key = (card_name.lower(), is_hero)
+        if key in self.resolved_art:
+            return self.resolved_art[key]
         
+        # For heroes, use hero images from Heroes folder
+        if is_hero:
+            original = self._assign_hero_image(card_name) if self.hero_images else None
+        else:
+            # Try to load from file (exact match), else assign from available images
+            original = self._load_art_from_file(card_name)
+            if original is None:
+                original = self._assign_card_image(card_name)
+        
+        self.resolved_art[key] = original
+        return original
+    
+    def _assign_hero_image(self, card_name: str) -> pygame.Surface:
+        """Assign a RANDOM hero image from Heroes folder"""
         # Check if we already assigned an image to this hero
         # Use card_name directly (which is the player ID from render_hero)
         hero_key = card_name.lower()
         if hero_key in self.assigned_cards:
-            original = self.assigned_cards[hero_key]
-            # Scale to EXACT dimensions to fit slot perfectly
-            return pygame.transform.smoothscale(original, (width, height))
+            return self.assigned_cards[hero_key]
         
         # RANDOMLY select a hero image (truly random each time a new hero is created)
         import random
@@ -280,17 +473,13 @@ class CardArtManager:
         self.assigned_cards[hero_key] = assigned_image
         
         print(f"✓ Randomly assigned hero image {index+1}.png to hero {card_name}")
-        
-        # Scale to EXACT dimensions to fit slot perfectly
-        return pygame.transform.smoothscale(assigned_image, (width, height))
+        return assigned_image
     
-    def _assign_card_image(self, card_name: str, width: int, height: int, is_spell: bool) -> pygame.Surface:
-        """Assign a card image from available images to this card - scale to EXACT size"""
+    def _assign_card_image(self, card_name: str) -> Optional[pygame.Surface]:
+        """Assign a card image from available images to this card"""
         # Check if we already assigned an image to this card
         if card_name.lower() in self.assigned_cards:
-            original = self.assigned_cards[card_name.lower()]
-            # Scale to EXACT dimensions
-            return pygame.transform.smoothscale(original, (width, height))
+            return self.assigned_cards[card_name.lower()]
         
         # If we have available images, assign one
         if self.available_images:
@@ -301,36 +490,17 @@ class CardArtManager:
             
             assigned_image = self.available_images[index]
             self.assigned_cards[card_name.lower()] = assigned_image
-            
-            # Scale to EXACT dimensions (no aspect ratio preservation)
-            return pygame.transform.smoothscale(assigned_image, (width, height))
+            return assigned_image
         
-        # Fallback to procedural art if no images available
-        return self._generate_procedural_art(card_name, width, height, is_spell)
+        # Caller falls back to procedural art
+        return None
     
-    def _load_art_from_file(self, card_name: str, width: int, height: int) -> Optional[pygame.Surface]:
-        """Try to load card art from file - scale to EXACT size"""
-        # Try exact match first
-        if card_name.lower() in self.art_cache:
-            original = self.art_cache[card_name.lower()]
-            # Scale to EXACT dimensions
-            return pygame.transform.smoothscale(original, (width, height))
-        
-        # Try without spaces
-        no_space_name = card_name.replace(" ", "").lower()
-        if no_space_name in self.art_cache:
-            original = self.art_cache[no_space_name]
-            # Scale to EXACT dimensions
-            return pygame.transform.smoothscale(original, (width, height))
-        
-        # Try partial matching (for similar names)
-        card_lower = card_name.lower()
-        for cached_name, cached_image in self.art_cache.items():
-            if isinstance(cached_name, str) and not cached_name.endswith(f"_{width}_{height}"):
-                # Check if card name is contained in cached name or vice versa
-                if card_lower in cached_name or cached_name in card_lower:
-                    # Scale to EXACT dimensions
-                    return pygame.transform.smoothscale(cached_image, (width, height))
+    def _load_art_from_file(self, card_name: str) -> Optional[pygame.Surface]:
+        """Try to find card art by name, then in the fallback directory"""
+        # Exact, no-space and partial name matches (indexed, misses are remembered)
+        match = self.name_index.find(card_name)
+        if match is not None:
+            return self.art_cache[match]
         
         # Try loading from fallback directory
         for ext in ['.png', '.jpg', '.jpeg']:
@@ -338,15 +508,23 @@ class CardArtManager:
             if os.path.exists(filepath):
                 try:
                     image = pygame.image.load(filepath)
-                    # Scale to EXACT dimensions
-                    scaled = pygame.transform.smoothscale(image, (width, height))
-                    self.art_cache[card_name.lower()] = image
-                    return scaled
+                    self._add_art(card_name.lower(), image)
+                    return image
                 except:
                     pass
         
         return None
     
+    def _generate_hero_placeholder(self, width: int, height: int) -> pygame.Surface:
+        """Create a placeholder with text for heroes when the Heroes folder is empty"""
+        surface = pygame.Surface((width, height))
+        surface.fill((100, 100, 150))  # Purple placeholder
+        font = pygame.font.Font(None, 24)
+        text = font.render("NO HERO", True, (255, 255, 255))
+        text_rect = text.get_rect(center=(width//2, height//2))
+        surface.blit(text, text_rect)
+        return surface
+    
     def _generate_procedural_art(self, card_name: str, width: int, height: int, is_spell: bool) -> pygame.Surface:
         """Generate professional-looking procedural card art"""
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -498,10 +676,13 @@ class CardArtManager:
 
 # Global instance
 _art_manager = None
+_art_manager_lock = threading.Lock()  # The background warm-up may be building it
 
 def get_art_manager(progress_callback=None) -> CardArtManager:
     """Get the global card art manager instance"""
     global _art_manager
     if _art_manager is None:
-        _art_manager = CardArtManager(progress_callback)
+        with _art_manager_lock:
+            if _art_manager is None:
+                _art_manager = CardArtManager(progress_callback)
     return _art_manager
@@ -9,6 +9,8 @@ class CardRenderer:
     CARD_HEIGHT = 261  # 0.9x of 290 (290 * 0.9 = 261)
     MINION_WIDTH = 247  # Board minions same as hand cards
     MINION_HEIGHT = 261  # Board minions same as hand cards
+    HERO_WIDTH = 260  # Hero cards sized to fit the arch frames
+    HERO_HEIGHT = 300
     
     def __init__(self):
         pygame.font.init()
@@ -24,8 +26,9 @@ class CardRenderer:
             self.mana_font = pygame.font.Font(None, 32)
             self.desc_font = pygame.font.Font(None, 14)
         
-        # Get art manager
+        # Get art manager and pack all art at the sizes we draw it
         self.art_manager = get_art_manager()
+        self.art_manager.build_atlas((self.CARD_WIDTH, self.CARD_HEIGHT), (self.HERO_WIDTH, self.HERO_HEIGHT))
     
     def render_card(self, card, playable=False, selected=False, hover=False):
         """Render a card in hand - ONLY the image, no borders, no mana crystal - FULL IMAGE VISIBLE"""
@@ -63,10 +66,7 @@ class CardRenderer:
         
         # Get and draw card art - EXACT size (no zoom, full image visible)
         is_spell_card = not (hasattr(card, 'attack') and hasattr(card, 'health'))
-        art_surface = self.art_manager.get_card_art(card.name, art_rect.width, art_rect.height, is_spell_card)
-        
-        # Draw full image - no clipping
-        surface.blit(art_surface, art_rect.topleft)
+        self.art_manager.blit_card_art(surface, card.name, art_rect, is_spell_card)
         
         # NO mana crystal - removed completely
         
@@ -188,10 +188,7 @@ class CardRenderer:
         art_rect = pygame.Rect(art_x, art_y, art_width, art_height)
         
         # Get and draw minion art - EXACT size (no zoom, full image visible)
-        art_surface = self.art_manager.get_card_art(minion.name, art_rect.width, art_rect.height, False)
-        
-        # Draw full image - no clipping
-        surface.blit(art_surface, art_rect.topleft)
+        self.art_manager.blit_card_art(surface, minion.name, art_rect, False)
         
         # Attack gem (bottom left) - on top of image
         attack_x = offset + 18
@@ -263,10 +260,9 @@ class CardRenderer:
         # Get hero card art using PLAYER ID (not name) so it doesn't swap on turn change
         # Use a unique identifier that doesn't change
         hero_id = f"HERO_{id(player)}"  # Use Python object ID for consistency
-        hero_art = self.art_manager.get_card_art(hero_id, art_rect.width, art_rect.height, False, is_hero=True)
         
         # Draw full image - no clipping
-        surface.blit(hero_art, art_rect.topleft)
+        self.art_manager.blit_card_art(surface, hero_id, art_rect, False, is_hero=True)
         
         # NO name plate - just pure card art like playable cards
         # NO health display - removed
@@ -4,17 +4,18 @@ from .card_renderer import CardRenderer
 from .sound_manager import get_sound_manager
 from .music_manager import get_music_manager
 from .tutorial import TutorialOverlay, create_tutorial_steps
+from .layout import BoardLayout
 
 
 class GameGUI:
     WIDTH = 1920  # Bigger window (was 1600)
     HEIGHT = 1080  # Bigger window (was 900)
     
-    def __init__(self, game, online_mode=False, tutorial_mode=False):
+    def __init__(self, game, online_mode=False, tutorial_mode=False, computer=None):
         self.game = game
         self.online_mode = online_mode
         self.tutorial_mode = tutorial_mode
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Hearthstone")
         
         self.clock = pygame.time.Clock()
@@ -42,56 +43,20 @@ class GameGUI:
         self.message = ""
         self.message_timer = 0
         
-        # Layout positions - COMPLETELY FIXED to prevent ALL overlaps
-        # Right side reserved for game log (280px from right edge)
-        self.log_width = 280
-        self.log_x = self.WIDTH - self.log_width - 10
-        self.game_area_width = self.log_x - 10
-        
-        # Vertical layout - Will be updated after table is cached
-        self.opponent_hero_y = 30
-        # These will be set after table caching
-        self.opponent_board_y = 0
-        self.center_y = self.HEIGHT // 2  # Exact center: 540
-        self.player_board_y = 0
-        self.player_hero_y = 0
-        self.hand_y = 0
-        
-        # Horizontal positions - SPREAD OUT to prevent overlaps
-        self.left_margin = 15
-        self.hero_x = 200  # Hero MUCH further right, away from deck info
-        
-        # Calculate the vertical gold line position (right edge of game area)
-        # The gold line is at board_right which is game_area_width - 50
-        vertical_line_x = self.game_area_width - 50 - 10  # Moved 10px to the left
-        
-        # All three elements vertically stacked and centered on the same vertical line
-        button_width = 120  # Wider, more square
-        button_height = 120  # Shorter, more square
-        
-        # End turn button - MOVED HIGHER (closer to center line)
-        # Position button so its CENTER is on the vertical line
-        self.end_turn_x = vertical_line_x - (button_width // 2)
-        # Align button CENTER slightly ABOVE the horizontal center line
-        self.end_turn_y = self.center_y - (button_height // 2) - 40  # Moved 40px higher
-        
-        # Calculate exact center x (should be on vertical line)
-        center_x = vertical_line_x
-        
-        # Hero power button - ABOVE end turn, SAME CENTER LINE, SLIGHTLY LOWER
-        hero_power_size = 85
-        self.hero_power_x = center_x - (hero_power_size // 2)  # Center aligned
-        self.hero_power_y = self.end_turn_y - hero_power_size - 12  # 12px gap above end turn (was 15px)
-        
-        # Mana crystals - BELOW end turn button, SAME CENTER LINE, MOVED LOWER
-        self.mana_x = center_x  # Exact center alignment
-        # Position mana below the end turn button with larger gap
-        self.mana_y = self.end_turn_y + button_height + 60  # 60px below end turn button (was 40px)
-        
-        # Deck info - TOP RIGHT corner (moved from left side)
-        self.deck_info_x = self.log_x - 120  # Left of the log panel
-        self.deck_info_y_opponent = 15  # Top right
-        self.deck_info_y_player = 80  # Below opponent deck info
+        # What the current player can do, from Game.legal_actions() (see _refresh_legal_moves)
+        self.playable_cards = set()
+        self.ready_minions = set()
+        self.hero_power_ready = False
+        
+        # Computer opponent (an MCTSBot) playing player 2; it searches in
+        # worker processes and its moves are applied in update()
+        self.computer = computer
+        self.computer_next_move = 0
+        
+        # Layout - every slot rect for this window size, shared by drawing and hit testing
+        self.layout = BoardLayout(self.WIDTH, self.HEIGHT,
+                                  (CardRenderer.CARD_WIDTH, CardRenderer.CARD_HEIGHT),
+                                  (CardRenderer.HERO_WIDTH, CardRenderer.HERO_HEIGHT))
         
         # Tutorial system (must be after layout positions are defined)
         self.tutorial = TutorialOverlay(self.WIDTH, self.HEIGHT)
@@ -109,70 +74,24 @@ class GameGUI:
         self.show_log = True
         self.log_scroll = 0
         
-        # CACHE BACKGROUND IMAGE - load once, not every frame
-        self.cached_background = None
+        # Background and table images - loaded once, scaled once per window size
+        self.background_image = None
         try:
-            bg_image = pygame.image.load("Designs/Game_Background.webp")
-            # Scale to fit screen ONCE
-            self.cached_background = pygame.transform.scale(bg_image, (self.WIDTH, self.HEIGHT))
+            self.background_image = pygame.image.load("Designs/Game_Background.webp")
         except Exception as e:
             print(f"Failed to load Game_Background.webp: {e}")
             # Will use gradient fallback
         
-        # CACHE TABLE IMAGE - load once, not every frame
-        # Calculate table dimensions
-        board_left = 50
-        board_right = self.game_area_width - 50
-        board_width = board_right - board_left
-        table_height = 630
-        table_start_y = (self.HEIGHT - table_height) // 2 - 45
-        
-        # Stretch table wider and TALLER (1.3x height instead of 1.035x)
-        stretched_width = int(board_width * 1.2 * 0.9)
-        stretched_height = int(table_height * 1.3)
-        
-        # Center the stretched table
-        table_x = board_left - (stretched_width - board_width) // 2
-        table_y = table_start_y - (stretched_height - table_height) // 2
-        
-        # Load and cache table image
-        self.cached_table = None
-        self.cached_table_pos = (table_x, table_y)
-        self.table_actual_width = stretched_width
-        self.table_actual_height = stretched_height
-        self.table_actual_left = table_x
-        self.table_actual_right = table_x + stretched_width
-        self.table_actual_top = table_y
-        self.table_actual_bottom = table_y + stretched_height
+        self.table_image = None
         try:
-            table_image = pygame.image.load("Designs/TableMain.png")
-            # Scale to stretched dimensions
-            self.cached_table = pygame.transform.smoothscale(table_image, (stretched_width, stretched_height))
+            self.table_image = pygame.image.load("Designs/TableMain.png")
         except Exception as e:
             print(f"Failed to load TableMain.png: {e}")
-            # No cached table - will use fallback drawing
-        
-        # NOW update board positions based on stretched table
-        # Hero cards from Heroes folder - sized to fit PERFECTLY in arch slots
-        hero_height = 260  # Fit arch height
-        hero_width = 220   # Fit arch width
-        
-        # Calculate exact positions based on the table image
-        # SWAPPED: Player 1 (bottom) hero - in the BOTTOM ARCH SLOT (CORRECT - checkmark)
-        self.opponent_hero_y = self.table_actual_bottom - hero_height - 45  # Perfect fit
-        # SWAPPED: Player 1 minions - above player 1 hero (BLUE AREA at bottom)
-        self.opponent_board_y = self.opponent_hero_y - 260 - 70
-        
-        # SWAPPED: Player 2 (top) hero - in the TOP ARCH SLOT (needs to be LOWER - was X)
-        self.player_hero_y = self.table_actual_top + 55  # Moved DOWN significantly to fit arch
-        # SWAPPED: Player 2 minions - below player 2 hero (RED AREA at top)
-        self.player_board_y = self.player_hero_y + hero_height + 70
-        
-        # Calculate hand position below stretched table
-        table_bottom = self.table_actual_bottom
-        available_space = self.HEIGHT - table_bottom
-        card_height = 261
-        self.hand_y = (self.HEIGHT + table_bottom - card_height) // 2 - 10
+            # Will use fallback drawing
+        
+        self.cached_background = None
+        self.cached_table = None
+        self._scale_backdrop()
         
         # Start first turn
         if not online_mode:
@@ -181,12 +100,60 @@ class GameGUI:
         # Start game music - DISABLED
         # self.music_manager.crossfade_to_game()
     
+    def _scale_backdrop(self):
+        """Scale background and table images to the current layout"""
+        if self.background_image:
+            self.cached_background = pygame.transform.scale(self.background_image, (self.WIDTH, self.HEIGHT))
+        if self.table_image:
+            self.cached_table = pygame.transform.smoothscale(self.table_image, self.layout.table_rect.size)
+    
+    def resize(self, width, height):
+        """Lay the game out again for a new window size"""
+        self.WIDTH = width
+        self.HEIGHT = height
+        self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.layout.resize(width, height)
+        self._scale_backdrop()
+        
+        # Tutorial highlights point at layout rects, rebuild them in place
+        self.tutorial.resize(width, height)
+        if self.tutorial_mode:
+            self.tutorial.steps = create_tutorial_steps(self)
+    
+    def _sync_layout(self):
+        """Rebuild the card rows if hand or board sizes changed since the last call"""
+        player = self.game.current_player
+        opponent = self.game.get_opponent(player)
+        self.layout.update(len(player.hand), len(player.board), len(opponent.board))
+    
+    def _refresh_legal_moves(self):
+        """Hand cards, minions and hero power the current player can use right now"""
+        self.playable_cards = set()
+        self.ready_minions = set()
+        self.hero_power_ready = False
+        for kind, index, _ in self.game.legal_actions():
+            if kind == 'play':
+                self.playable_cards.add(index)
+            elif kind == 'attack':
+                self.ready_minions.add(index)
+            elif kind == 'hero_power':
+                self.hero_power_ready = True
+    
+    def hero_rect(self, player):
+        """Screen rect of a player's hero: player 1 in the bottom arch, player 2 in the top"""
+        if player is self.game.player1:
+            return self.layout.bottom_hero_rect
+        return self.layout.top_hero_rect
+    
     def run(self):
         running = True
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEORESIZE:
+                    self.resize(event.w, event.h)
+                    continue
                 
                 # Tutorial handles events first
                 if self.tutorial.active and self.tutorial.handle_event(event):
@@ -200,7 +167,7 @@ class GameGUI:
                     self.handle_motion(event.pos)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
-                        if not self.tutorial.active:
+                        if not self.tutorial.active and not self.is_computer_turn():
                             self.end_turn()
                     elif event.key == pygame.K_TAB:
                         self.show_log = not self.show_log
@@ -213,8 +180,10 @@ class GameGUI:
             self.clock.tick(60)
     
     def handle_click(self, pos, button):
-        if self.game.game_over:
+        if self.game.game_over or self.is_computer_turn():
             return
+        self._sync_layout()
+        self._refresh_legal_moves()
         
         if button == 3:  # Right click to cancel
             self.sound_manager.play('button_click')
@@ -239,13 +208,16 @@ class GameGUI:
         card_index = self.get_hand_card_at_pos(pos)
         if card_index is not None:
             card = self.game.current_player.hand[card_index]
-            if card.can_play(self.game.current_player):
+            if card_index in self.playable_cards:
                 self.selected_card_index = card_index
                 self.dragging = True
                 self.drag_pos = pos
                 self.sound_manager.play('button_hover')
             else:
-                self.show_message("Not enough mana!")
+                if not card.can_play(self.game.current_player):
+                    self.show_message("Not enough mana!")
+                else:
+                    self.show_message("Can't play that card now!")
                 self.sound_manager.play('error')
             return
         
@@ -253,16 +225,17 @@ class GameGUI:
         minion_index = self.get_player_minion_at_pos(pos)
         if minion_index is not None:
             minion = self.game.current_player.board[minion_index]
-            if minion.can_attack and minion.attack > 0:
+            if minion_index in self.ready_minions:
                 self.selected_minion_index = minion_index
                 self.targeting_mode = True
                 self.sound_manager.play('button_hover')
-            elif not minion.can_attack:
+            elif minion.attack > 0:
                 self.show_message("This minion can't attack yet!")
                 self.sound_manager.play('error')
             return
     
     def handle_release(self, pos):
+        self._sync_layout()
         if self.dragging and self.selected_card_index is not None:
             # Check if dropped on board area (play the card)
             if self.is_on_player_board(pos):
@@ -276,6 +249,7 @@ class GameGUI:
     
     def handle_motion(self, pos):
         self.drag_pos = pos
+        self._sync_layout()
         
         # Update hover state
         self.hover_card_index = self.get_hand_card_at_pos(pos)
@@ -372,8 +346,37 @@ class GameGUI:
         # Update tutorial
         if self.tutorial.active:
             self.tutorial.update()
+        
+        if self.is_computer_turn():
+            self.update_computer()
+    
+    def is_computer_turn(self):
+        return (self.computer is not None and not self.game.game_over
+                and self.game.current_player is self.game.player2)
+    
+    def update_computer(self):
+        """Start a search, or play its move once the workers are done (never blocks)"""
+        if not self.computer.thinking:
+            # Short pause between moves so they can be followed
+            if pygame.time.get_ticks() >= self.computer_next_move:
+                self.computer.begin(self.game)
+            return
+        if not self.computer.ready():
+            return
+        
+        action = self.computer.collect(self.game)
+        self.computer_next_move = pygame.time.get_ticks() + 600
+        if action is None or action.kind == 'end_turn':
+            self.end_turn()
+            return
+        if self.game.apply_action(action):
+            self.sound_manager.play('card_play' if action.kind == 'play' else 'attack')
+        self.check_game_over()
     
     def draw(self):
+        self._sync_layout()
+        self._refresh_legal_moves()
+        
         # Draw cached background image (loaded once in __init__, not every frame)
         if self.cached_background:
             self.screen.blit(self.cached_background, (0, 0))
@@ -391,18 +394,15 @@ class GameGUI:
         # Draw cached table image (loaded once in __init__, not every frame)
         if self.cached_table:
             # Simply blit the cached, pre-scaled table
-            self.screen.blit(self.cached_table, self.cached_table_pos)
+            self.screen.blit(self.cached_table, self.layout.table_rect.topleft)
         else:
             # Fallback to drawn table if image failed to load
-            board_left = 50
-            board_right = self.game_area_width - 50
-            board_width = board_right - board_left
-            table_height = 630
-            table_start_y = (self.HEIGHT - table_height) // 2 - 45
-            board_top = table_start_y
-            board_bottom = table_start_y + table_height
+            center_rect = self.layout.fallback_table_rect
+            board_left = center_rect.left
+            board_right = center_rect.right
+            board_top = center_rect.top
+            board_bottom = center_rect.bottom
             
-            center_rect = pygame.Rect(board_left, board_top, board_width, table_height)
             pygame.draw.rect(self.screen, BOARD_CENTER, center_rect, border_radius=25)
             pygame.draw.rect(self.screen, BOARD_WOOD_DARK, center_rect, 8, border_radius=25)
             pygame.draw.rect(self.screen, CARD_BORDER_GOLD, center_rect.inflate(-8, -8), 3, border_radius=23)
@@ -426,8 +426,8 @@ class GameGUI:
         self.draw_heroes()
         
         # Draw boards
-        self.draw_board(self.game.get_opponent(self.game.current_player), self.opponent_board_y, False)
-        self.draw_board(self.game.current_player, self.player_board_y, True)
+        self.draw_board(self.game.get_opponent(self.game.current_player), self.layout.opponent_board, False)
+        self.draw_board(self.game.current_player, self.layout.player_board, True)
         
         # Draw mana crystals BEFORE hand (so hand doesn't cover it)
         self.draw_mana()
@@ -468,39 +468,28 @@ class GameGUI:
     
     def draw_heroes(self):
         # Draw BOTH heroes using FULL CARDS from Heroes folder (1.png-5.png)
-        # Hero cards positioned EXACTLY in the arch frames
-
-        # Hero cards sized to fit arch frames PERFECTLY
-        hero_width = 260   # Narrower to fit arch width
-        hero_height = 300  # Shorter to fit arch height
-
-        # Calculate hero slot positions - CENTERED in the arch
-        table_center_x = self.table_actual_left + self.table_actual_width // 2
-        hero_slot_x = table_center_x - hero_width // 2  # Perfectly centered
+        # Hero cards positioned EXACTLY in the arch frames (see BoardLayout)
 
-        # SWAPPED: PLAYER 1 (bottom hero) - CORRECT position (checkmark)
-        player1_hero_y = self.opponent_hero_y
+        # PLAYER 1 - bottom arch
+        player1_rect = self.hero_rect(self.game.player1)
         player1_is_current = (self.game.current_player == self.game.player1)
-        hero1_surface = self.renderer.render_hero(self.game.player1, player1_is_current, False, hero_width, hero_height)
-        self.screen.blit(hero1_surface, (hero_slot_x, player1_hero_y))
+        hero1_surface = self.renderer.render_hero(self.game.player1, player1_is_current, False,
+                                                  player1_rect.width, player1_rect.height)
+        self.screen.blit(hero1_surface, player1_rect.topleft)
         
-        # SWAPPED: PLAYER 2 (top hero) - FIXED position (was X, now correct)
-        player2_hero_y = self.player_hero_y
+        # PLAYER 2 - top arch
+        player2_rect = self.hero_rect(self.game.player2)
         player2_is_current = (self.game.current_player == self.game.player2)
         player2_is_target = self.targeting_mode and player2_is_current
-        hero2_surface = self.renderer.render_hero(self.game.player2, player2_is_current, player2_is_target, hero_width, hero_height)
-        self.screen.blit(hero2_surface, (hero_slot_x, player2_hero_y))
+        hero2_surface = self.renderer.render_hero(self.game.player2, player2_is_current, player2_is_target,
+                                                  player2_rect.width, player2_rect.height)
+        self.screen.blit(hero2_surface, player2_rect.topleft)
 
     
     def draw_game_log(self):
         """Draw enhanced game log panel - FIXED position"""
-        log_width = self.log_width
-        log_height = self.HEIGHT - 40
-        log_x = self.log_x
-        log_y = 20
-        
-        # Main log panel
-        log_rect = pygame.Rect(log_x, log_y, log_width, log_height)
+        log_rect = self.layout.log_rect
+        log_x, log_y, log_width, log_height = log_rect
         
         # Background with subtle gradient
         log_surface = pygame.Surface((log_width, log_height), pygame.SRCALPHA)
@@ -600,11 +589,13 @@ class GameGUI:
     def draw_turn_indicator(self):
         """Draw turn number - positioned to NOT overlap with log"""
         turn_text = f"Turn {self.game.turn_count + 1}"
+        if self.is_computer_turn():
+            turn_text += " - Computer is thinking..."
         text_surface = self.font.render(turn_text, True, TEXT_GOLD)
         text_shadow = self.font.render(turn_text, True, BLACK)
         
         # Position at top center of game area, WELL CLEAR of log
-        center_x = self.game_area_width // 2
+        center_x = self.layout.game_area_width // 2
         text_rect = text_surface.get_rect(center=(center_x, 25))
         
         # Ornate background banner
@@ -631,16 +622,14 @@ class GameGUI:
         """Draw hero power button next to hero with authentic styling"""
         player = self.game.current_player
         
-        button_size = 85
-        button_x = self.hero_power_x
-        button_y = self.hero_power_y
-        button_rect = pygame.Rect(button_x, button_y, button_size, button_size)
+        button_rect = self.layout.hero_power_rect
+        button_x, button_y, button_size = button_rect.x, button_rect.y, button_rect.width
         
         mouse_pos = pygame.mouse.get_pos()
         hover = button_rect.collidepoint(mouse_pos)
         
         # Determine if usable
-        can_use = not player.hero_power_used and player.mana >= 2
+        can_use = self.hero_power_ready
         
         # Glow effect
         if can_use and hover:
@@ -683,71 +672,37 @@ class GameGUI:
         cost_rect = cost_text.get_rect(center=cost_bg.center)
         self.screen.blit(cost_text, cost_rect)
     
-    def draw_board(self, player, y, is_current_player):
+    def draw_board(self, player, row, is_current_player):
         minions = player.board
         
         # NO HERO DRAWING HERE - heroes are drawn separately in draw_heroes()
         # This prevents the swapping issue
         
-        if not minions:
-            return
-        
-        # Calculate minion positions - CENTER-ALIGNED across full table width
-        card_width = 247  # Same as hand cards
-        card_spacing = 15
-        
-        # Use stretched table dimensions - minions can use full width
-        table_left = self.table_actual_left
-        table_right = self.table_actual_right
-        
-        # Calculate total width of all minions
-        total_minions_width = len(minions) * card_width + (len(minions) - 1) * card_spacing
-        
-        # Center minions across the full table width
-        available_width = table_right - table_left - 100  # Full table width with margins
-        minions_start_x = table_left + 50 + (available_width - total_minions_width) // 2
-        
-        # Draw all minions in a row, centered
-        for i, minion in enumerate(minions):
-            can_attack = is_current_player and minion.can_attack and minion.attack > 0
+        # Minion slots are CENTER-ALIGNED across the full table width (see BoardLayout)
+        for i, (minion, rect) in enumerate(zip(minions, row.rects)):
+            can_attack = is_current_player and i in self.ready_minions
             selected = is_current_player and i == self.selected_minion_index
             is_target = self.targeting_mode and not is_current_player
             
             minion_surface = self.renderer.render_minion(minion, can_attack, selected, is_target)
-            x = minions_start_x + i * (card_width + card_spacing)
-            self.screen.blit(minion_surface, (x, y))
+            self.screen.blit(minion_surface, rect.topleft)
     
     def draw_hand(self):
-        hand = self.game.current_player.hand
-        if not hand:
+        if self.is_computer_turn():
+            # Keep the computer's cards hidden while it plays
             return
+        hand = self.game.current_player.hand
         
-        # Calculate card positions - 0.9x cards (247x261)
-        total_cards = len(hand)
-        card_width = 262  # 247 + 15 spacing
-        card_spacing = 15
-        total_width = (total_cards * card_width)
-        
-        # Ensure cards stay within game area (left of log panel)
-        max_width = self.game_area_width - 250
-        if total_width > max_width:
-            card_spacing = max(8, (max_width - (total_cards * 247)) // (total_cards - 1))
-            card_width = 247 + card_spacing
-            total_width = total_cards * card_width
-        
-        # Center in game area
-        start_x = (self.game_area_width - total_width) // 2
-        
-        for i, card in enumerate(hand):
+        # Card slots are centered in the game area, squeezed to stay left of the log (see BoardLayout)
+        for i, (card, rect) in enumerate(zip(hand, self.layout.hand.rects)):
             if self.dragging and i == self.selected_card_index:
                 continue
             
-            playable = card.can_play(self.game.current_player)
+            playable = i in self.playable_cards
             hover = i == self.hover_card_index
             
             card_surface = self.renderer.render_card(card, playable, False, hover)
-            x = start_x + (i * card_width)
-            y = self.hand_y
+            x, y = rect.topleft
             
             # Account for glow offset (5px added by render_card when playable/hover)
             if playable or hover:
@@ -763,8 +718,7 @@ class GameGUI:
         player = self.game.current_player
         
         # Position mana display - LARGER crystal
-        mana_x = self.mana_x
-        mana_y = self.mana_y
+        mana_x, mana_y = self.layout.mana_center
         
         # LARGER mana crystal display (0.8x size instead of 0.6x)
         crystal_size = 45  # Was 30, now bigger
@@ -796,7 +750,7 @@ class GameGUI:
         self.screen.blit(text_surface, text_rect)
         
         # Mana crystals visualization below - smaller
-        crystal_start_x = self.mana_x - 35  # Center the row of crystals
+        crystal_start_x = mana_x - 35  # Center the row of crystals
         crystal_y = mana_y + 55  # Further below
         crystal_spacing = 8  # Spacing
         
@@ -820,11 +774,7 @@ class GameGUI:
     
     def draw_end_turn_button(self):
         # End turn button (positioned to not overlap with log)
-        button_width = 120  # Updated width
-        button_height = 120  # Updated height
-        button_x = self.end_turn_x
-        button_y = self.end_turn_y
-        button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+        button_rect = self.layout.end_turn_rect
         
         mouse_pos = pygame.mouse.get_pos()
         hover = button_rect.collidepoint(mouse_pos)
@@ -861,8 +811,8 @@ class GameGUI:
         # Opponent deck (top right corner, left of log panel)
         opponent = self.game.get_opponent(self.game.current_player)
         
-        deck_x = self.deck_info_x
-        deck_y = self.deck_info_y_opponent
+        deck_x = self.layout.deck_info_x
+        deck_y = self.layout.deck_info_y_opponent
         
         # Simple panel - top right
         info_bg = pygame.Rect(deck_x, deck_y, 100, 65)
@@ -877,7 +827,7 @@ class GameGUI:
         self.screen.blit(hand_text, (deck_x + 8, deck_y + 38))
         
         # Player deck (BELOW opponent deck in top right)
-        player_deck_y = self.deck_info_y_player
+        player_deck_y = self.layout.deck_info_y_player
         
         player_info_bg = pygame.Rect(deck_x, player_deck_y, 100, 45)
         pygame.draw.rect(self.screen, BOARD_WOOD_DARK, player_info_bg, border_radius=8)
@@ -890,23 +840,11 @@ class GameGUI:
         if self.selected_minion_index is None:
             return
         
-        # Get minion position - centered layout with 0.9x cards
-        minions = self.game.current_player.board
-        card_width = 247
-        card_spacing = 15
-        # Heroes now on RIGHT side of table
-        board_right = self.game_area_width - 50
-        hero_slot_x = board_right - 247 - 20  # Right side position
-        hero_width = 247  # Same as playing cards
-        
-        # Calculate centered position
-        hero_end_x = hero_slot_x + hero_width + 30
-        available_width = self.game_area_width - hero_end_x - 50
-        total_minions_width = len(minions) * card_width + (len(minions) - 1) * card_spacing
-        minions_start_x = hero_end_x + (available_width - total_minions_width) // 2
-        
-        minion_x = minions_start_x + self.selected_minion_index * (card_width + card_spacing) + 123
-        minion_y = self.player_board_y + 130
+        # Arrow starts from the center of the selected minion's slot
+        slots = self.layout.player_board.rects
+        if self.selected_minion_index >= len(slots):
+            return
+        minion_x, minion_y = slots[self.selected_minion_index].center
         
         # Draw glowing arrow to mouse
         mouse_pos = pygame.mouse.get_pos()
@@ -1007,115 +945,34 @@ class GameGUI:
         self.screen.blit(inst_shadow, (inst_rect.x + 2, inst_rect.y + 2))
         self.screen.blit(inst_text, inst_rect)
     
-    # Helper methods for hit detection
+    # Helper methods for hit detection - all read the slot rects from BoardLayout
     def get_hand_card_at_pos(self, pos):
-        hand = self.game.current_player.hand
-        if not hand:
-            return None
-        
-        # Updated for 0.9x cards: 247x261 - TIGHT hitboxes
-        total_cards = len(hand)
-        card_width = 262  # 247 + 15 spacing
-        card_spacing = 15
-        total_width = (total_cards * card_width)
-        
-        # Ensure cards stay within game area (left of log panel)
-        max_width = self.game_area_width - 250
-        if total_width > max_width:
-            card_spacing = max(8, (max_width - (total_cards * 247)) // (total_cards - 1))
-            card_width = 247 + card_spacing
-            total_width = total_cards * card_width
-        
-        # Center in game area
-        start_x = (self.game_area_width - total_width) // 2
-        
-        for i in range(len(hand)):
-            x = start_x + (i * card_width)
-            # TIGHT hitbox - just slightly bigger than card (247x261)
-            rect = pygame.Rect(x - 5, self.hand_y - 10, 257, 281)
-            if rect.collidepoint(pos):
-                return i
-        return None
+        return self.layout.hand.index_at(pos)
     
     def get_player_minion_at_pos(self, pos):
-        minions = self.game.current_player.board
-        if not minions:
-            return None
-        
-        # Updated for centered layout with 0.9x cards - TIGHT hitboxes
-        card_width = 247
-        card_spacing = 15
-        hero_slot_x = 100  # Both heroes aligned at x=100
-        hero_width = 153  # 1.3x hero width
-        
-        # Calculate centered position
-        hero_end_x = hero_slot_x + hero_width + 30
-        available_width = self.game_area_width - hero_end_x - 50
-        total_minions_width = len(minions) * card_width + (len(minions) - 1) * card_spacing
-        minions_start_x = hero_end_x + (available_width - total_minions_width) // 2
-        
-        for i in range(len(minions)):
-            x = minions_start_x + i * (card_width + card_spacing)
-            # TIGHT hitbox - just slightly bigger than card (247x261)
-            rect = pygame.Rect(x - 5, self.player_board_y - 5, 257, 271)
-            if rect.collidepoint(pos):
-                return i
-        
-        return None
+        return self.layout.player_board.index_at(pos)
     
     def get_target_at_pos(self, pos):
         opponent = self.game.get_opponent(self.game.current_player)
         
-        # Check opponent hero - heroes sized to fit arch frames EXACTLY
-        hero_width = 220   # Match draw_heroes
-        hero_height = 260  # Match draw_heroes
-        table_center_x = self.table_actual_left + self.table_actual_width // 2
-        hero_slot_x = table_center_x - hero_width // 2  # Match draw_heroes positioning
-        hero_rect = pygame.Rect(hero_slot_x, self.opponent_hero_y, hero_width, hero_height)
-        if hero_rect.collidepoint(pos):
-            return opponent
+        # Check opponent minions first - they are drawn over the hero arch
+        index = self.layout.opponent_board.index_at(pos)
+        if index is not None:
+            return opponent.board[index]
         
-        # Check opponent minions - centered layout with TIGHT hitboxes
-        minions = opponent.board
-        if minions:
-            card_width = 247
-            card_spacing = 15
-            
-            # Use stretched table dimensions - minions use full width
-            table_left = self.table_actual_left
-            table_right = self.table_actual_right
-            
-            # Calculate centered position
-            total_minions_width = len(minions) * card_width + (len(minions) - 1) * card_spacing
-            available_width = table_right - table_left - 100
-            minions_start_x = table_left + 50 + (available_width - total_minions_width) // 2
-            
-            for i in range(len(minions)):
-                x = minions_start_x + i * (card_width + card_spacing)
-                # TIGHT hitbox - just slightly bigger than card (247x261)
-                rect = pygame.Rect(x - 5, self.opponent_board_y - 5, 257, 271)
-                if rect.collidepoint(pos):
-                    return minions[i]
+        # Check opponent hero - same rect it is drawn in
+        if self.hero_rect(opponent).collidepoint(pos):
+            return opponent
         
         return None
     
     def is_on_player_board(self, pos):
-        # RED AREA - where current player minions are played
-        # SWAPPED: Now the top tan section for player 2
-        board_rect = pygame.Rect(
-            self.table_actual_left + 80,  # Left edge with margin
-            self.player_board_y - 20,  # Start slightly above board
-            self.table_actual_width - 160,  # Width with margins
-            260 + 40  # Height to cover the red area (adjusted for hero size)
-        )
-        return board_rect.collidepoint(pos)
+        # Area where current player minions are played
+        return self.layout.board_drop_rect.collidepoint(pos)
 
     
     def is_on_target(self, pos):
         return self.get_target_at_pos(pos) is not None
     
     def is_end_turn_clicked(self, pos):
-        button_width = 120  # Updated width
-        button_height = 120  # Updated height
-        button_rect = pygame.Rect(self.end_turn_x, self.end_turn_y, button_width, button_height)
-        return button_rect.collidepoint(pos)
+        return self.layout.end_turn_rect.collidepoint(pos)
@@ -0,0 +1,161 @@
+"""
+Board Layout - Screen geometry for the game view
+Computes every slot rect once per window size and board state, so drawing,
+hit testing, the targeting arrow and the tutorial all agree
+"""
+
+import pygame
+from typing import Optional, Tuple
+
+
+class SlotRow:
+    """A row of evenly spaced card slots with O(1) hit testing"""
+
+    def __init__(self, count: int, start_x: int, y: int, stride: int,
+                 size: Tuple[int, int], hit_margin: Tuple[int, int]):
+        width, height = size
+        margin_x, margin_y = hit_margin
+        self.count = count
+        self.stride = stride
+        self.rects = [pygame.Rect(start_x + i * stride, y, width, height) for i in range(count)]
+        # Hitboxes are slightly bigger than the card
+        self.hitboxes = [rect.inflate(margin_x * 2, margin_y * 2) for rect in self.rects]
+        self._hit_left = start_x - margin_x
+        # How many earlier slots a hitbox can reach back over when cards overlap
+        self._reach = (width + margin_x * 2 - 1) // stride
+
+    def index_at(self, pos) -> Optional[int]:
+        """Index of the slot under pos, lowest index first where hitboxes overlap"""
+        if not self.count:
+            return None
+        bucket = (pos[0] - self._hit_left) // self.stride
+        for i in range(max(0, bucket - self._reach), min(bucket, self.count - 1) + 1):
+            if self.hitboxes[i].collidepoint(pos):
+                return i
+        return None
+
+
+class BoardLayout:
+    """Geometry of the game screen for one window size
+
+    Static areas (table, heroes, buttons, log) are computed in resize(); the
+    hand and board rows are rebuilt by update() only when card counts change.
+    Vertical offsets are proportions of a 1080px tall window so other sizes
+    keep the same arrangement around the table art.
+    """
+
+    CARD_SPACING = 15
+    HAND_MIN_SPACING = 8
+    LOG_WIDTH = 280
+    END_TURN_SIZE = 120
+    HERO_POWER_SIZE = 85
+
+    def __init__(self, width: int, height: int, card_size: Tuple[int, int], hero_size: Tuple[int, int]):
+        self.card_size = card_size
+        self.hero_size = hero_size
+        self.hand = SlotRow(0, 0, 0, 1, card_size, (0, 0))
+        self.player_board = SlotRow(0, 0, 0, 1, card_size, (0, 0))
+        self.opponent_board = SlotRow(0, 0, 0, 1, card_size, (0, 0))
+        self._counts = None
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int):
+        """Recompute all static areas for a new window size"""
+        self.width = width
+        self.height = height
+        card_width, card_height = self.card_size
+        hero_width, hero_height = self.hero_size
+
+        # Right side reserved for game log
+        self.log_x = width - self.LOG_WIDTH - 10
+        self.game_area_width = self.log_x - 10
+        self.log_rect = pygame.Rect(self.log_x, 20, self.LOG_WIDTH, height - 40)
+        self.center_y = height // 2
+
+        # Table: fitted between the screen edge and the log, then stretched 1.08x wide, 1.3x tall
+        board_left = 50
+        board_width = self.game_area_width - 100
+        table_height = height * 7 // 12
+        table_start_y = (height - table_height) // 2 - height // 24
+        self.fallback_table_rect = pygame.Rect(board_left, table_start_y, board_width, table_height)
+        stretched_width = int(board_width * 1.2 * 0.9)
+        stretched_height = int(table_height * 1.3)
+        self.table_rect = pygame.Rect(board_left - (stretched_width - board_width) // 2,
+                                      table_start_y - (stretched_height - table_height) // 2,
+                                      stretched_width, stretched_height)
+
+        # Heroes sit in the arch slots at the bottom and top of the table
+        arch_height = height * 13 // 54  # Arch opening: 260px at 1080
+        row_gap = height * 7 // 108      # Gap between hero and board rows: 70px at 1080
+        hero_x = self.table_rect.centerx - hero_width // 2
+        self.bottom_hero_rect = pygame.Rect(hero_x, self.table_rect.bottom - arch_height - height // 24,
+                                            hero_width, hero_height)
+        self.top_hero_rect = pygame.Rect(hero_x, self.table_rect.top + height * 11 // 216,
+                                         hero_width, hero_height)
+
+        # Minion rows: opponent's above the bottom hero, current player's below the top hero
+        self.opponent_board_y = self.bottom_hero_rect.y - arch_height - row_gap
+        self.player_board_y = self.top_hero_rect.y + arch_height + row_gap
+        self.board_drop_rect = pygame.Rect(self.table_rect.left + 80, self.player_board_y - 20,
+                                           self.table_rect.width - 160, arch_height + 40)
+
+        # Hand centered in the space below the table
+        self.hand_y = (height + self.table_rect.bottom - card_height) // 2 - 10
+
+        # Hero power, end turn and mana stacked on one vertical line near the board's right edge
+        line_x = self.game_area_width - 60
+        self.end_turn_rect = pygame.Rect(line_x - self.END_TURN_SIZE // 2,
+                                         self.center_y - self.END_TURN_SIZE // 2 - 40,
+                                         self.END_TURN_SIZE, self.END_TURN_SIZE)
+        self.hero_power_rect = pygame.Rect(line_x - self.HERO_POWER_SIZE // 2,
+                                           self.end_turn_rect.y - self.HERO_POWER_SIZE - 12,
+                                           self.HERO_POWER_SIZE, self.HERO_POWER_SIZE)
+        self.mana_center = (line_x, self.end_turn_rect.bottom + 60)
+
+        # Deck info in the top right, left of the log panel
+        self.deck_info_x = self.log_x - 120
+        self.deck_info_y_opponent = 15
+        self.deck_info_y_player = 80
+
+        # Rows depend on the new size too
+        self._counts = None
+
+    def update(self, hand_count: int, player_board_count: int, opponent_board_count: int) -> bool:
+        """Rebuild the card rows if any count changed, returns True if they were rebuilt"""
+        counts = (hand_count, player_board_count, opponent_board_count)
+        if counts == self._counts:
+            return False
+        self._counts = counts
+
+        self.hand = self._hand_row(hand_count)
+        self.player_board = self._board_row(player_board_count, self.player_board_y)
+        self.opponent_board = self._board_row(opponent_board_count, self.opponent_board_y)
+        return True
+
+    def _hand_row(self, count: int) -> SlotRow:
+        """Hand cards centered in the game area, squeezed together if they don't fit"""
+        card_width = self.card_size[0]
+        stride = card_width + self.CARD_SPACING
+        max_width = self.game_area_width - 250
+        if count > 1 and count * stride > max_width:
+            spacing = max(self.HAND_MIN_SPACING, (max_width - count * card_width) // (count - 1))
+            stride = card_width + spacing
+        start_x = (self.game_area_width - count * stride) // 2
+        return SlotRow(count, start_x, self.hand_y, stride, self.card_size, (5, 10))
+
+    def _board_row(self, count: int, y: int) -> SlotRow:
+        """Minions centered across the table"""
+        card_width = self.card_size[0]
+        stride = card_width + self.CARD_SPACING
+        total_width = count * card_width + (count - 1) * self.CARD_SPACING
+        available_width = self.table_rect.width - 100
+        start_x = self.table_rect.left + 50 + (available_width - total_width) // 2
+        return SlotRow(count, start_x, y, stride, self.card_size, (5, 5))
+
+    def hand_area(self) -> pygame.Rect:
+        """Area the hand occupies, for highlighting"""
+        return pygame.Rect(200, self.hand_y - 40, self.game_area_width - 400, self.card_size[1])
+
+    def board_area(self, y: int) -> pygame.Rect:
+        """Area of a whole minion row, for highlighting"""
+        return pygame.Rect(self.table_rect.left + 50, y - 30, self.table_rect.width - 100, self.card_size[1])
@@ -15,6 +15,17 @@ class LoadingScreen:
         self.screen = None
         self.font_large = None
         self.font_small = None
+        self.clock = None
+        
+        # Progress bar geometry
+        self.bar_width = 600
+        self.bar_height = 40
+        self.bar_x = (self.width - self.bar_width) // 2
+        self.bar_y = self.height // 2 + 20
+        
+        # Everything that doesn't change between frames, rendered once
+        self.static_layer = None
+        self.bar_fill = None
         
     def initialize(self):
         """Initialize pygame and create screen"""
@@ -23,23 +34,21 @@ class LoadingScreen:
         pygame.display.set_caption("Hearthstone - Loading...")
         self.font_large = pygame.font.Font(None, 72)
         self.font_small = pygame.font.Font(None, 36)
-        
-    def draw(self, progress: float, message: str = "Loading..."):
-        """Draw loading screen with progress bar
-        
-        Args:
-            progress: Progress value between 0.0 and 1.0
-            message: Status message to display (default: "Loading...")
-        """
-        if not self.screen:
-            return
+        self.clock = pygame.time.Clock()
+        # Fonts were just recreated, so re-render the cached layers too
+        self.static_layer = None
+        self.bar_fill = None
+    
+    def _render_static_layer(self) -> pygame.Surface:
+        """Background, title, empty progress bar and status message"""
+        layer = pygame.Surface((self.width, self.height))
         
         # Load and draw Loading Screen background image
         try:
             bg_image = pygame.image.load("Designs/Loading_Screen_Background.jpg")
             # Scale to fit screen
             bg_image = pygame.transform.scale(bg_image, (self.width, self.height))
-            self.screen.blit(bg_image, (0, 0))
+            layer.blit(bg_image, (0, 0))
         except:
             # Fallback to gradient background if image not found
             for y in range(self.height):
@@ -49,60 +58,73 @@ class LoadingScreen:
                     int(BOARD_BG_TOP[1] + (BOARD_BG_BOTTOM[1] - BOARD_BG_TOP[1]) * color_factor),
                     int(BOARD_BG_TOP[2] + (BOARD_BG_BOTTOM[2] - BOARD_BG_TOP[2]) * color_factor)
                 )
-                pygame.draw.line(self.screen, color, (0, y), (self.width, y))
+                pygame.draw.line(layer, color, (0, y), (self.width, y))
         
         # Title
         title_text = "HEARTHSTONE"
         title_surface = self.font_large.render(title_text, True, TEXT_GOLD)
         title_shadow = self.font_large.render(title_text, True, BLACK)
         title_rect = title_surface.get_rect(center=(self.width // 2, self.height // 2 - 100))
-        self.screen.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
-        self.screen.blit(title_surface, title_rect)
-        
-        # Progress bar background
-        bar_width = 600
-        bar_height = 40
-        bar_x = (self.width - bar_width) // 2
-        bar_y = self.height // 2 + 20
+        layer.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
+        layer.blit(title_surface, title_rect)
         
         # Outer frame
-        outer_rect = pygame.Rect(bar_x - 5, bar_y - 5, bar_width + 10, bar_height + 10)
-        pygame.draw.rect(self.screen, CARD_BORDER_GOLD, outer_rect, border_radius=8)
+        outer_rect = pygame.Rect(self.bar_x - 5, self.bar_y - 5, self.bar_width + 10, self.bar_height + 10)
+        pygame.draw.rect(layer, CARD_BORDER_GOLD, outer_rect, border_radius=8)
         
         # Background
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, BOARD_WOOD_DARK, bg_rect, border_radius=6)
-        
-        # Progress fill (dark purple)
-        if progress > 0:
-            fill_width = int(bar_width * min(progress, 1.0))
-            fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-            
-            # Dark purple gradient fill
-            for i in range(fill_rect.width):
-                x = bar_x + i
-                color_factor = i / bar_width
-                color = (
-                    int(80 + 40 * color_factor),   # R: 80-120
-                    int(40 + 40 * color_factor),   # G: 40-80
-                    int(120 + 60 * color_factor)   # B: 120-180 (purple)
-                )
-                pygame.draw.line(self.screen, color, (x, bar_y), (x, bar_y + bar_height))
-            
-            # Shine effect on progress bar
-            shine_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height // 3)
-            shine_surface = pygame.Surface((fill_width, bar_height // 3), pygame.SRCALPHA)
-            for i in range(bar_height // 3):
-                alpha = 100 - (i * 3)
-                pygame.draw.line(shine_surface, (150, 120, 200, alpha), (0, i), (fill_width, i))
-            self.screen.blit(shine_surface, shine_rect.topleft)
+        bg_rect = pygame.Rect(self.bar_x, self.bar_y, self.bar_width, self.bar_height)
+        pygame.draw.rect(layer, BOARD_WOOD_DARK, bg_rect, border_radius=6)
         
         # Status message - just "Loading..."
         msg_surface = self.font_small.render("Loading...", True, BUTTON_TEXT)
         msg_shadow = self.font_small.render("Loading...", True, BLACK)
-        msg_rect = msg_surface.get_rect(center=(self.width // 2, bar_y + bar_height + 50))
-        self.screen.blit(msg_shadow, (msg_rect.x + 1, msg_rect.y + 1))
-        self.screen.blit(msg_surface, msg_rect)
+        msg_rect = msg_surface.get_rect(center=(self.width // 2, self.bar_y + self.bar_height + 50))
+        layer.blit(msg_shadow, (msg_rect.x + 1, msg_rect.y + 1))
+        layer.blit(msg_surface, msg_rect)
+        return layer
+    
+    def _render_bar_fill(self) -> pygame.Surface:
+        """The full-width progress fill; frames show the left part of it"""
+        fill = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
+        
+        # Dark purple gradient fill
+        for i in range(self.bar_width):
+            color_factor = i / self.bar_width
+            color = (
+                int(80 + 40 * color_factor),   # R: 80-120
+                int(40 + 40 * color_factor),   # G: 40-80
+                int(120 + 60 * color_factor)   # B: 120-180 (purple)
+            )
+            pygame.draw.line(fill, color, (i, 0), (i, self.bar_height))
+        
+        # Shine effect on progress bar
+        shine_surface = pygame.Surface((self.bar_width, self.bar_height // 3), pygame.SRCALPHA)
+        for i in range(self.bar_height // 3):
+            alpha = 100 - (i * 3)
+            pygame.draw.line(shine_surface, (150, 120, 200, alpha), (0, i), (self.bar_width, i))
+        fill.blit(shine_surface, (0, 0))
+        return fill
+        
+    def draw(self, progress: float, message: str = "Loading..."):
+        """Draw loading screen with progress bar
+        
+        Args:
+            progress: Progress value between 0.0 and 1.0
+            message: Status message to display (default: "Loading...")
+        """
+        if not self.screen:
+            return
+        
+        if self.static_layer is None:
+            self.static_layer = self._render_static_layer()
+            self.bar_fill = self._render_bar_fill()
+        self.screen.blit(self.static_layer, (0, 0))
+        
+        # Progress fill (dark purple)
+        if progress > 0:
+            fill_width = int(self.bar_width * min(progress, 1.0))
+            self.screen.blit(self.bar_fill, (self.bar_x, self.bar_y), pygame.Rect(0, 0, fill_width, self.bar_height))
         
         pygame.display.flip()
         
@@ -112,6 +134,17 @@ class LoadingScreen:
                 pygame.quit()
                 import sys
                 sys.exit()
+    
+    def run_until(self, finished, progress, fps: int = 60):
+        """Redraw at a steady frame rate until finished() returns True
+        
+        progress() returns (fraction, message) and is polled once per frame,
+        e.g. from an AssetPipeline's progress queue.
+        """
+        while not finished():
+            fraction, message = progress()
+            self.draw(fraction, message)
+            self.clock.tick(fps)
 
 
 # Global loading screen instance
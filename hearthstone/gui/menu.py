@@ -8,6 +8,7 @@ from typing import Optional, Callable
 from .colors import *
 from .sound_manager import get_sound_manager
 from .music_manager import get_music_manager
+from ..profiler import get_profiler
 
 
 class Button:
@@ -153,6 +154,9 @@ class MainMenu:
         self.subtitle_font = pygame.font.Font(None, 48)
         self.font = pygame.font.Font(None, 36)
         
+        # Background, loaded and scaled on the first frame
+        self.background = None
+        
         # Current screen
         self.current_screen = "main"  # main, local_setup, online_setup, connecting
         
@@ -195,7 +199,8 @@ class MainMenu:
         # Local setup buttons - LARGE spacing
         self.local_buttons = [
             Button(center_x - 150, 500, 300, 60, "Start Game", self.start_local),
-            Button(center_x - 150, 590, 300, 60, "Back", self.show_main)
+            Button(center_x - 150, 590, 300, 60, "Vs Computer", self.start_vs_computer),
+            Button(center_x - 150, 680, 300, 60, "Back", self.show_main)
         ]
         
         # Online setup buttons - LARGE spacing
@@ -232,6 +237,14 @@ class MainMenu:
         self.game_params = {"player1": player1_name, "player2": player2_name}
         self.sound_manager.play('menu_close')
     
+    def start_vs_computer(self):
+        player1_name = self.player1_input.text or "Player 1"
+        
+        self.should_start_game = True
+        self.game_mode = "local"
+        self.game_params = {"player1": player1_name, "player2": "Computer", "computer": True}
+        self.sound_manager.play('menu_close')
+    
     def start_online(self):
         username = self.username_input.text or "Player"
         server = self.server_input.text or "localhost:8765"
@@ -263,8 +276,12 @@ class MainMenu:
         self.connection_status = status
         self.connection_message = message
     
-    def run(self) -> dict:
-        """Run the menu and return the selected options"""
+    def run(self, on_first_frame: Optional[Callable] = None) -> dict:
+        """Run the menu and return the selected options
+        
+        on_first_frame is called once the menu is on screen, for work that
+        shouldn't delay it (e.g. warming up game assets in the background)
+        """
         running = True
         
         while running and not self.should_start_game:
@@ -296,17 +313,21 @@ class MainMenu:
                         self.show_main()
             
             self.draw()
+            if on_first_frame is not None:
+                get_profiler().mark("first menu frame")
+                on_first_frame()
+                on_first_frame = None
             self.clock.tick(60)
         
         return {"mode": self.game_mode, "params": self.game_params}
     
-    def draw(self):
-        # Load and draw Main Menu background image
+    def _load_background(self) -> pygame.Surface:
+        """Main Menu background image scaled to the window, or a gradient"""
+        background = pygame.Surface((self.WIDTH, self.HEIGHT))
         try:
             bg_image = pygame.image.load("Designs/Main_Menu_Background.webp")
             # Scale to fit screen
-            bg_image = pygame.transform.scale(bg_image, (self.WIDTH, self.HEIGHT))
-            self.screen.blit(bg_image, (0, 0))
+            background.blit(pygame.transform.scale(bg_image, (self.WIDTH, self.HEIGHT)), (0, 0))
         except:
             # Fallback to gradient background if image not found
             for y in range(self.HEIGHT):
@@ -316,7 +337,14 @@ class MainMenu:
                     int(BOARD_BG_TOP[1] + (BOARD_BG_BOTTOM[1] - BOARD_BG_TOP[1]) * color_factor),
                     int(BOARD_BG_TOP[2] + (BOARD_BG_BOTTOM[2] - BOARD_BG_TOP[2]) * color_factor)
                 )
-                pygame.draw.line(self.screen, color, (0, y), (self.WIDTH, y))
+                pygame.draw.line(background, color, (0, y), (self.WIDTH, y))
+        return background
+    
+    def draw(self):
+        # Draw Main Menu background (decoded once, not every frame)
+        if self.background is None:
+            self.background = self._load_background()
+        self.screen.blit(self.background, (0, 0))
         
         if self.current_screen == "main":
             self.draw_main_menu()
@@ -9,13 +9,31 @@ import random
 import numpy as np
 from typing import Optional
 import math
+from .audio_cache import AudioDiskCache
+from .music_stream import MusicStream
+from .audio_service import get_audio_service
+
+
+# Procedural music is synthesized and queued in chunks of this many frames (~0.37s)
+STREAM_CHUNK_FRAMES = 8192
+
+
+def _ramp(envelope, index, begin, length, start_level, end_level):
+    """Write a linear ramp over samples begin:begin+length into the envelope
+    slice covering the given sample indices"""
+    inside = (index >= begin) & (index < begin + length)
+    if length > 1:
+        step = (end_level - start_level) / (length - 1)
+        envelope[inside] = start_level + (index[inside] - begin) * step
+    else:
+        envelope[inside] = start_level
 
 
 class MusicManager:
     """Manages background music with support for custom tracks and procedural generation"""
     
     def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        self.audio = get_audio_service()
         
         self.music_directory = "assets/music"
         self.current_track = None
@@ -33,9 +51,11 @@ class MusicManager:
         self._load_music_files()
         
         # Procedural music generation
-        self.sample_rate = 22050
-        self.procedural_menu_sound = None
-        self.procedural_game_sound = None
+        self.sample_rate = self.audio.frequency
+        self.stream: Optional[MusicStream] = None
+        
+        # Generated tracks are kept on disk so they are only synthesized once
+        self.audio_cache = AudioDiskCache("assets/.cache/audio", sample_rate=self.sample_rate)
     
     def _load_music_files(self):
         """Load music files from the assets directory"""
@@ -55,24 +75,25 @@ class MusicManager:
                     # Default to game tracks
                     self.game_tracks.append(filepath)
     
-    def _generate_tone(self, frequency, duration, volume=0.3):
-        """Generate a simple tone"""
+    def _generate_tone(self, frequency, duration, volume=0.3, start=0, stop=None):
+        """Generate a simple tone, or just samples start:stop of it"""
         samples = int(self.sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
+        index = np.arange(start, samples if stop is None else stop)
+        t = index * (duration / samples)
         
         # Generate sine wave with envelope
         wave = np.sin(2 * np.pi * frequency * t)
         
-        # Apply ADSR envelope
+        # Apply ADSR envelope (each stage is a linear ramp over its own samples)
         attack = int(samples * 0.1)
         decay = int(samples * 0.2)
         sustain_level = 0.7
         release = int(samples * 0.3)
         
-        envelope = np.ones(samples)
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[attack:attack+decay] = np.linspace(1, sustain_level, decay)
-        envelope[-release:] = np.linspace(sustain_level, 0, release)
+        envelope = np.ones(len(index))
+        _ramp(envelope, index, 0, attack, 0, 1)
+        _ramp(envelope, index, attack, decay, 1, sustain_level)
+        _ramp(envelope, index, samples - release, release, sustain_level, 0)
         
         wave = wave * envelope * volume
         
@@ -80,23 +101,22 @@ class MusicManager:
         stereo = np.column_stack((wave, wave))
         return (stereo * 32767).astype(np.int16)
     
-    def _generate_chord(self, frequencies, duration, volume=0.2):
-        """Generate a chord from multiple frequencies"""
+    def _generate_chord(self, frequencies, duration, volume=0.2, start=0, stop=None):
+        """Generate a chord from multiple frequencies, or just samples start:stop of it"""
         samples = int(self.sample_rate * duration)
-        chord = np.zeros(samples)
-        
-        for freq in frequencies:
-            t = np.linspace(0, duration, samples, False)
-            chord += np.sin(2 * np.pi * freq * t)
+        index = np.arange(start, samples if stop is None else stop)
+        t = index * (duration / samples)
         
+        # One time base shared by every note of the chord
+        chord = np.sin(2 * np.pi * np.outer(frequencies, t)).sum(axis=0)
         chord = chord / len(frequencies)  # Normalize
         
         # Apply envelope
         attack = int(samples * 0.15)
         release = int(samples * 0.3)
-        envelope = np.ones(samples)
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
+        envelope = np.ones(len(index))
+        _ramp(envelope, index, 0, attack, 0, 1)
+        _ramp(envelope, index, samples - release, release, 1, 0)
         
         chord = chord * envelope * volume
         
@@ -104,59 +124,93 @@ class MusicManager:
         stereo = np.column_stack((chord, chord))
         return (stereo * 32767).astype(np.int16)
     
-    def _generate_menu_music(self):
-        """Generate peaceful tavern-style music"""
-        print("🎵 Generating peaceful tavern music...")
-        
+    def _menu_score(self):
+        """Peaceful tavern-style music, as (generator, args) segments"""
         # Peaceful chord progression in C major (I-IV-V-I)
         # Using lower octave for warm tavern feel
-        C_major = [261.63, 329.63, 392.00]  # C-E-G
-        F_major = [349.23, 440.00, 523.25]  # F-A-C
-        G_major = [392.00, 493.88, 587.33]  # G-B-D
+        C_major = (261.63, 329.63, 392.00)  # C-E-G
+        F_major = (349.23, 440.00, 523.25)  # F-A-C
+        G_major = (392.00, 493.88, 587.33)  # G-B-D
         
         duration = 2.0  # Each chord lasts 2 seconds
         
-        # Generate chord progression
-        chord1 = self._generate_chord(C_major, duration, 0.15)
-        chord2 = self._generate_chord(F_major, duration, 0.15)
-        chord3 = self._generate_chord(G_major, duration, 0.15)
-        chord4 = self._generate_chord(C_major, duration, 0.15)
-        
-        # Combine chords
-        music = np.concatenate([chord1, chord2, chord3, chord4])
-        
-        # Create pygame Sound
-        sound = pygame.sndarray.make_sound(music)
-        return sound
+        return [('chord', (C_major, duration, 0.15)),
+                ('chord', (F_major, duration, 0.15)),
+                ('chord', (G_major, duration, 0.15)),
+                ('chord', (C_major, duration, 0.15))]
     
-    def _generate_game_music(self):
-        """Generate epic battle-style music"""
-        print("🎵 Generating epic battle music...")
-        
+    def _game_score(self):
+        """Epic battle-style music, as (generator, args) segments"""
         # Dramatic chord progression in A minor (i-iv-V-i)
         # Using power chords for epic feel
-        A_minor = [220.00, 261.63, 329.63]  # A-C-E
-        D_minor = [293.66, 349.23, 440.00]  # D-F-A
-        E_major = [329.63, 415.30, 493.88]  # E-G#-B
+        A_minor = (220.00, 261.63, 329.63)  # A-C-E
+        D_minor = (293.66, 349.23, 440.00)  # D-F-A
+        E_major = (329.63, 415.30, 493.88)  # E-G#-B
         
         duration = 1.5  # Faster tempo for battle
         
-        # Generate chord progression
-        chord1 = self._generate_chord(A_minor, duration, 0.2)
-        chord2 = self._generate_chord(D_minor, duration, 0.2)
-        chord3 = self._generate_chord(E_major, duration, 0.2)
-        chord4 = self._generate_chord(A_minor, duration, 0.2)
-        
-        # Add some rhythmic elements
-        beat_duration = 0.3
-        beat = self._generate_tone(110, beat_duration, 0.15)  # Low A for drums
+        # Add some rhythmic elements: a low A beat for drums after every chord
+        beat = ('tone', (110, 0.3, 0.15))
         
-        # Combine chords with beats
-        music = np.concatenate([chord1, beat, chord2, beat, chord3, beat, chord4, beat])
+        return [('chord', (A_minor, duration, 0.2)), beat,
+                ('chord', (D_minor, duration, 0.2)), beat,
+                ('chord', (E_major, duration, 0.2)), beat,
+                ('chord', (A_minor, duration, 0.2)), beat]
+    
+    def _render_score(self, score, chunk_frames=STREAM_CHUNK_FRAMES):
+        """Yield a score's samples a chunk at a time"""
+        generators = {'chord': self._generate_chord, 'tone': self._generate_tone}
+        for kind, args in score:
+            samples = int(self.sample_rate * args[1])
+            for start in range(0, samples, chunk_frames):
+                yield generators[kind](*args, start=start, stop=min(start + chunk_frames, samples))
+    
+    def _track_chunks(self, name, score):
+        """Chunks of a procedural track: from the audio cache if it has one, otherwise
+        synthesized, writing the first full pass to the cache as it goes"""
+        entry_path = self.audio_cache.entry_path(name, tuple(score), (self._render_score, self._generate_chord,
+                                                                      self._generate_tone, _ramp))
+        cached = self.audio_cache.load(entry_path)
+        if cached is not None:
+            for start in range(0, len(cached), STREAM_CHUNK_FRAMES):
+                yield cached[start:start + STREAM_CHUNK_FRAMES]
+            return
         
-        # Create pygame Sound
-        sound = pygame.sndarray.make_sound(music)
-        return sound
+        writer = self.audio_cache.open_writer(entry_path)
+        try:
+            for chunk in self._render_score(score):
+                if writer:
+                    writer.write(chunk)
+                yield chunk
+        except GeneratorExit:
+            # Stopped part way through: don't publish a truncated track
+            if writer:
+                writer.discard()
+            raise
+        if writer:
+            writer.commit()
+    
+    def _play_procedural(self, name, score, description):
+        """Stream a procedural track on a free channel, looping"""
+        try:
+            self._stop_stream()
+            channel = self.audio.channel('music')
+            if channel:
+                self.stream = MusicStream(channel, lambda: self._track_chunks(name, score),
+                                          chunk_frames=STREAM_CHUNK_FRAMES)
+                channel.set_volume(self.volume)
+                self.stream.start()
+                self.is_playing = True
+                print(f"🎵 Playing procedural {description} music")
+        except Exception as e:
+            print(f"⚠️ Could not generate music: {e}")
+            print("   Add custom tracks to assets/music/ for better music!")
+    
+    def _stop_stream(self):
+        """Stop the procedural music stream, if any"""
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
     
     def play_menu_music(self):
         """Play menu/tavern music"""
@@ -164,21 +218,8 @@ class MusicManager:
             track = random.choice(self.menu_tracks)
             self._play_track(track, loops=-1)
         else:
-            # Generate procedural music
-            try:
-                if self.procedural_menu_sound is None:
-                    self.procedural_menu_sound = self._generate_menu_music()
-                
-                # Play on a channel with looping
-                channel = pygame.mixer.find_channel()
-                if channel:
-                    channel.play(self.procedural_menu_sound, loops=-1)
-                    channel.set_volume(self.volume)
-                    self.is_playing = True
-                    print("🎵 Playing procedural tavern music")
-            except Exception as e:
-                print(f"⚠️ Could not generate music: {e}")
-                print("   Add custom tracks to assets/music/ for better music!")
+            # Stream procedural music
+            self._play_procedural('menu_music', self._menu_score(), "tavern")
     
     def play_game_music(self):
         """Play gameplay/battle music"""
@@ -186,21 +227,8 @@ class MusicManager:
             track = random.choice(self.game_tracks)
             self._play_track(track, loops=-1)
         else:
-            # Generate procedural music
-            try:
-                if self.procedural_game_sound is None:
-                    self.procedural_game_sound = self._generate_game_music()
-                
-                # Play on a channel with looping
-                channel = pygame.mixer.find_channel()
-                if channel:
-                    channel.play(self.procedural_game_sound, loops=-1)
-                    channel.set_volume(self.volume)
-                    self.is_playing = True
-                    print("🎵 Playing procedural battle music")
-            except Exception as e:
-                print(f"⚠️ Could not generate music: {e}")
-                print("   Add custom tracks to assets/music/ for better music!")
+            # Stream procedural music
+            self._play_procedural('game_music', self._game_score(), "battle")
     
     def _play_track(self, filepath: str, loops: int = 0):
         """Play a music track"""
@@ -217,6 +245,7 @@ class MusicManager:
     def stop(self):
         """Stop music playback"""
         pygame.mixer.music.stop()
+        self._stop_stream()
         pygame.mixer.stop()  # Stop all channels
         self.is_playing = False
         self.current_track = None
@@ -224,21 +253,30 @@ class MusicManager:
     def pause(self):
         """Pause music playback"""
         pygame.mixer.music.pause()
+        if self.stream is not None:
+            self.stream.channel.pause()
         self.is_playing = False
     
     def unpause(self):
         """Resume music playback"""
         pygame.mixer.music.unpause()
+        if self.stream is not None:
+            self.stream.channel.unpause()
         self.is_playing = True
     
     def set_volume(self, volume: float):
         """Set music volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.volume)
+        if self.stream is not None:
+            self.stream.channel.set_volume(self.volume)
     
     def fade_out(self, milliseconds: int = 1000):
         """Fade out current music"""
         pygame.mixer.music.fadeout(milliseconds)
+        if self.stream is not None:
+            self.stream.fadeout(milliseconds)
+            self.stream = None
         pygame.mixer.fadeout(milliseconds)  # Fade all channels
         self.is_playing = False
     
@@ -0,0 +1,164 @@
+"""
+Music Stream - Plays long generated tracks through a mixer channel in chunks
+A worker thread renders fixed-size chunks into a small ring buffer and queues
+them on the channel, so playback starts after one chunk and memory stays bounded
+"""
+
+import pygame
+import threading
+import time
+import numpy as np
+from typing import Callable, Iterator, Optional
+
+
+class MusicStream:
+    """Streams int16 stereo audio from a chunk source onto one mixer channel
+
+    source() returns an iterator of sample arrays of any length; the stream
+    re-blocks them into chunk_frames sized slots of the ring buffer. With
+    loop=True source() is called again whenever an iterator runs out.
+    """
+
+    def __init__(self, channel: pygame.mixer.Channel, source: Callable[[], Iterator[np.ndarray]],
+                 chunk_frames: int = 8192, buffer_chunks: int = 4, loop: bool = True):
+        self.channel = channel
+        self.source = source
+        self.chunk_frames = chunk_frames
+        self.loop = loop
+
+        # Ring buffer of rendered chunks waiting to be queued on the channel
+        self.ring = np.zeros((buffer_chunks, chunk_frames, 2), dtype=np.int16)
+        self.ring_lengths = [0] * buffer_chunks
+        self.read_slot = 0
+        self.write_slot = 0
+        self.filled = 0
+
+        self._pieces: Optional[Iterator[np.ndarray]] = None
+        self._pending: Optional[np.ndarray] = None  # Leftover of the last piece
+        self._exhausted = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fade: Optional[tuple] = None  # (start time, seconds, starting volume)
+
+        # How long the worker waits between checks: a quarter of a chunk
+        frequency = pygame.mixer.get_init()[0] if pygame.mixer.get_init() else 22050
+        self.poll_interval = chunk_frames / frequency / 4
+
+    def start(self):
+        """Render the first chunk, start it playing and hand the rest to the worker thread"""
+        self._fill_slot()
+        self.update()
+        self._thread = threading.Thread(target=self._run, name="music-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker and the channel
+
+        A worker still running after the join closes the source itself on
+        its way out: the source may be mid-chunk on that thread.
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self.channel.stop()
+        if self._thread is None or not self._thread.is_alive():
+            self._close_source()
+
+    def fadeout(self, milliseconds: int):
+        """Fade the channel volume down, then stop
+
+        The worker does the fade itself: Channel.fadeout() would let the
+        queued chunk start at full volume once the fade ends.
+        """
+        self._fade = (time.perf_counter(), max(milliseconds, 1) / 1000, self.channel.get_volume())
+
+    def _close_source(self):
+        """Let the source clean up (e.g. drop a half-written cache entry)"""
+        if self._pieces is not None:
+            self._pieces.close()
+            self._pieces = None
+
+    @property
+    def finished(self) -> bool:
+        return self._exhausted and self.filled == 0
+
+    def update(self) -> bool:
+        """Queue the next buffered chunk if the channel has room, returns True if one was queued"""
+        if not self.filled:
+            return False
+        if self.channel.get_busy() and self.channel.get_queue() is not None:
+            return False
+
+        slot = self.read_slot
+        # Sound() copies the samples, so the slot can be reused right away
+        sound = pygame.mixer.Sound(array=self.ring[slot, :self.ring_lengths[slot]])
+        if self.channel.get_busy():
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+        self.read_slot = (slot + 1) % len(self.ring)
+        self.filled -= 1
+        return True
+
+    def _run(self):
+        """Worker loop: keep the channel fed first, render ahead into free slots second"""
+        try:
+            while not self._stop.is_set() and not self.finished:
+                if self._fade is not None and self._fade_step():
+                    break
+                if self.update():
+                    continue
+                if self.filled < len(self.ring) and not self._exhausted:
+                    self._fill_slot()
+                    continue
+                self._stop.wait(self.poll_interval if self._fade is None else 0.02)
+        finally:
+            self._close_source()
+
+    def _fade_step(self) -> bool:
+        """Lower the volume along the fade, returns True once it has finished"""
+        started, seconds, volume = self._fade
+        remaining = 1 - (time.perf_counter() - started) / seconds
+        if remaining > 0:
+            self.channel.set_volume(volume * remaining)
+            return False
+        self.channel.stop()
+        self._close_source()
+        return True
+
+    def _fill_slot(self):
+        """Render the next chunk_frames samples from the source into the write slot"""
+        slot = self.ring[self.write_slot]
+        frames = 0
+        while frames < self.chunk_frames:
+            piece = self._next_piece()
+            if piece is None:
+                break
+            take = min(len(piece), self.chunk_frames - frames)
+            slot[frames:frames + take] = piece[:take]
+            self._pending = piece[take:] if take < len(piece) else None
+            frames += take
+
+        if frames:
+            self.ring_lengths[self.write_slot] = frames
+            self.write_slot = (self.write_slot + 1) % len(self.ring)
+            self.filled += 1
+
+    def _next_piece(self) -> Optional[np.ndarray]:
+        """Next array of samples from the source, restarting it when looping"""
+        if self._pending is not None:
+            return self._pending
+        restarted = False
+        while not self._exhausted:
+            if self._pieces is None:
+                self._pieces = self.source()
+            piece = next(self._pieces, None)
+            if piece is not None and len(piece):
+                return piece
+            if piece is None:
+                self._pieces = None
+                if not self.loop or restarted:
+                    # Not looping, or the source produced nothing at all
+                    self._exhausted = True
+                restarted = True
+        return None
@@ -5,57 +5,82 @@ Generates simple sound effects using pygame.mixer
 
 import pygame
 import numpy as np
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
+from .audio_cache import AudioDiskCache
+from .audio_service import get_audio_service
+
+
+# Channel category and priority of each effect; higher priority sounds cut off lower ones
+SOUND_ROUTING = {
+    'button_click': ('ui', 1),
+    'button_hover': ('ui', 0),
+    'menu_open': ('ui', 1),
+    'menu_close': ('ui', 1),
+    'error': ('ui', 2),
+    'card_play': ('cards', 1),
+    'card_draw': ('cards', 0),
+    'attack': ('combat', 1),
+    'end_turn': ('game', 1),
+    'victory': ('game', 3),
+    'defeat': ('game', 3),
+}
 
 
 class SoundManager:
     def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        self.audio = get_audio_service()
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.enabled = True
         self.volume = 0.5
         
+        # Rendered effects are kept on disk so later launches skip synthesis
+        self.audio_cache = AudioDiskCache("assets/.cache/audio", sample_rate=self.audio.frequency)
+        
         # Generate sounds
         self.generate_sounds()
     
     def generate_sounds(self):
         """Generate simple sound effects"""
-        sample_rate = 22050
+        sample_rate = self.audio.frequency
         
         # Button click sound (short beep)
-        self.sounds['button_click'] = self.generate_beep(440, 0.1, sample_rate)
+        self.sounds['button_click'] = self._cached_sound(self.generate_beep, 440, 0.1, sample_rate)
         
         # Button hover sound (soft tick)
-        self.sounds['button_hover'] = self.generate_beep(880, 0.05, sample_rate, volume=0.3)
+        self.sounds['button_hover'] = self._cached_sound(self.generate_beep, 880, 0.05, sample_rate, 0.3)
         
         # Card play sound (whoosh)
-        self.sounds['card_play'] = self.generate_whoosh(0.3, sample_rate)
+        self.sounds['card_play'] = self._cached_sound(self.generate_whoosh, 0.3, sample_rate)
         
         # Card draw sound (swish)
-        self.sounds['card_draw'] = self.generate_whoosh(0.2, sample_rate, pitch=1.5)
+        self.sounds['card_draw'] = self._cached_sound(self.generate_whoosh, 0.2, sample_rate, 1.5)
         
         # Attack sound (hit)
-        self.sounds['attack'] = self.generate_hit(0.2, sample_rate)
+        self.sounds['attack'] = self._cached_sound(self.generate_hit, 0.2, sample_rate)
         
         # Error sound (buzz)
-        self.sounds['error'] = self.generate_buzz(0.3, sample_rate)
+        self.sounds['error'] = self._cached_sound(self.generate_buzz, 0.3, sample_rate)
         
         # End turn sound (chime)
-        self.sounds['end_turn'] = self.generate_chime(0.4, sample_rate)
+        self.sounds['end_turn'] = self._cached_sound(self.generate_chime, 0.4, sample_rate)
         
         # Victory sound (fanfare)
-        self.sounds['victory'] = self.generate_fanfare(1.0, sample_rate)
+        self.sounds['victory'] = self._cached_sound(self.generate_fanfare, 1.0, sample_rate)
         
         # Defeat sound (sad)
-        self.sounds['defeat'] = self.generate_sad_tone(1.0, sample_rate)
+        self.sounds['defeat'] = self._cached_sound(self.generate_sad_tone, 1.0, sample_rate)
         
         # Menu open sound
-        self.sounds['menu_open'] = self.generate_beep(660, 0.15, sample_rate)
+        self.sounds['menu_open'] = self._cached_sound(self.generate_beep, 660, 0.15, sample_rate)
         
         # Menu close sound
-        self.sounds['menu_close'] = self.generate_beep(440, 0.15, sample_rate)
+        self.sounds['menu_close'] = self._cached_sound(self.generate_beep, 440, 0.15, sample_rate)
+    
+    def _cached_sound(self, generator: Callable[..., np.ndarray], *params) -> pygame.mixer.Sound:
+        """Build a sound from the audio cache, running the generator only on a miss"""
+        return pygame.mixer.Sound(self.audio_cache.render(generator, *params))
     
-    def generate_beep(self, frequency: float, duration: float, sample_rate: int, volume: float = 0.5) -> pygame.mixer.Sound:
+    def generate_beep(self, frequency: float, duration: float, sample_rate: int, volume: float = 0.5) -> np.ndarray:
         """Generate a simple beep tone"""
         n_samples = int(duration * sample_rate)
         t = np.linspace(0, duration, n_samples, False)
@@ -77,9 +102,9 @@ class SoundManager:
         # Create stereo
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
-    def generate_whoosh(self, duration: float, sample_rate: int, pitch: float = 1.0) -> pygame.mixer.Sound:
+    def generate_whoosh(self, duration: float, sample_rate: int, pitch: float = 1.0) -> np.ndarray:
         """Generate a whoosh sound (frequency sweep)"""
         n_samples = int(duration * sample_rate)
         t = np.linspace(0, duration, n_samples, False)
@@ -100,9 +125,9 @@ class SoundManager:
         wave = (wave * 32767).astype(np.int16)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
-    def generate_hit(self, duration: float, sample_rate: int) -> pygame.mixer.Sound:
+    def generate_hit(self, duration: float, sample_rate: int) -> np.ndarray:
         """Generate a hit/impact sound"""
         n_samples = int(duration * sample_rate)
         
@@ -117,9 +142,9 @@ class SoundManager:
         wave = (wave * 32767).astype(np.int16)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
-    def generate_buzz(self, duration: float, sample_rate: int) -> pygame.mixer.Sound:
+    def generate_buzz(self, duration: float, sample_rate: int) -> np.ndarray:
         """Generate a buzz/error sound"""
         n_samples = int(duration * sample_rate)
         t = np.linspace(0, duration, n_samples, False)
@@ -134,9 +159,9 @@ class SoundManager:
         wave = (wave * 32767).astype(np.int16)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
-    def generate_chime(self, duration: float, sample_rate: int) -> pygame.mixer.Sound:
+    def generate_chime(self, duration: float, sample_rate: int) -> np.ndarray:
         """Generate a pleasant chime sound"""
         n_samples = int(duration * sample_rate)
         t = np.linspace(0, duration, n_samples, False)
@@ -153,9 +178,9 @@ class SoundManager:
         wave = (wave * 32767).astype(np.int16)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
-    def generate_fanfare(self, duration: float, sample_rate: int) -> pygame.mixer.Sound:
+    def generate_fanfare(self, duration: float, sample_rate: int) -> np.ndarray:
         """Generate a victory fanfare"""
         n_samples = int(duration * sample_rate)
         t = np.linspace(0, duration, n_samples, False)
@@ -182,9 +207,9 @@ class SoundManager:
         wave = (wave * 32767).astype(np.int16)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
-    def generate_sad_tone(self, duration: float, sample_rate: int) -> pygame.mixer.Sound:
+    def generate_sad_tone(self, duration: float, sample_rate: int) -> np.ndarray:
         """Generate a sad/defeat sound"""
         n_samples = int(duration * sample_rate)
         t = np.linspace(0, duration, n_samples, False)
@@ -207,7 +232,7 @@ class SoundManager:
         wave = (wave * 32767).astype(np.int16)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.mixer.Sound(stereo_wave)
+        return stereo_wave
     
     def play(self, sound_name: str):
         """Play a sound effect"""
@@ -216,7 +241,8 @@ class SoundManager:
         
         sound = self.sounds[sound_name]
         sound.set_volume(self.volume)
-        sound.play()
+        category, priority = SOUND_ROUTING.get(sound_name, ('game', 0))
+        self.audio.play(sound, category, priority)
     
     def set_volume(self, volume: float):
         """Set master volume (0.0 to 1.0)"""
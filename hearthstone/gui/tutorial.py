@@ -44,6 +44,12 @@ class TutorialOverlay:
         self.skip_button = pygame.Rect(screen_width - 150, 20, 130, 50)
         self.skip_hovered = False
     
+    def resize(self, screen_width: int, screen_height: int):
+        """Follow a window resize, keeping the current step"""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.skip_button = pygame.Rect(screen_width - 150, 20, 130, 50)
+    
     def start(self):
         """Start the tutorial"""
         self.active = True
@@ -328,6 +334,7 @@ class TutorialOverlay:
 def create_tutorial_steps(gui) -> List[TutorialStep]:
     """Create all tutorial steps for the game"""
     steps = []
+    layout = gui.layout
     
     # Step 1: Welcome
     steps.append(TutorialStep(
@@ -336,32 +343,33 @@ def create_tutorial_steps(gui) -> List[TutorialStep]:
         auto_advance=False
     ))
     
-    # Step 2: Hero - FIXED for left-aligned hero slot
-    hero_slot_x = 100
-    hero_rect = pygame.Rect(hero_slot_x - 10, gui.player_board_y - 10, 138, 165)
+    # Step 2: Hero - the arch slot the player's hero is drawn in
+    player = gui.game.current_player
+    hero_rect = gui.hero_rect(player).inflate(20, 20)
     steps.append(TutorialStep(
         "Your Hero",
         "This is your hero. Your goal is to reduce your opponent's hero to 0 health while keeping yours alive. You start with 30 health.",
         highlight_area=hero_rect,
-        arrow_to=(hero_slot_x + 59, gui.player_board_y + 72)
+        arrow_to=(hero_rect.centerx, hero_rect.top + 10)
     ))
     
-    # Step 3: Mana Crystals - FIXED positioning
-    mana_rect = pygame.Rect(gui.mana_x - 10, gui.mana_y - 30, 150, 80)
+    # Step 3: Mana Crystals - crystal plus the row of pips below it
+    mana_x, mana_y = layout.mana_center
+    mana_rect = pygame.Rect(mana_x - 60, mana_y - 55, 120, 125)
     steps.append(TutorialStep(
         "Mana Crystals",
         "Mana is used to play cards. You gain 1 mana crystal each turn (max 10). Blue crystals are available, gray ones are used.",
         highlight_area=mana_rect,
-        arrow_to=(gui.mana_x + 50, gui.mana_y)
+        arrow_to=(mana_x, mana_y - 55)
     ))
     
-    # Step 4: Hand - FIXED positioning for WIDER cards (190x202) with proper margins
-    hand_rect = pygame.Rect(200, gui.hand_y - 40, gui.game_area_width - 400, 260)
+    # Step 4: Hand
+    hand_rect = layout.hand_area()
     steps.append(TutorialStep(
         "Your Hand",
         "These are your cards. You can hold up to 10 cards. The number in the blue crystal is the mana cost. Green border means you can play it.",
         highlight_area=hand_rect,
-        arrow_to=(gui.game_area_width // 2, gui.hand_y + 100)
+        arrow_to=(hand_rect.centerx, layout.hand_y + 100)
     ))
     
     # Step 5: Play a card - use same hand rect
@@ -373,13 +381,13 @@ def create_tutorial_steps(gui) -> List[TutorialStep]:
         auto_advance=True
     ))
     
-    # Step 6: Board - FIXED positioning for 0.8x SMALLER minions (171x210)
-    board_rect = pygame.Rect(100, gui.player_board_y - 30, gui.game_area_width - 200, 260)
+    # Step 6: Board - the current player's minion row
+    board_rect = layout.board_area(layout.player_board_y)
     steps.append(TutorialStep(
         "The Board",
         "Great! Your minions appear here. The yellow number is attack, red is health. You can have up to 7 minions on the board.",
         highlight_area=board_rect,
-        arrow_to=(gui.game_area_width // 2, gui.player_board_y + 105)
+        arrow_to=(board_rect.centerx, layout.player_board_y + 105)
     ))
     
     # Step 7: Minion Stats - use same board rect
@@ -396,32 +404,31 @@ def create_tutorial_steps(gui) -> List[TutorialStep]:
         highlight_area=board_rect
     ))
     
-    # Step 9: End Turn - FIXED positioning
-    end_turn_rect = pygame.Rect(gui.end_turn_x - 10, gui.end_turn_y - 10, 120, 160)
+    # Step 9: End Turn
+    end_turn_rect = layout.end_turn_rect.inflate(20, 20)
     steps.append(TutorialStep(
         "End Turn Button",
         "When you're done playing cards and attacking, click this button to end your turn. Your opponent will then take their turn.",
         highlight_area=end_turn_rect,
-        arrow_to=(gui.end_turn_x + 50, gui.end_turn_y + 70)
+        arrow_to=(end_turn_rect.centerx, end_turn_rect.top + 10)
     ))
     
-    # Step 10: Hero Power - FIXED positioning
-    hp_rect = pygame.Rect(gui.hero_power_x - 20, gui.hero_power_y - 20, 100, 100)
+    # Step 10: Hero Power
+    hp_rect = layout.hero_power_rect.inflate(30, 30)
     steps.append(TutorialStep(
         "Hero Power",
         "Each hero has a special power that costs 2 mana. You can use it once per turn. Click the HP button to activate it.",
         highlight_area=hp_rect,
-        arrow_to=(gui.hero_power_x + 40, gui.hero_power_y + 40)
+        arrow_to=(hp_rect.centerx, hp_rect.top + 10)
     ))
     
-    # Step 11: Opponent - FIXED for left-aligned opponent hero slot
-    opp_hero_slot_x = 100
-    opp_rect = pygame.Rect(opp_hero_slot_x - 10, gui.opponent_board_y - 10, 138, 165)
+    # Step 11: Opponent - the other arch slot
+    opp_rect = gui.hero_rect(gui.game.get_opponent(player)).inflate(20, 20)
     steps.append(TutorialStep(
         "Opponent's Hero",
         "This is your opponent's hero. Attack it with your minions to win! But watch out for their minions blocking the way.",
         highlight_area=opp_rect,
-        arrow_to=(opp_hero_slot_x + 59, gui.opponent_board_y + 72)
+        arrow_to=(opp_rect.centerx, opp_rect.top + 10)
     ))
     
     # Step 12: Attacking - use board rect
@@ -431,13 +438,13 @@ def create_tutorial_steps(gui) -> List[TutorialStep]:
         highlight_area=board_rect
     ))
     
-    # Step 13: Game Log - FIXED positioning
-    log_rect = pygame.Rect(gui.log_x - 10, 40, gui.log_width + 20, gui.HEIGHT - 120)
+    # Step 13: Game Log
+    log_rect = layout.log_rect.inflate(20, -80)
     steps.append(TutorialStep(
         "Game Log",
         "All game actions are recorded here. You can see what cards were played, attacks made, and other important events.",
         highlight_area=log_rect,
-        arrow_to=(gui.log_x + gui.log_width // 2, 100)
+        arrow_to=(log_rect.centerx, 100)
     ))
     
     # Step 14: Card Types
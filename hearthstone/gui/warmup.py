@@ -0,0 +1,75 @@
+"""
+Background Warm-up - Prepares game assets while the menu is on screen
+Imports the game view and loads card art on a worker thread so starting a
+game doesn't pay for them after the menu closes
+"""
+
+import importlib
+import threading
+from typing import Callable, List, Optional, Tuple
+from ..profiler import get_profiler
+
+
+class BackgroundWarmup:
+    """Runs named warm-up tasks in order on one daemon thread"""
+
+    def __init__(self):
+        self.tasks: List[Tuple[str, Callable[[], object]]] = []
+        self.current: Optional[str] = None  # Task being run, for loading screens
+        self.finished = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, task: Callable[[], object]):
+        self.tasks.append((name, task))
+
+    def start(self):
+        """Start the worker thread (once)"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+            self.thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every task has run, returns False on timeout"""
+        if self.thread is None:
+            return True
+        return self.finished.wait(timeout)
+
+    def _run(self):
+        profiler = get_profiler()
+        for name, task in self.tasks:
+            self.current = name
+            try:
+                with profiler.span(f"warm-up: {name}"):
+                    task()
+            except Exception as e:
+                # Whatever failed here is simply done again (and reported) when it's needed
+                print(f"⚠️ Warm-up step '{name}' failed: {e}")
+        self.current = None
+        self.finished.set()
+        if profiler.enabled:
+            print(profiler.report())
+
+
+def _load_card_art():
+    from .card_art_manager import get_art_manager
+    get_art_manager()
+
+
+# Global warm-up instance
+_warmup: Optional[BackgroundWarmup] = None
+
+
+def start_warmup() -> BackgroundWarmup:
+    """Start warming up the game view and its assets in the background"""
+    global _warmup
+    if _warmup is None:
+        _warmup = BackgroundWarmup()
+        _warmup.add("import game view", lambda: importlib.import_module("hearthstone.gui.game_gui"))
+        _warmup.add("load card art", _load_card_art)
+        _warmup.start()
+    return _warmup
+
+
+def get_warmup() -> Optional[BackgroundWarmup]:
+    """The running warm-up, or None if it was never started"""
+    return _warmup
@@ -0,0 +1,269 @@
+"""
+MCTS Opponent - Information set Monte Carlo tree search for the classic Game
+Worker processes each search their own determinizations of the hidden cards
+for a fixed time budget; their root statistics are merged into one move
+
+Usage:
+    python -m hearthstone.mcts [games] [budget_ms] [workers]
+"""
+
+import math
+import multiprocessing
+import os
+import pickle
+import random
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from .game import Action, Game
+from .player import Player
+from .simulation import DECKS, play_out, take_turn
+
+
+def target_key(game: Game, target) -> Optional[tuple]:
+    """A target by position rather than by object, so it means the same in every copy of a game"""
+    if target is None:
+        return None
+    if target is game.player1:
+        return ('hero', 1)
+    if target is game.player2:
+        return ('hero', 2)
+    for side, player in ((1, game.player1), (2, game.player2)):
+        for index, minion in enumerate(player.board):
+            if minion is target:
+                return (side, index)
+    return None
+
+
+def action_key(game: Game, action: Action) -> tuple:
+    """Identify an action across determinizations: cards by name, targets by position"""
+    kind, index, target = action
+    if kind == 'play':
+        index = game.current_player.hand[index].name
+    return kind, index, target_key(game, target)
+
+
+def determinize(game: Game, observer: Player, rng: random.Random):
+    """Re-deal what observer can't see: the opponent's hand and deck, and its own deck order"""
+    opponent = game.get_opponent(observer)
+    hidden = opponent.hand + opponent.deck
+    rng.shuffle(hidden)
+    count = len(opponent.hand)
+    opponent.hand[:] = hidden[:count]
+    opponent.deck[:] = hidden[count:]
+    rng.shuffle(observer.deck)
+
+
+class Node:
+    """A sequence of actions, shared by every determinization it is legal in"""
+
+    def __init__(self, parent: Optional['Node'] = None, key: Optional[tuple] = None, mover: int = 0):
+        self.parent = parent
+        self.key = key
+        self.mover = mover  # Player (1 or 2) whose action led here, 0 for the root
+        self.children: Dict[tuple, 'Node'] = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.available = 1  # Playouts in which this action was legal
+
+    def ucb(self, exploration: float) -> float:
+        return self.wins / self.visits + exploration * math.sqrt(math.log(self.available) / self.visits)
+
+
+def search(game: Game, budget: float, seed: int = 0,
+           exploration: float = 0.7) -> Tuple[Dict[tuple, Tuple[int, float]], int, int]:
+    """Single-observer ISMCTS from the current player's point of view
+
+    Runs playouts on game itself for budget seconds (rolling it back after
+    each one) and returns ({action key: (visits, wins)} for the root's
+    children, playouts, nodes created). Rollouts use the greedy simulation bot.
+    """
+    rng = random.Random(seed)
+    game.headless = True
+    observer = game.current_player
+    root_state = game.snapshot()
+    root = Node()
+    nodes = 1
+    playouts = 0
+
+    deadline = time.perf_counter() + budget
+    while playouts == 0 or time.perf_counter() < deadline:
+        game.restore(root_state)
+        determinize(game, observer, rng)
+
+        # Selection, expanding the first untried action found
+        node = root
+        while not game.game_over:
+            actions = {action_key(game, action): action for action in game.legal_actions()}
+            mover = 1 if game.current_player is game.player1 else 2
+            untried = []
+            for key in actions:
+                child = node.children.get(key)
+                if child is None:
+                    untried.append(key)
+                else:
+                    child.available += 1
+            if untried:
+                key = rng.choice(untried)
+                game.apply_action(actions[key])
+                node.children[key] = node = Node(node, key, mover)
+                nodes += 1
+                break
+            node = max((node.children[key] for key in actions), key=lambda child: child.ucb(exploration))
+            game.apply_action(actions[node.key])
+
+        play_out(game)
+        if game.winner is None:
+            winner = 0
+        else:
+            winner = 1 if game.winner is game.player1 else 2
+
+        while node is not None:
+            node.visits += 1
+            node.wins += 0.5 if winner == 0 else float(winner == node.mover)
+            node = node.parent
+        playouts += 1
+
+    game.restore(root_state)
+    stats = {key: (child.visits, child.wins) for key, child in root.children.items()}
+    return stats, playouts, nodes
+
+
+def _search_worker(data: bytes, budget: float, seed: int, exploration: float):
+    """Process pool entry point: search a pickled copy of the game"""
+    random.seed(seed)
+    return search(pickle.loads(data), budget, seed, exploration)
+
+
+def _lower_priority():
+    """Keep search workers from starving the game window on small machines"""
+    if hasattr(os, 'nice'):
+        os.nice(5)
+
+
+class MCTSBot:
+    """Computer opponent: root-parallel ISMCTS on a process pool
+
+    begin() hands a pickled copy of the game to every worker and returns at
+    once, so the pygame loop keeps drawing while the workers think; collect()
+    merges their root statistics once ready() and maps the most visited move
+    back onto the live game. choose_action() does all three and blocks.
+    """
+
+    def __init__(self, budget: float = 0.5, workers: Optional[int] = None, exploration: float = 0.7):
+        self.budget = budget
+        self.workers = workers or os.cpu_count() or 1
+        self.exploration = exploration
+        # Spawned, not forked: the game process has audio and asset threads running
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"),
+                                            initializer=_lower_priority)
+        self.pending: List[Future] = []
+        self.started = 0.0
+        self.moves = 0
+        self.last_stats: Dict[str, float] = {}
+
+    @property
+    def thinking(self) -> bool:
+        return bool(self.pending)
+
+    def begin(self, game: Game):
+        """Start searching the current position in the background"""
+        data = pickle.dumps(game)  # Copy now, the live game may change once we return
+        self.started = time.perf_counter()
+        self.pending = [self.executor.submit(_search_worker, data, self.budget,
+                                             self.moves * self.workers + i, self.exploration)
+                        for i in range(self.workers)]
+        self.moves += 1
+
+    def ready(self) -> bool:
+        return all(future.done() for future in self.pending)
+
+    def collect(self, game: Game) -> Optional[Action]:
+        """Merge the workers' results into a move for game, None if there is nothing to do"""
+        totals: Dict[tuple, List[float]] = {}
+        playouts = nodes = 0
+        for future in self.pending:
+            stats, worker_playouts, worker_nodes = future.result()
+            for key, (visits, wins) in stats.items():
+                total = totals.setdefault(key, [0, 0.0])
+                total[0] += visits
+                total[1] += wins
+            playouts += worker_playouts
+            nodes += worker_nodes
+        self.pending = []
+        elapsed = time.perf_counter() - self.started
+
+        live = {action_key(game, action): action for action in game.legal_actions()}
+        ranked = sorted(totals, key=lambda key: totals[key][0], reverse=True)
+        best = next((key for key in ranked if key in live), None)
+
+        self.last_stats = {
+            'playouts': playouts,
+            'nodes': nodes,
+            'seconds': elapsed,
+            'nodes_per_second': nodes / elapsed if elapsed else 0.0,
+            'playouts_per_second': playouts / elapsed if elapsed else 0.0,
+            'win_rate': totals[best][1] / totals[best][0] if best else 0.0,
+        }
+        if best is None:
+            return None
+        move = " ".join(str(part) for part in best if part is not None)
+        print(f"🤖 {move}: {playouts} playouts, {nodes} nodes in {elapsed * 1000:.0f} ms "
+              f"({self.last_stats['nodes_per_second']:.0f} nodes/s, "
+              f"expects {self.last_stats['win_rate'] * 100:.0f}%)")
+        return live[best]
+
+    def choose_action(self, game: Game) -> Optional[Action]:
+        """Search and return the move, blocking for about the time budget"""
+        self.begin(game)
+        wait(self.pending)
+        return self.collect(game)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main():
+    """Play the MCTS bot against the greedy simulation bot and report its win rate"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    budget = (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    bot = MCTSBot(budget, workers)
+
+    wins = 0
+    rates = []
+    for seed in range(games):
+        random.seed(seed)
+        # MCTS plays the aggro deck from both seats
+        names = ("mcts", "greedy") if seed % 2 == 0 else ("greedy", "mcts")
+        game = Game(*(Player(name, DECKS['aggro']()) for name in names), headless=True)
+        game.start_game()
+        game.play_turn()
+        while not game.game_over and game.turn_count < 100:
+            if game.current_player.name == "mcts":
+                action = bot.choose_action(game)
+                rates.append(bot.last_stats['nodes_per_second'])
+                if action is None:
+                    action = Action('end_turn')
+                game.apply_action(action)
+            else:
+                take_turn(game)
+                if not game.game_over:
+                    game.end_turn()
+                    if not game.game_over:
+                        game.play_turn()
+                        game.check_game_over()
+        won = game.winner is not None and game.winner.name == "mcts"
+        wins += won
+        print(f"Game {seed + 1}: {'MCTS' if won else 'greedy' if game.winner else 'draw'} wins in {game.turn_count + 1} turns")
+
+    bot.shutdown()
+    print(f"\n📊 MCTS won {wins}/{games} against the greedy bot "
+          f"({bot.workers} workers, {budget * 1000:.0f} ms per move, "
+          f"{sum(rates) / max(len(rates), 1):.0f} nodes/s on average)")
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,7 @@ class Minion:
         if self.divine_shield and amount > 0:
             self.divine_shield = False
             if game:
-                game.add_log(f"{self.name}'s Divine Shield absorbs the damage!")
+                game.add_log("{}'s Divine Shield absorbs the damage!", self.name)
             return False
         
         self.health -= amount
@@ -71,10 +71,10 @@ class Minion:
         # Stealth breaks when attacking
         if self.stealth:
             self.stealth = False
-            game.add_log(f"{self.name} breaks stealth!")
+            game.add_log("{} breaks stealth!", self.name)
 
         target_name = target.name if hasattr(target, 'name') else "enemy hero"
-        game.add_log(f"{self.name} attacks {target_name} for {self.attack} damage")
+        game.add_log("{} attacks {} for {} damage", self.name, target_name, self.attack)
 
         # Deal damage to target
         target.take_damage(self.attack, game)
@@ -82,19 +82,19 @@ class Minion:
         # Lifesteal
         if self.lifesteal:
             owner.heal(self.attack)
-            game.add_log(f"{self.name} heals {owner.name} for {self.attack}")
+            game.add_log("{} heals {} for {}", self.name, owner.name, self.attack)
         
         # Poisonous kills minions instantly
         if self.poisonous and isinstance(target, Minion) and not target.is_dead():
             target.health = 0
-            game.add_log(f"{self.name}'s poison destroys {target.name}!")
+            game.add_log("{}'s poison destroys {}!", self.name, target.name)
         
         # Take damage back from minions
         if isinstance(target, Minion):
             self.take_damage(target.attack, game)
             if target.poisonous and not self.is_dead():
                 self.health = 0
-                game.add_log(f"{target.name}'s poison destroys {self.name}!")
+                game.add_log("{}'s poison destroys {}!", target.name, self.name)
             if target.lifesteal:
                 enemy = game.get_opponent(owner)
                 enemy.heal(target.attack)
@@ -119,7 +119,7 @@ class Minion:
         self.deathrattle = None
         self.silenced = True
         self.max_attacks = 1
-        game.add_log(f"{self.name} is silenced!")
+        game.add_log("{} is silenced!", self.name)
 
     def buff(self, attack_buff: int, health_buff: int, game: 'Game' = None):
         """Apply a buff to the minion"""
@@ -127,7 +127,14 @@ class Minion:
         self.health += health_buff
         self.max_health += health_buff
         if game:
-            game.add_log(f"{self.name} gains +{attack_buff}/+{health_buff}")
+            game.add_log("{} gains +{}/+{}", self.name, attack_buff, health_buff)
+
+    def snapshot(self) -> dict:
+        """Copy of the minion's state for Game.snapshot()"""
+        return self.__dict__.copy()
+
+    def restore(self, state: dict):
+        self.__dict__.update(state)
 
     def __repr__(self):
         attrs = []
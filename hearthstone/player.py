@@ -32,17 +32,17 @@ class Player:
             if len(self.hand) >= 10:
                 if self.deck:
                     burned = self.deck.pop()
-                    game.add_log(f"{self.name}'s hand is full! {burned.name} burned.")
+                    game.add_log("{}'s hand is full! {} burned.", self.name, burned.name)
                 continue
                 
             if self.deck:
                 card = self.deck.pop()
                 self.hand.append(card)
-                game.add_log(f"{self.name} draws {card.name}")
+                game.add_log("{} draws {}", self.name, card.name)
             else:
                 self.fatigue_damage += 1
                 self.take_damage(self.fatigue_damage, game)
-                game.add_log(f"{self.name} takes {self.fatigue_damage} fatigue damage!")
+                game.add_log("{} takes {} fatigue damage!", self.name, self.fatigue_damage)
 
     def start_turn(self, game: 'Game'):
         self.max_mana = min(self.max_mana + 1, 10)
@@ -55,7 +55,7 @@ class Player:
             minion.refresh_attack()
         
         self.draw_card(game)
-        game.add_log(f"--- {self.name}'s turn (Mana: {self.mana}/{self.max_mana}) ---")
+        game.add_log("--- {}'s turn (Mana: {}/{}) ---", self.name, self.mana, self.max_mana)
 
     def take_damage(self, amount: int, game: 'Game' = None) -> int:
         """Returns actual damage taken after armor"""
@@ -64,7 +64,7 @@ class Player:
             self.armor -= absorbed
             amount -= absorbed
             if game and absorbed > 0:
-                game.add_log(f"{self.name}'s armor absorbs {absorbed} damage")
+                game.add_log("{}'s armor absorbs {} damage", self.name, absorbed)
         self.health -= amount
         return amount
 
@@ -76,7 +76,7 @@ class Player:
     def gain_armor(self, amount: int, game: 'Game' = None):
         self.armor += amount
         if game:
-            game.add_log(f"{self.name} gains {amount} armor")
+            game.add_log("{} gains {} armor", self.name, amount)
 
     def is_dead(self) -> bool:
         return self.health <= 0
@@ -93,7 +93,7 @@ class Player:
             if minion.deathrattle and not minion.silenced:
                 minion.deathrattle(self, game)
             self.board.remove(minion)
-            game.add_log(f"{minion.name} dies!")
+            game.add_log("{} dies!", minion.name)
 
     def get_attack_power(self) -> int:
         """Get hero's attack power (from weapon)"""
@@ -110,7 +110,7 @@ class Player:
         
         damage = self.weapon.attack
         target_name = target.name if hasattr(target, 'name') else "enemy hero"
-        game.add_log(f"{self.name} attacks {target_name} for {damage} damage")
+        game.add_log("{} attacks {} for {} damage", self.name, target_name, damage)
         
         target.take_damage(damage, game)
         
@@ -120,7 +120,7 @@ class Player:
         
         # Use weapon durability
         if self.weapon.use():
-            game.add_log(f"{self.weapon.name} breaks!")
+            game.add_log("{} breaks!", self.weapon.name)
             if self.weapon.deathrattle:
                 self.weapon.deathrattle(self, game)
             self.weapon = None
@@ -144,5 +144,23 @@ class Player:
         
         return True
 
+    def snapshot(self) -> tuple:
+        """Copy of the player's state for Game.snapshot()
+
+        Cards are shared rather than copied, playing a card never changes it.
+        """
+        durability = self.weapon.durability if self.weapon else 0
+        return self.__dict__.copy(), self.deck[:], self.hand[:], self.board[:], durability
+
+    def restore(self, state: tuple):
+        attributes, deck, hand, board, durability = state
+        self.__dict__.update(attributes)
+        # Refill the original lists so outside references to them stay valid
+        self.deck[:] = deck
+        self.hand[:] = hand
+        self.board[:] = board
+        if self.weapon:
+            self.weapon.durability = durability
+
     def __repr__(self):
         return f"{self.name} - HP: {self.health} | Armor: {self.armor} | Mana: {self.mana}/{self.max_mana}"
@@ -0,0 +1,114 @@
+"""
+Startup Profiler - Import timings and wall-clock spans for launch time
+Enable with `python main.py --profile-startup` (or HEARTHSTONE_PROFILE=1);
+prints an -X importtime style table plus named spans once startup settles
+"""
+
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+
+class StartupProfiler:
+    """Records module import times and named spans relative to launch"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.spans: List[Tuple[str, float, float, str]] = []  # (name, start, duration, thread)
+        self.imports: List[Tuple[str, float, float, int]] = []  # (module, self, cumulative, depth)
+        self._original_import = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self, imports: bool = True):
+        """Start recording; with imports=True every first-time import is timed"""
+        self.enabled = True
+        if imports and self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def disable(self):
+        """Stop recording and restore the normal import machinery"""
+        self.enabled = False
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement that times modules not imported yet"""
+        original = self._original_import
+        try:
+            package = globals.get('__package__') if level and globals else None
+            module = importlib.util.resolve_name('.' * level + name, package) if level else name
+        except (ImportError, ValueError):
+            module = name
+        if module in sys.modules or original is None:
+            return original(name, globals, locals, fromlist, level)
+
+        # Children's time is subtracted from the parent to get self time
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            with self._lock:
+                self.imports.append((module, cumulative - children, cumulative, len(stack)))
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a block of startup work"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, start, time.perf_counter() - start)
+
+    def mark(self, name: str):
+        """Record a point in time, e.g. the first frame on screen"""
+        if self.enabled:
+            self._record(name, time.perf_counter(), 0.0)
+
+    def _record(self, name: str, start: float, duration: float):
+        with self._lock:
+            self.spans.append((name, start - self.origin, duration, threading.current_thread().name))
+
+    def report(self, top: int = 15) -> str:
+        """Slowest imports and all spans as a printable table"""
+        lines = ["", "=" * 60, "STARTUP PROFILE", "=" * 60]
+        if self.imports:
+            lines.append(f"{'self [ms]':>10} | {'cumulative':>10} | module")
+            slowest = sorted(self.imports, key=lambda entry: entry[2], reverse=True)[:top]
+            for module, own, cumulative, depth in slowest:
+                lines.append(f"{own * 1000:10.1f} | {cumulative * 1000:10.1f} | {'  ' * depth}{module}")
+            lines.append("")
+        lines.append(f"{'at [ms]':>10} | {'took [ms]':>10} | span")
+        for name, start, duration, thread in sorted(self.spans, key=lambda entry: entry[1]):
+            where = "" if thread == "MainThread" else f"  [{thread}]"
+            lines.append(f"{start * 1000:10.1f} | {duration * 1000:10.1f} | {name}{where}")
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+
+# Global profiler instance
+_profiler: Optional[StartupProfiler] = None
+
+
+def get_profiler() -> StartupProfiler:
+    """Get the global startup profiler instance"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    return _profiler
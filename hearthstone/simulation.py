@@ -0,0 +1,220 @@
+"""
+Headless Simulation - AI-vs-AI games without the GUI, for balance testing
+Plays full games between two decks with a greedy bot on headless Game
+objects and spreads batches of them over worker processes
+
+Usage:
+    python -m hearthstone.simulation [games] [workers] [deck_a] [deck_b]
+"""
+
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .card import MinionCard
+from .game import Action, Game
+from .player import Player
+from .spell import SpellCard
+from . import cards_collection
+
+
+# Deck builders the runner can pit against each other, by name
+DECKS = {
+    'aggro': cards_collection.create_aggro_deck,
+    'control': cards_collection.create_control_deck,
+    'starter': cards_collection.create_starter_deck,
+    'random': cards_collection.create_random_deck,
+}
+
+# Spells the bot casts on its own side
+FRIENDLY_EFFECTS = {
+    cards_collection.holy_light_effect,
+    cards_collection.blessing_of_kings_effect,
+    cards_collection.power_word_shield_effect,
+}
+
+# Games still going after this many turns are scored as draws
+MAX_TURNS = 100
+
+
+def choose_spell_target(game: Game, spell: SpellCard):
+    """Pick a target for a spell: biggest friendly minion for buffs, else the biggest threat"""
+    player = game.current_player
+    opponent = game.get_opponent(player)
+    if spell.effect in FRIENDLY_EFFECTS:
+        if player.board:
+            return max(player.board, key=lambda m: m.attack + m.health)
+        return player if spell.target_type in ("any", "hero", "friendly") else None
+
+    enemies = [m for m in opponent.board if not m.stealth]
+    if spell.target_type in ("minion", "enemy_minion"):
+        return max(enemies, key=lambda m: m.attack, default=None)
+    return opponent
+
+
+def choose_attack_target(game: Game):
+    """Attack through the first taunt if there is one, otherwise go face"""
+    opponent = game.get_opponent(game.current_player)
+    taunts = opponent.get_taunt_minions()
+    return taunts[0] if taunts else opponent
+
+
+def choose_action(game: Game) -> Optional[Action]:
+    """The legal action the greedy bot likes best, None once only end turn is left
+
+    Cards come first, most expensive first, then the hero power, then minion
+    attacks in board order, then the hero's weapon. Targets must be the ones
+    the choose_* helpers pick; a card with no such target is held back.
+    """
+    player = game.current_player
+    opponent = game.get_opponent(player)
+    attack_target = choose_attack_target(game)
+    wanted = {}  # hand index -> target the bot wants for that card
+
+    best, best_key = None, None
+    for action in game.legal_actions():
+        kind, index, target = action
+        if kind == 'play':
+            if index not in wanted:
+                card = player.hand[index]
+                if isinstance(card, SpellCard):
+                    wanted[index] = choose_spell_target(game, card) if card.requires_target else None
+                elif isinstance(card, MinionCard) and card.battlecry:
+                    # Damage battlecries go face; buffs ignore heroes
+                    wanted[index] = opponent
+                else:
+                    wanted[index] = None
+            if target is not wanted[index]:
+                continue
+            key = (4, player.hand[index].mana_cost, -index)
+        elif kind == 'hero_power':
+            if target is not None and target is not opponent:
+                continue
+            key = (3, 0, 0)
+        elif kind == 'attack':
+            if target is not attack_target:
+                continue
+            key = (2, 0, -index)
+        elif kind == 'hero_attack':
+            if target is not attack_target:
+                continue
+            key = (1, 0, 0)
+        else:
+            continue
+        if best_key is None or key > best_key:
+            best, best_key = action, key
+    return best
+
+
+def take_turn(game: Game):
+    """Greedy bot: play the most expensive cards it can afford, then attack with everything"""
+    while not game.game_over:
+        action = choose_action(game)
+        if action is None or not game.apply_action(action):
+            break
+
+
+def play_out(game: Game, max_turns: int = MAX_TURNS):
+    """Let the greedy bot finish the game for both sides from wherever it stands"""
+    while not game.game_over and game.turn_count < max_turns:
+        take_turn(game)
+        if game.game_over:
+            break
+        game.end_turn()
+        if not game.game_over:
+            game.play_turn()
+            game.check_game_over()
+
+
+def play_game(deck_a: str, deck_b: str, seed: int, max_turns: int = MAX_TURNS) -> Tuple[Optional[str], bool, int]:
+    """Play one headless game, returns (winning deck or None for a draw, True if it went first, turns)
+
+    Even seeds let deck_a go first, odd seeds deck_b, so a batch is balanced.
+    """
+    random.seed(seed)
+    first, second = (deck_a, deck_b) if seed % 2 == 0 else (deck_b, deck_a)
+    game = Game(Player(first, DECKS[first]()), Player(second, DECKS[second]()), headless=True)
+    game.start_game()
+    game.play_turn()
+    play_out(game, max_turns)
+
+    if game.winner is None:
+        return None, False, game.turn_count + 1
+    return game.winner.name, game.winner is game.player1, game.turn_count + 1
+
+
+def _play_chunk(deck_a: str, deck_b: str, seeds: range) -> Tuple[Counter, int]:
+    """Worker: play the games for a range of seeds, returns (result counts, total turns)"""
+    results = Counter()
+    turns = 0
+    for seed in seeds:
+        winner, went_first, length = play_game(deck_a, deck_b, seed)
+        results[winner or 'draw'] += 1
+        if went_first:
+            results['first'] += 1
+        turns += length
+    return results, turns
+
+
+def run_batch(games: int, deck_a: str = 'aggro', deck_b: str = 'control',
+              workers: Optional[int] = None, seed: int = 0) -> Dict[str, float]:
+    """Play games between two decks across worker processes and summarize the results"""
+    workers = workers or os.cpu_count() or 1
+    # A few chunks per worker keeps them all busy to the end without much overhead
+    chunk = max(1, games // (workers * 4))
+    chunks: List[range] = [range(start, min(start + chunk, seed + games))
+                           for start in range(seed, seed + games, chunk)]
+
+    start = time.perf_counter()
+    results = Counter()
+    turns = 0
+    if workers == 1:
+        for seeds in chunks:
+            counts, length = _play_chunk(deck_a, deck_b, seeds)
+            results.update(counts)
+            turns += length
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_play_chunk, deck_a, deck_b, seeds) for seeds in chunks]
+            for future in futures:
+                counts, length = future.result()
+                results.update(counts)
+                turns += length
+    elapsed = time.perf_counter() - start
+
+    return {
+        'games': games,
+        'workers': workers,
+        f'{deck_a}_win_rate': results[deck_a] / games,
+        f'{deck_b}_win_rate': results[deck_b] / games,
+        'draw_rate': results['draw'] / games,
+        'first_player_win_rate': results['first'] / games,
+        'average_turns': turns / games,
+        'seconds': elapsed,
+        'games_per_second': games / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    deck_a = sys.argv[3] if len(sys.argv) > 3 else 'aggro'
+    deck_b = sys.argv[4] if len(sys.argv) > 4 else 'control'
+
+    print(f"🎲 Simulating {games} games: {deck_a} vs {deck_b}")
+    summary = run_batch(games, deck_a, deck_b, workers)
+    for key, value in summary.items():
+        if key.endswith('rate'):
+            print(f"  {key:>22}: {value * 100:6.2f}%")
+        elif isinstance(value, float):
+            print(f"  {key:>22}: {value:8.2f}")
+        else:
+            print(f"  {key:>22}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ class SpellCard(Card):
         
         owner.mana -= self.mana_cost
         self.effect(owner, game, target)
-        game.add_log(f"{owner.name} casts {self.name}")
+        game.add_log("{} casts {}", owner.name, self.name)
         return True
 
     def copy(self) -> 'SpellCard':
@@ -54,7 +54,7 @@ class WeaponCard(Card):
         owner.weapon = Weapon(self.name, self.attack, self.durability, self.deathrattle)
         owner.mana -= self.mana_cost
         
-        game.add_log(f"{owner.name} equips {self.name}")
+        game.add_log("{} equips {}", owner.name, self.name)
         
         if self.battlecry:
             self.battlecry(owner, game, target)
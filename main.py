@@ -1,19 +1,28 @@
-import pygame
+import os
 import sys
-import asyncio
-import threading
-from hearthstone.game import Game
-from hearthstone.player import Player
-from hearthstone.cards_collection import create_starter_deck, mage_hero_power, warrior_hero_power
-from hearthstone.gui import GameGUI
+from hearthstone.profiler import get_profiler
+
+# Opt-in startup profiling, enabled before anything heavy is imported
+if '--profile-startup' in sys.argv or os.environ.get('HEARTHSTONE_PROFILE'):
+    get_profiler().enable()
+
+# Only what the menu needs is imported up front; the game view, card data and
+# networking are imported when a mode is picked (or by the background warm-up)
+import pygame
 from hearthstone.gui.menu import MainMenu
 from hearthstone.gui.sound_manager import get_sound_manager
+from hearthstone.gui.audio_service import get_audio_service
+from hearthstone.gui.warmup import start_warmup
 
 
-def start_local_game(player1_name: str, player2_name: str, tutorial_mode: bool = False):
-    """Start a local game with two players"""
+def start_local_game(player1_name: str, player2_name: str, tutorial_mode: bool = False,
+                     vs_computer: bool = False):
+    """Start a local game with two players, or against the MCTS computer opponent"""
+    from hearthstone.game import Game
+    from hearthstone.player import Player
+    from hearthstone.cards_collection import create_starter_deck, mage_hero_power, warrior_hero_power
     from hearthstone.gui.loading_screen import get_loading_screen
-    from hearthstone.gui.card_art_manager import get_art_manager
+    from hearthstone.gui.asset_pipeline import get_asset_pipeline
     
     # Show loading screen
     loading_screen = get_loading_screen()
@@ -22,16 +31,10 @@ def start_local_game(player1_name: str, player2_name: str, tutorial_mode: bool =
     
     sound_manager = get_sound_manager()
     
-    # Load card art with progress updates
-    def progress_callback(progress, message):
-        loading_screen.draw(progress, message)
-    
-    # Initialize card art manager with progress callback
-    loading_screen.draw(0.1, "Loading card art...")
-    art_manager = get_art_manager()
-    art_manager.progress_callback = progress_callback
-    # Force reload to show progress
-    art_manager._load_card_art_from_cards_folder()
+    # Card art is decoded on the asset pipeline's threads, normally while the
+    # menu is still open; keep the loading screen drawing until it's all in
+    warmup = start_warmup()
+    loading_screen.run_until(warmup.finished.is_set, get_asset_pipeline().poll)
     
     loading_screen.draw(1.0, "Starting game...")
     
@@ -67,10 +70,20 @@ def start_local_game(player1_name: str, player2_name: str, tutorial_mode: bool =
     # Play game start sound
     sound_manager.play('chime')
     
+    # Computer opponent plays player 2, searching in worker processes
+    computer = None
+    if vs_computer:
+        from hearthstone.mcts import MCTSBot
+        computer = MCTSBot(budget=0.5)
+    
     # Create and run GUI
-    gui = GameGUI(game, online_mode=False, tutorial_mode=tutorial_mode)
+    from hearthstone.gui.game_gui import GameGUI
+    gui = GameGUI(game, online_mode=False, tutorial_mode=tutorial_mode, computer=computer)
     gui.run()
     
+    if computer:
+        computer.shutdown()
+    
     # Game ended, return to menu
     pygame.quit()
 
@@ -135,6 +148,7 @@ def start_server():
     try:
         from server.game_server import GameServer
         import asyncio
+        import threading
     except ImportError as e:
         print(f"\n❌ Error: Missing required module for server")
         print(f"   {str(e)}")
@@ -213,10 +227,17 @@ def start_server():
 
 def main():
     """Main entry point with graphical menu"""
+    profiler = get_profiler()
+    
+    # Start the mixer in the game's format before pygame.init() picks its defaults
+    with profiler.span("audio service"):
+        get_audio_service()
+    
     while True:
-        # Show menu
-        menu = MainMenu()
-        result = menu.run()
+        # Show menu, then warm up the game in the background while it's open
+        with profiler.span("menu setup"):
+            menu = MainMenu()
+        result = menu.run(on_first_frame=start_warmup)
         
         mode = result.get("mode")
         params = result.get("params", {})
@@ -230,7 +251,8 @@ def main():
             # Start local game
             player1 = params.get("player1", "Player 1")
             player2 = params.get("player2", "Player 2")
-            start_local_game(player1, player2, tutorial_mode=False)
+            start_local_game(player1, player2, tutorial_mode=False,
+                             vs_computer=params.get("computer", False))
             
             # After game ends, reinitialize pygame and return to menu
             pygame.init()
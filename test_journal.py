@@ -0,0 +1,366 @@
+"""
+Crash tests for the Battlegrounds match journal
+Bots play several 8-player matches through a MatchJournal in a child process
+that is killed mid-batch; every recovered match must equal a clean rerun of
+the same matches stopped at the last action recovery got back
+"""
+
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from battlegrounds.dispatch import CombatDispatcher
+from battlegrounds.game_state import MATCH_LOG_DIR, GamePhase, GameState
+from battlegrounds.hero_powers import SYLVANAS
+from battlegrounds.journal import MatchJournal, encode_record
+from battlegrounds.player import BGPlayer, Hero
+from battlegrounds.ring_buffer import RingBuffer
+
+PLAYERS = 8
+MATCHES = 6
+TICKS = 40          # More turns than any match lasts
+COMPACT_EVERY = 150  # Small, so recovery starts from compacted snapshots too
+COMBAT_LOG = 8       # Small, so combat results spill to disk and recovery must not spill them twice
+KILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+
+def new_match(match_id):
+    state = GameState(match_id=match_id)
+    state.combat_log = RingBuffer(COMBAT_LOG, state.log_path("combat_log"))
+    for seat in range(PLAYERS):
+        hero = Hero(card_id=SYLVANAS, name="Sylvanas") if seat % 2 else "Hero"
+        state.players[f"p{seat + 1}"] = BGPlayer(player_id=f"p{seat + 1}", hero=hero)
+    return state
+
+
+def bot_actions(state, rng):
+    """One recruit turn for every player still in, as clients would send it; reads the live state"""
+    for pid, player in state.players.items():
+        if player.placement is not None:
+            continue
+        for _ in range(rng.randint(2, 6)):
+            roll = rng.random()
+            offers = [o for o in player.pending_discovers if o["options"]]
+            shop = [sm for sm in player.shop if sm]
+            if offers and rng.random() < 0.7:  # Otherwise the offer may run out the clock
+                action, payload = "DISCOVER_CHOICE", {"request_id": offers[0]["request_id"],
+                                                      "card_id": rng.choice(offers[0]["options"])["card_id"]}
+            elif roll < 0.45 and shop:
+                sm = rng.choice(shop)
+                action, payload = "BUY_MINION", {"shop_slot": sm.slot, "expected_card_id": sm.card_id}
+            elif roll < 0.7 and player.hand:
+                action, payload = "PLAY_MINION", {"instance_id": rng.choice(player.hand).instance_id}
+            elif roll < 0.8 and player.board:
+                action, payload = "SELL_MINION", {"instance_id": rng.choice(player.board).instance_id}
+            elif roll < 0.9:
+                action, payload = "UPGRADE_TAVERN", {}
+            elif roll < 0.95:
+                action, payload = "HERO_POWER", {}
+            else:
+                action, payload = "FREEZE", {}
+            yield {"action": action, "player_id": pid, "payload": payload}
+        yield {"action": "READY", "player_id": pid}
+
+
+def play_turn(journal, rng, dispatcher=None):
+    """Every match plays a turn; the caller commits
+
+    With a dispatcher the rounds are fought together on it instead of one
+    RESOLVE_COMBAT per match.
+    """
+    combats = []
+    for match_id, state in list(journal.matches.items()):
+        if state.phase == GamePhase.GAME_OVER:
+            continue
+        if state.phase == GamePhase.LOBBY:
+            journal.apply(match_id, {"action": "START_MATCH"})
+            continue
+        for action in bot_actions(state, rng):
+            journal.apply(match_id, action)
+        # Offers still open at the end of the turn have timed out
+        due = state.economy.discover.due(now=float("inf"))
+        if due:
+            journal.apply(match_id, {"action": "EXPIRE_DISCOVERS", "payload": {"request_ids": due}})
+        if dispatcher is None:
+            journal.apply(match_id, {"action": "RESOLVE_COMBAT"})
+        else:
+            combats.append(match_id)
+    if combats:
+        journal.resolve_combats(combats, dispatcher)
+
+
+def start(directory, seed, prefix):
+    journal = MatchJournal(directory, COMPACT_EVERY, rng=random.Random(seed))
+    for i in range(MATCHES):
+        journal.open(new_match(f"{prefix}-{i}"))
+    return journal
+
+
+def fingerprint(state):
+    """Everything that decides how the match goes on: state, shops, pool, rngs, offers, pairings, combat results
+
+    The outbound action queue is left out: it is drained as it is sent, and
+    a restarted server sends full state instead.
+    """
+    economy, scheduler = state.economy, state.scheduler
+    return json.dumps({
+        "state": state.to_dict(),
+        "players": {pid: [repr(p), repr(list(p.death_history)), p.pending_discovers,
+                          {card_id: list(same) for card_id, same in p.copies.items()}]
+                    for pid, p in state.players.items()},
+        "economy": economy and [economy.pool.counts.tolist(), economy.pool.restocks,
+                                economy.rng.bit_generator.state, sorted(economy.discover.tables),
+                                {k: [o.player_id, [m.id for m in o.options]] for k, o in economy.discover.pending.items()}],
+        "scheduler": scheduler and [scheduler.round, scheduler.eliminated, repr(scheduler.rng.getstate()),
+                                    sorted([sorted(k), v] for k, v in scheduler.last_met.items()),
+                                    repr(scheduler.history)],
+        "pairings": repr(state.pairings),
+        "combat_log": [state.combat_log.total, state.combat_log.spilled, list(state.combat_log.replay())],
+        "round_results": state.round_results,
+        "winner": state.winner
+    }, sort_keys=True, default=repr)
+
+
+def rerun(seed, prefix, targets):
+    """Play the same matches again in a scratch journal, fingerprinting each one at its target seq"""
+    directory = tempfile.mkdtemp(prefix="journal-rerun-")
+    try:
+        journal = start(directory, seed, prefix)
+        rng = random.Random(seed + 1)
+        captured = {match_id: fingerprint(state) for match_id, state in journal.matches.items()
+                    if targets[match_id] == 0}
+        apply = journal.apply
+
+        def apply_and_capture(match_id, action):
+            accepted = apply(match_id, action)
+            if accepted and journal.seq[match_id] == targets[match_id]:
+                captured[match_id] = fingerprint(journal.matches[match_id])
+            return accepted
+
+        journal.apply = apply_and_capture
+        for _ in range(TICKS):
+            if len(captured) == len(targets):
+                break
+            play_turn(journal, rng)
+            journal.commit()
+        journal.shutdown()
+        return captured
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def writer(directory, seed, prefix, die_at_tick, die_at_write):
+    """Child process: play and commit turn after turn, reporting seqs after each commit, until killed"""
+    journal = start(directory, seed, prefix)
+    rng = random.Random(seed + 1)
+    for tick in range(TICKS):
+        play_turn(journal, rng)
+        if tick == die_at_tick:
+            print("BATCH " + json.dumps(journal.seq), flush=True)
+            real_write, writes = os.write, [0]
+
+            def dying_write(fd, data):
+                writes[0] += 1
+                if writes[0] == die_at_write:
+                    real_write(fd, bytes(data[:len(data) // 2]))  # Half a batch reaches the file
+                    os.kill(os.getpid(), KILL)
+                return real_write(fd, data)
+
+            os.write = dying_write
+        journal.commit()
+        print("COMMITTED " + json.dumps(journal.seq), flush=True)
+        time.sleep(0.01)
+    time.sleep(60)  # Wait to be killed
+
+
+def run_writer(directory, seed, prefix, die_at_tick=-1, die_at_write=0, kill_after=None):
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--writer", directory, str(seed), prefix,
+                              str(die_at_tick), str(die_at_write)], stdout=subprocess.PIPE, text=True)
+    first = ""
+    if kill_after is not None:
+        first = child.stdout.readline()  # First commit done: imports are out of the way
+        time.sleep(kill_after)
+        child.send_signal(KILL)
+    out, _ = child.communicate(timeout=120)
+    out = first + out
+    assert child.returncode != 0, "the writer should have been killed"
+    reports = {}
+    for line in out.splitlines():
+        kind, seqs = line.split(" ", 1)
+        reports[kind] = json.loads(seqs)
+    return reports
+
+
+def check_recovery(directory, seed, prefix, committed, batch=None):
+    journal = MatchJournal.recover(directory)
+    try:
+        recovered = dict(journal.seq)
+        assert sorted(recovered) == sorted(committed)
+        for match_id, seq in recovered.items():
+            assert seq >= committed[match_id], f"{match_id} lost committed actions"
+            assert batch is None or seq <= batch[match_id]
+        expected = rerun(seed, prefix, recovered)
+        for match_id, state in journal.matches.items():
+            assert fingerprint(state) == expected[match_id], f"{match_id} differs from a clean rerun at seq {recovered[match_id]}"
+        return journal, recovered
+    except Exception:
+        journal.shutdown()
+        raise
+
+
+def cleanup(prefix):
+    for name in os.listdir(MATCH_LOG_DIR) if os.path.isdir(MATCH_LOG_DIR) else []:
+        if name.startswith(prefix):
+            os.remove(os.path.join(MATCH_LOG_DIR, name))
+
+
+def test_kill_mid_batch():
+    """The writer dies with half of one match's records written and the rest of the batch not at all"""
+    directory = tempfile.mkdtemp(prefix="journal-")
+    prefix = f"kill-{os.getpid()}"
+    try:
+        reports = run_writer(directory, 7, prefix, die_at_tick=6, die_at_write=3)
+        journal, recovered = check_recovery(directory, 7, prefix, reports["COMMITTED"], reports["BATCH"])
+        journal.shutdown()
+        torn = [m for m in recovered if reports["COMMITTED"][m] < recovered[m] < reports["BATCH"][m]]
+        assert torn, "one match should come back partway through its batch"
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        cleanup(prefix)
+
+
+def test_kill_at_random_time():
+    rng = random.Random(50)
+    for trial in range(3):
+        directory = tempfile.mkdtemp(prefix="journal-")
+        prefix = f"random-{os.getpid()}-{trial}"
+        try:
+            reports = run_writer(directory, trial, prefix, kill_after=rng.uniform(0.05, 0.6))
+            journal, _ = check_recovery(directory, trial, prefix, reports["COMMITTED"])
+            journal.shutdown()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+            cleanup(prefix)
+
+
+def test_recovered_journal_carries_on():
+    """Recover in process, keep playing from the recovered journal, recover again: same as never stopping"""
+    directory = tempfile.mkdtemp(prefix="journal-")
+    prefix = f"resume-{os.getpid()}"
+    try:
+        live = start(directory, 3, prefix)
+        rng = random.Random(4)
+        for _ in range(5):
+            play_turn(live, rng)
+            live.commit()
+        # A compaction whose snapshot landed but whose log was never cut
+        match_id = next(iter(live.matches))
+        live._write_snapshot(live.matches[match_id], live.seq[match_id])
+        live.shutdown()
+        for state in live.matches.values():
+            state.close_logs()  # Recovery takes over the spill files, as after a crash
+
+        resumed = MatchJournal.recover(directory, compact_every=COMPACT_EVERY, rng=live.rng)
+        assert resumed.seq == live.seq
+        for match_id, state in resumed.matches.items():
+            assert fingerprint(state) == fingerprint(live.matches[match_id])
+        for _ in range(5):
+            play_turn(resumed, rng)
+            resumed.commit()
+        resumed.shutdown()
+        for state in resumed.matches.values():
+            state.close_logs()
+
+        again = MatchJournal.recover(directory)
+        for match_id, state in again.matches.items():
+            assert fingerprint(state) == fingerprint(resumed.matches[match_id])
+        again.shutdown()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        cleanup(prefix)
+
+
+def test_shared_dispatcher_rounds_replay():
+    """Rounds fought across matches on a shared pool replay in process to the same matches"""
+    directory = tempfile.mkdtemp(prefix="journal-")
+    prefix = f"shared-{os.getpid()}"
+    dispatcher = CombatDispatcher(workers=2)
+    try:
+        live = start(directory, 11, prefix)
+        rng = random.Random(12)
+        for _ in range(8):
+            play_turn(live, rng, dispatcher)
+            live.commit()
+        live.shutdown()
+        for state in live.matches.values():
+            state.close_logs()  # Recovery takes over the spill files, as after a crash
+        assert any(state.turn > 1 for state in live.matches.values())
+
+        recovered = MatchJournal.recover(directory)
+        assert recovered.seq == live.seq and not recovered.failed
+        for match_id, state in recovered.matches.items():
+            assert fingerprint(state) == fingerprint(live.matches[match_id])
+        recovered.shutdown()
+    finally:
+        dispatcher.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+        cleanup(prefix)
+
+
+def test_broken_match_does_not_stop_recovery():
+    """A match whose snapshot is garbage and one whose log no longer replays are reported; the rest recover"""
+    directory = tempfile.mkdtemp(prefix="journal-")
+    prefix = f"broken-{os.getpid()}"
+    try:
+        live = start(directory, 5, prefix)
+        rng = random.Random(6)
+        for _ in range(4):
+            play_turn(live, rng)
+            live.commit()
+        live.shutdown()
+        for state in live.matches.values():
+            state.close_logs()  # Recovery takes over the spill files, as after a crash
+
+        garbled, rejected = f"{prefix}-0", f"{prefix}-1"
+        with open(live.path(garbled, "snap"), "r+b") as f:
+            f.write(b"JUNK")
+        with open(live.path(rejected, "wal"), "ab") as f:
+            f.write(encode_record(live.seq[rejected] + 1, 0, {"action": "READY", "player_id": "nobody", "payload": {}}))
+
+        recovered = MatchJournal.recover(directory)
+        assert sorted(recovered.failed) == [garbled, rejected]
+        assert sorted(recovered.matches) == sorted(set(live.matches) - {garbled, rejected})
+        for match_id, state in recovered.matches.items():
+            assert fingerprint(state) == fingerprint(live.matches[match_id])
+        recovered.shutdown()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+        cleanup(prefix)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--writer":
+        directory, seed, prefix, die_at_tick, die_at_write = sys.argv[2:7]
+        writer(directory, int(seed), prefix, int(die_at_tick), int(die_at_write))
+        sys.exit(0)
+
+    print("Testing match journal...")
+    test_recovered_journal_carries_on()
+    print("✅ A recovered journal carries on exactly as if nothing had happened")
+    test_shared_dispatcher_rounds_replay()
+    print("✅ Rounds fought on a shared dispatcher replayed in process to the same matches")
+    test_broken_match_does_not_stop_recovery()
+    print("✅ Unrecoverable matches were reported without stopping the others")
+    test_kill_mid_batch()
+    print("✅ Writer killed mid-batch: every match recovered to a clean rerun, torn records dropped")
+    test_kill_at_random_time()
+    print("✅ Writer killed at random times: recovery matched a clean rerun every time")
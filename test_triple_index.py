@@ -0,0 +1,91 @@
+"""
+Property test for the Battlegrounds triple index
+Runs long random sequences of buys, sells and board/hand moves on a BGPlayer
+and checks after every step that its copies index matches a full rescan
+"""
+
+import random
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from battlegrounds.minion import BGMinion
+from battlegrounds.player import BGPlayer, ShopMinion
+
+# Few card ids so triples come up often
+CARD_IDS = ["BG_FRONT_001", "BG_FRONT_002", "BG_FRONT_003", "BG_FRONT_004"]
+SEQUENCES = 300
+STEPS = 200
+
+
+def index_view(copies):
+    return {card_id: set(same) for card_id, same in copies.items()}
+
+
+def random_minion(rng):
+    card_id = rng.choice(CARD_IDS)
+    return BGMinion(card_id=card_id, name=card_id, attack=rng.randint(1, 5), health=rng.randint(1, 5))
+
+
+def random_step(player, rng):
+    roll = rng.random()
+    if roll < 0.3:
+        player.gold = 10
+        card_id = rng.choice(CARD_IDS)
+        player.shop = [ShopMinion(slot=0, card_id=card_id, name=card_id)]
+        bought = player.buy_minion(0)
+        # A third copy hands back the golden it merged into, never a dangling copy
+        assert bought is None or any(m is bought for m in player.board + player.hand)
+    elif roll < 0.5:
+        player.add_to_hand(random_minion(rng))
+    elif roll < 0.65 and player.hand:
+        # Play a card: hand -> board
+        minion = player.remove_from_hand(rng.choice(player.hand).instance_id)
+        if not player.add_to_board(minion):
+            player.add_to_hand(minion)
+    elif roll < 0.75:
+        player.add_to_board(random_minion(rng))
+    elif roll < 0.9 and player.board:
+        player.sell_minion(rng.choice(player.board).instance_id)
+    elif player.board:
+        player.remove_from_board(rng.choice(player.board).instance_id)
+
+
+def test_index_matches_rescan():
+    rng = random.Random(41)
+    merges = 0
+    for _ in range(SEQUENCES):
+        player = BGPlayer(player_id="p1", hero="Tester")
+        for _ in range(STEPS):
+            random_step(player, rng)
+            assert index_view(player.copies) == index_view(player.scan_copies())
+            assert all(len(same) < 3 for same in player.copies.values())
+            assert len(player.board) <= 7 and len(player.hand) <= 10
+        merges += len(player.pending_discovers)
+        for offer in player.pending_discovers:
+            golden = [m for m in player.board + player.hand if m.instance_id == offer["golden_instance_id"]]
+            assert not golden or golden[0].is_golden
+    assert merges > 0
+
+
+def test_triple_merges_into_golden():
+    player = BGPlayer(player_id="p1", hero="Tester", tavern_tier=2)
+    for _ in range(2):
+        player.add_to_board(BGMinion(card_id="BG_FRONT_001", name="Alley Cat", attack=1, health=1))
+    player.add_to_hand(BGMinion(card_id="BG_FRONT_001", name="Alley Cat", attack=1, health=1))
+
+    assert not player.hand and len(player.board) == 1
+    golden = player.board[0]
+    assert golden.is_golden and (golden.attack, golden.health) == (2, 2)
+    assert player.copies == {}
+    assert player.pending_discovers[0]["tier"] == 3
+
+
+if __name__ == "__main__":
+    print("Testing triple index...")
+    test_triple_merges_into_golden()
+    print("✅ Third copy merges into a golden and queues a discover")
+    test_index_matches_rescan()
+    print(f"✅ Index matched a full rescan after {SEQUENCES * STEPS} random steps")